@@ -5,8 +5,7 @@ from alembic import context
 
 # 우리 앱의 설정 import
 from app.core.config import settings
-from app.infrastructure.database.session import Base
-from app.infrastructure.database.base import *  # 모든 모델 import
+from app.infrastructure.database.all_models import Base  # 모든 모델 import (metadata 등록)
 
 # this is the Alembic Config object
 config = context.config
@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from fastapi.responses import RedirectResponse
 from sqlalchemy.orm import Session
 from urllib.parse import urlencode
+import asyncio
 import time
 
 from app.infrastructure.database import get_db
@@ -71,8 +72,9 @@ async def google_callback(
         
         # 로그인 처리 (사용자 조회/생성 + JWT 발급)
         print(f"   3️⃣ 데이터베이스에서 사용자 조회/생성 중...")
+        # 동기 DB 조회/저장은 스레드에서 실행 (이벤트 루프를 막지 않음)
         auth_service = AuthService(db)
-        result = auth_service.oauth_login(user_info)
+        result = await asyncio.to_thread(auth_service.oauth_login, user_info)
         print(f"   ✅ 사용자 처리 완료: {result.user.email}")
         
         # OAuth 토큰 저장 (Tools 사용을 위해)
@@ -224,8 +226,9 @@ async def kakao_callback(
         user_info = await kakao_oauth.get_user_info(access_token)
         
         # 로그인 처리
+        # 동기 DB 조회/저장은 스레드에서 실행 (이벤트 루프를 막지 않음)
         auth_service = AuthService(db)
-        result = auth_service.oauth_login(user_info)
+        result = await asyncio.to_thread(auth_service.oauth_login, user_info)
         
         # 쿠키 설정 준비
         secure_cookie = not settings.DEBUG
@@ -334,8 +337,9 @@ async def naver_callback(
         user_info = await naver_oauth.get_user_info(access_token)
         
         # 로그인 처리
+        # 동기 DB 조회/저장은 스레드에서 실행 (이벤트 루프를 막지 않음)
         auth_service = AuthService(db)
-        result = auth_service.oauth_login(user_info)
+        result = await asyncio.to_thread(auth_service.oauth_login, user_info)
         
         # 쿠키 설정 준비
         secure_cookie = not settings.DEBUG
@@ -430,4 +434,4 @@ async def refresh_token(
     Refresh Token으로 새 Access Token 발급
     """
     auth_service = AuthService(db)
-    return auth_service.refresh_access_token(request.refresh_token)
+    return await asyncio.to_thread(auth_service.refresh_access_token, request.refresh_token)
@@ -12,6 +12,7 @@ from typing import List, Dict, Any, Optional
 from datetime import date
 from sqlalchemy.orm import Session
 from pathlib import Path
+import asyncio
 import os
 
 from app.domain.report.daily.fsm_state import DailyFSMContext
@@ -26,8 +27,8 @@ from app.domain.report.daily.schemas import DailyReportCreate
 from app.llm.client import get_llm
 from app.domain.report.core.schemas import CanonicalReport
 from app.infrastructure.database.session import get_db
-from app.reporting.pdf_generator.daily_report_pdf import DailyReportPDFGenerator
-from ingestion.auto_ingest import ingest_single_report
+from app.reporting.pdf_generator.process_pool import generate_daily_pdf_async
+from ingestion.auto_ingest import submit_report_ingestion
 
 
 router = APIRouter(prefix="/daily", tags=["daily"])
@@ -190,7 +191,9 @@ async def answer_daily_question(
             # 🔥 운영 DB에 저장 (PostgreSQL) - 기존 데이터 병합
             try:
                 # 기존 보고서 확인 (금일 진행 업무가 이미 저장되어 있을 수 있음)
-                existing_report = DailyReportRepository.get_by_owner_and_date(
+                # 동기 DB 조회/저장은 스레드에서 실행 (이벤트 루프를 막지 않음)
+                existing_report = await asyncio.to_thread(
+                    DailyReportRepository.get_by_owner_and_date,
                     db, report.owner, report.period_start
                 )
                 
@@ -240,7 +243,8 @@ async def answer_daily_question(
                     report_dict = merged_report.model_dump(mode='json')
                     
                     from app.domain.report.daily.schemas import DailyReportUpdate
-                    db_report = DailyReportRepository.update(
+                    db_report = await asyncio.to_thread(
+                        DailyReportRepository.update,
                         db,
                         existing_report,
                         DailyReportUpdate(report_json=report_dict)
@@ -260,7 +264,7 @@ async def answer_daily_question(
                         report_date=report.period_start,
                         report_json=report_dict
                     )
-                    db_report = DailyReportRepository.create(db, report_create)
+                    db_report = await asyncio.to_thread(DailyReportRepository.create, db, report_create)
                     
                     print(f"💾 운영 DB 생성 완료: {report.owner} - {report.period_start}")
                     is_created = True
@@ -270,8 +274,11 @@ async def answer_daily_question(
                     # PDF 생성 (파일명만 지정, 경로는 Generator가 처리)
                     pdf_filename = f"{report.owner}_{report.period_start}_일일보고서.pdf"
                     
-                    pdf_generator = DailyReportPDFGenerator()
-                    pdf_bytes = pdf_generator.generate(report, pdf_filename)
+                    # CPU 작업이므로 프로세스 풀에서 생성 (이벤트 루프를 막지 않음)
+                    pdf_bytes = await generate_daily_pdf_async(
+                        report.model_dump(mode='json'),
+                        pdf_filename
+                    )
                     
                     print(f"📄 일일 보고서 PDF 생성 완료: backend/output/report_result/daily/{pdf_filename}")
                 except Exception as pdf_error:
@@ -279,24 +286,18 @@ async def answer_daily_question(
                     import traceback
                     traceback.print_exc()
                 
-                # 🔥 벡터 DB 자동 저장 (비동기 작업, 실패해도 계속 진행)
+                # 🔥 벡터 DB 자동 저장 (백그라운드 워커에서 처리하여 응답을 지연시키지 않음, 실패해도 계속 진행)
                 try:
-                    print(f"⏳ 벡터 DB 저장 시작...")
-                    
                     # 최종 보고서 가져오기 (병합된 버전)
                     final_report_json = db_report.report_json
                     final_report = CanonicalReport(**final_report_json)
                     
-                    # 자동 인제스트 함수 호출
-                    result = ingest_single_report(
+                    # 자동 인제스트 예약 (결과 로그는 워커에서 출력)
+                    submit_report_ingestion(
                         report=final_report,
                         api_key=os.getenv("OPENAI_API_KEY")
                     )
-                    
-                    if result["success"]:
-                        print(f"✅ 벡터 DB 저장 완료: {result.get('uploaded_chunks', 0)}개 청크")
-                    else:
-                        print(f"⚠️  벡터 DB 저장 실패: {result.get('message', 'Unknown error')}")
+                    print(f"⏳ 벡터 DB 저장 예약 완료 (백그라운드 처리)")
                 
                 except Exception as vector_error:
                     print(f"⚠️  벡터 DB 저장 실패 (보고서는 저장됨): {str(vector_error)}")
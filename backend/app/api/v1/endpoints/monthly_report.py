@@ -13,7 +13,7 @@ from sqlalchemy.orm import Session
 from pathlib import Path
 import os
 
-from app.domain.report.monthly.chain import generate_monthly_report
+from app.domain.report.monthly.chain import generate_monthly_report_async
 from app.domain.report.monthly.repository import MonthlyReportRepository
 from app.domain.report.monthly.schemas import MonthlyReportCreate, MonthlyReportResponse, MonthlyReportListResponse
 from app.domain.report.core.schemas import CanonicalReport
@@ -53,7 +53,7 @@ async def generate_monthly(
         target_date = date(request.year, request.month, 1)
         
         # 1. 월간 보고서 생성
-        report = generate_monthly_report(
+        report = await generate_monthly_report_async(
             db=db,
             owner=request.owner,
             target_date=target_date
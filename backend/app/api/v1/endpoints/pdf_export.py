@@ -28,7 +28,7 @@ async def export_daily_pdf(
     - **report_date**: 보고서 날짜 (YYYY-MM-DD)
     """
     try:
-        pdf_bytes = ReportExportService.export_daily_pdf(
+        pdf_bytes = await ReportExportService.export_daily_pdf_async(
             db=db,
             owner=owner,
             report_date=report_date
@@ -13,10 +13,9 @@ from sqlalchemy.orm import Session
 from app.domain.report.planner.schemas import TodayPlanRequest, TodayPlanResponse
 from app.domain.report.planner.today_plan_chain import TodayPlanGenerator
 from app.domain.report.planner.tools import YesterdayReportTool
-from app.domain.report.search.retriever import UnifiedRetriever
+from app.domain.report.search.retriever import get_report_retriever
 from app.infrastructure.database.session import get_db
 from app.llm.client import get_llm
-from app.core.config import settings
 
 
 router = APIRouter(prefix="/plan", tags=["plan"])
@@ -30,21 +29,8 @@ def get_today_plan_generator(db: Session = Depends(get_db)) -> TodayPlanGenerato
     # VectorDB에서 유사 업무 패턴 검색 (선택적)
     vector_retriever = None
     try:
-        # reports 컬렉션 사용 (로컬 ChromaDB)
-        from app.infrastructure.vector_store_report import get_report_vector_store
-        vector_store = get_report_vector_store()
-        collection = vector_store.get_collection()
-        
-        import os
-        embedding_model_type = os.getenv("REPORT_EMBEDDING_MODEL_TYPE", "hf")
-        vector_retriever = UnifiedRetriever(
-            collection=collection,
-            openai_api_key=settings.OPENAI_API_KEY,
-            embedding_model_type=embedding_model_type
-        )
-        
-        doc_count = collection.count()
-        print(f"✅ VectorDB 초기화 완료: reports 컬렉션 ({doc_count}개 문서)")
+        # reports 컬렉션 사용 (로컬 ChromaDB), 프로세스 내 공유 retriever 재사용
+        vector_retriever = get_report_retriever()
     except Exception as e:
         print(f"[WARNING] VectorDB 초기화 실패 (플래닝 기능 제한): {e}")
         import traceback
@@ -9,11 +9,12 @@ Created: 2025-11-19
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel, Field
 from datetime import date
+from typing import List, Optional
 from sqlalchemy.orm import Session
 from pathlib import Path
 import os
 
-from app.domain.report.weekly.chain import generate_weekly_report
+from app.domain.report.weekly.chain import generate_weekly_report_async, generate_weekly_reports
 from app.domain.report.weekly.repository import WeeklyReportRepository
 from app.domain.report.weekly.schemas import WeeklyReportCreate, WeeklyReportResponse, WeeklyReportListResponse
 from app.domain.report.core.schemas import CanonicalReport
@@ -37,6 +38,67 @@ class WeeklyReportGenerateResponse(BaseModel):
     report: CanonicalReport
 
 
+class WeeklyReportBatchGenerateRequest(BaseModel):
+    """주간 보고서 일괄 생성 요청"""
+    owners: List[str] = Field(..., min_length=1, description="작성자 목록")
+    target_date: date = Field(..., description="기준 날짜 (해당 주의 아무 날짜)")
+
+
+class WeeklyReportBatchItem(BaseModel):
+    """주간 보고서 일괄 생성 결과 (작성자별)"""
+    owner: str
+    success: bool
+    message: str
+    report: Optional[CanonicalReport] = None
+
+
+class WeeklyReportBatchGenerateResponse(BaseModel):
+    """주간 보고서 일괄 생성 응답"""
+    total: int
+    succeeded: int
+    results: List[WeeklyReportBatchItem]
+
+
+def _save_weekly_report(db: Session, report: CanonicalReport) -> str:
+    """
+    생성된 주간 보고서를 DB에 저장하고 PDF 생성
+    
+    Returns:
+        "생성" 또는 "업데이트"
+    """
+    # DB에 저장
+    report_dict = report.model_dump(mode='json')
+    report_create = WeeklyReportCreate(
+        owner=report.owner,
+        period_start=report.period_start,
+        period_end=report.period_end,
+        report_json=report_dict
+    )
+    
+    db_report, is_created = WeeklyReportRepository.create_or_update(
+        db, report_create
+    )
+    
+    action = "생성" if is_created else "업데이트"
+    print(f"💾 주간 보고서 저장 완료 ({action}): {report.owner} - {report.period_start}~{report.period_end}")
+    
+    # 🔥 PDF 자동 생성 및 저장
+    try:
+        # PDF 생성 (파일명만 지정, 경로는 Generator가 처리)
+        pdf_filename = f"{report.owner}_{report.period_start}_{report.period_end}_주간보고서.pdf"
+        
+        pdf_generator = WeeklyReportPDFGenerator()
+        pdf_bytes = pdf_generator.generate(report, pdf_filename)
+        
+        print(f"📄 주간 보고서 PDF 생성 완료: backend/output/report_result/weekly/{pdf_filename}")
+    except Exception as pdf_error:
+        print(f"⚠️  PDF 생성 실패 (보고서는 저장됨): {str(pdf_error)}")
+        import traceback
+        traceback.print_exc()
+    
+    return action
+
+
 @router.post("/generate", response_model=WeeklyReportGenerateResponse)
 async def generate_weekly(
     request: WeeklyReportGenerateRequest,
@@ -48,42 +110,15 @@ async def generate_weekly(
     target_date가 속한 주의 월~금 일일보고서를 집계하여 주간 보고서를 생성하고 DB에 저장합니다.
     """
     try:
-        # 1. 주간 보고서 생성
-        report = generate_weekly_report(
+        # 1. 주간 보고서 생성 (검색/LLM 호출 동안 이벤트 루프를 막지 않도록 비동기 버전 사용)
+        report = await generate_weekly_report_async(
             db=db,
             owner=request.owner,
             target_date=request.target_date
         )
         
-        # 2. DB에 저장
-        report_dict = report.model_dump(mode='json')
-        report_create = WeeklyReportCreate(
-            owner=report.owner,
-            period_start=report.period_start,
-            period_end=report.period_end,
-            report_json=report_dict
-        )
-        
-        db_report, is_created = WeeklyReportRepository.create_or_update(
-            db, report_create
-        )
-        
-        action = "생성" if is_created else "업데이트"
-        print(f"💾 주간 보고서 저장 완료 ({action}): {report.owner} - {report.period_start}~{report.period_end}")
-        
-        # 🔥 3. PDF 자동 생성 및 저장
-        try:
-            # PDF 생성 (파일명만 지정, 경로는 Generator가 처리)
-            pdf_filename = f"{report.owner}_{report.period_start}_{report.period_end}_주간보고서.pdf"
-            
-            pdf_generator = WeeklyReportPDFGenerator()
-            pdf_bytes = pdf_generator.generate(report, pdf_filename)
-            
-            print(f"📄 주간 보고서 PDF 생성 완료: backend/output/report_result/weekly/{pdf_filename}")
-        except Exception as pdf_error:
-            print(f"⚠️  PDF 생성 실패 (보고서는 저장됨): {str(pdf_error)}")
-            import traceback
-            traceback.print_exc()
+        # 2. DB 저장 및 3. PDF 생성
+        action = _save_weekly_report(db, report)
         
         return WeeklyReportGenerateResponse(
             success=True,
@@ -97,6 +132,57 @@ async def generate_weekly(
         raise HTTPException(status_code=500, detail=f"주간 보고서 생성 실패: {str(e)}")
 
 
+@router.post("/generate/batch", response_model=WeeklyReportBatchGenerateResponse)
+async def generate_weekly_batch(
+    request: WeeklyReportBatchGenerateRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    여러 작성자의 주간 보고서 일괄 생성
+    
+    보고서 생성(검색 + LLM)은 동시에 수행하고, DB 저장은 순서대로 수행합니다.
+    한 작성자의 생성/저장 실패가 다른 작성자에게 영향을 주지 않습니다 (저장 실패 시 롤백 후 계속).
+    """
+    reports = await generate_weekly_reports(
+        db=db,
+        owners=request.owners,
+        target_date=request.target_date
+    )
+    
+    results: List[WeeklyReportBatchItem] = []
+    for owner, report in zip(request.owners, reports):
+        if isinstance(report, Exception):
+            results.append(WeeklyReportBatchItem(
+                owner=owner,
+                success=False,
+                message=f"주간 보고서 생성 실패: {str(report)}"
+            ))
+            continue
+        
+        try:
+            action = _save_weekly_report(db, report)
+            results.append(WeeklyReportBatchItem(
+                owner=owner,
+                success=True,
+                message=f"주간 보고서가 {action}되었습니다.",
+                report=report
+            ))
+        except Exception as e:
+            # 실패한 트랜잭션을 되돌려야 같은 세션으로 다음 작성자를 저장할 수 있음
+            db.rollback()
+            results.append(WeeklyReportBatchItem(
+                owner=owner,
+                success=False,
+                message=f"주간 보고서 저장 실패: {str(e)}"
+            ))
+    
+    return WeeklyReportBatchGenerateResponse(
+        total=len(results),
+        succeeded=sum(1 for item in results if item.success),
+        results=results
+    )
+
+
 @router.get("/list/{owner}", response_model=WeeklyReportListResponse)
 async def list_weekly_reports(
     owner: str,
@@ -15,6 +15,10 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 20          # 커넥션 풀 크기
+    DB_MAX_OVERFLOW: int = 10       # 풀 초과 시 추가 연결 수
+    DB_POOL_TIMEOUT: int = 30       # 풀에서 연결을 기다리는 최대 시간 (초)
+    DB_POOL_RECYCLE: int = 1800     # 연결 재생성 주기 (초, DB 측 idle 종료 대비)
     
     # JWT
     SECRET_KEY: str
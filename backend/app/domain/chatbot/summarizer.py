@@ -12,6 +12,48 @@ from typing import List
 from openai import OpenAI
 
 
+# 요약 지시문의 고정 부분은 호출마다 새로 만들지 않도록 모듈 상수로 둠
+# (대화 내역 앞부분이 항상 동일하므로 OpenAI 자동 프롬프트 캐싱에도 유리)
+_SUMMARY_PROMPT_HEAD = """당신은 대화 내용을 구조화하여 요약하는 전문가입니다.
+
+다음 대화를 분석하여 **미래에 참고할 중요한 정보**를 추출하세요.
+
+# 요약 기준
+1. **사용자 정보**: 이름, 직급, 선호 스타일 등 (언급된 경우만)
+2. **핵심 질문**: 사용자가 물어본 중요한 내용 (재질문 가능성이 높은 것)
+3. **사실 정보**: 규정, 설명, 구체적 답변
+4. **대화 맥락**: 사용자의 관심사, 대화 흐름
+5. **제외 대상**: 단순 인사, 의미 없는 잡담
+
+# 출력 형식 (Markdown, 간결하게)
+```markdown
+## 사용자 정보
+- 이름: [추출 or 없음]
+- 특징: [직급/역할/특성 or 없음]
+
+## 주요 질문 및 답변
+1. [주제] (대화 번호)
+   - 질문: [1-2문장 요약]
+   - 답변: [핵심만 1-2문장]
+
+(3개 이내로 가장 중요한 것만)
+
+## 대화 맥락
+- [사용자 관심사/패턴 2-3문장]
+
+## 키워드
+[관련 키워드 5개 이내]
+```
+
+# 대화 내역
+"""
+
+_SUMMARY_PROMPT_TAIL = """
+
+**중요:** 단순 인사나 의미 없는 내용은 생략하고, **나중에 참고할 가치가 있는 정보만** 포함하세요.
+요약은 200 토큰 이내로 간결하게 작성하세요."""
+
+
 class Summarizer:
     """
     대화 요약 생성기
@@ -73,42 +115,7 @@ class Summarizer:
     
     def _get_summary_prompt(self, conversation_text: str) -> str:
         """요약 생성 프롬프트"""
-        return f"""당신은 대화 내용을 구조화하여 요약하는 전문가입니다.
-
-다음 대화를 분석하여 **미래에 참고할 중요한 정보**를 추출하세요.
-
-# 요약 기준
-1. **사용자 정보**: 이름, 직급, 선호 스타일 등 (언급된 경우만)
-2. **핵심 질문**: 사용자가 물어본 중요한 내용 (재질문 가능성이 높은 것)
-3. **사실 정보**: 규정, 설명, 구체적 답변
-4. **대화 맥락**: 사용자의 관심사, 대화 흐름
-5. **제외 대상**: 단순 인사, 의미 없는 잡담
-
-# 출력 형식 (Markdown, 간결하게)
-```markdown
-## 사용자 정보
-- 이름: [추출 or 없음]
-- 특징: [직급/역할/특성 or 없음]
-
-## 주요 질문 및 답변
-1. [주제] (대화 번호)
-   - 질문: [1-2문장 요약]
-   - 답변: [핵심만 1-2문장]
-
-(3개 이내로 가장 중요한 것만)
-
-## 대화 맥락
-- [사용자 관심사/패턴 2-3문장]
-
-## 키워드
-[관련 키워드 5개 이내]
-```
-
-# 대화 내역
-{conversation_text}
-
-**중요:** 단순 인사나 의미 없는 내용은 생략하고, **나중에 참고할 가치가 있는 정보만** 포함하세요.
-요약은 200 토큰 이내로 간결하게 작성하세요."""
+        return f"{_SUMMARY_PROMPT_HEAD}{conversation_text}{_SUMMARY_PROMPT_TAIL}"
     
     def update_summary(self, existing_summary: str, new_messages: List[dict]) -> str:
         """
@@ -81,6 +81,8 @@ def chunk_daily_report(
     daily = canonical.daily
     report_date = canonical.period_start if canonical.period_start else date.today()
     date_str = report_date.isoformat()
+    # 정수형 날짜 (YYYYMMDD): Chroma는 문자열에 $gte/$lte를 지원하지 않으므로 기간 검색용
+    date_num = int(report_date.strftime("%Y%m%d"))
     
     # ISO week number 계산
     iso_calendar = report_date.isocalendar()
@@ -98,6 +100,7 @@ def chunk_daily_report(
         
         metadata_summary = {
             "date": date_str,
+            "date_num": date_num,
             "level": "daily",
             "chunk_type": "summary",
             "week": week_str,
@@ -143,6 +146,7 @@ def chunk_daily_report(
         
         metadata_detail = {
             "date": date_str,
+            "date_num": date_num,
             "level": "daily",
             "chunk_type": "detail",
             "week": week_str,
@@ -173,6 +177,7 @@ def chunk_daily_report(
         
         metadata_pending = {
             "date": date_str,
+            "date_num": date_num,
             "level": "daily",
             "chunk_type": "pending",
             "week": week_str,
@@ -207,6 +212,7 @@ def chunk_daily_report(
         
         metadata_plan = {
             "date": date_str,
+            "date_num": date_num,
             "level": "daily",
             "chunk_type": "plan_note",
             "week": week_str,
@@ -4,13 +4,19 @@ RAG Chain for Daily Report Chatbot
 일일보고서 데이터를 기반으로 한 RAG 챗봇 체인
 날짜 필터링을 검색 이전 단계에서 강제하고, 통계형 질의는 별도 로직으로 처리
 """
-from typing import List, Optional, Dict, Any, Set
+from typing import List, Optional, Dict, Any
 from datetime import date, datetime, timedelta
 from collections import Counter
+import logging
+from dataclasses import replace
 import re
 
 from app.infrastructure.vector_store_report import get_report_vector_store
-from app.domain.report.search.retriever import UnifiedRetriever, UnifiedSearchResult
+from app.domain.report.search.retriever import (
+    UnifiedRetriever,
+    UnifiedSearchResult,
+    get_report_retriever,
+)
 from app.domain.report.core.utils_text import extract_customer_names
 from app.domain.report.search.hybrid_search import (
     QueryAnalyzer,
@@ -19,6 +25,32 @@ from app.domain.report.search.hybrid_search import (
 )
 from app.llm.client import LLMClient
 
+logger = logging.getLogger(__name__)
+
+
+# 시스템 프롬프트는 호출마다 바이트 단위로 동일하게 유지해야
+# OpenAI 자동 프롬프트 캐싱(공통 prefix KV 재사용)이 적중하므로 모듈 상수로 고정
+_ANSWER_SYSTEM_PROMPT = """당신은 일일보고서 데이터를 기반으로 질문에 답변하는 전문 어시스턴트입니다.
+
+⚠️ 중요: 날짜 범위 필터링과 문서 검색은 이미 시스템에서 처리되었습니다.
+제공된 컨텍스트는 질문에 관련된 데이터만 포함되어 있습니다.
+
+규칙:
+1. 제공된 컨텍스트(일일보고서 데이터)만을 근거로 답변하세요.
+2. 컨텍스트에 없는 정보는 절대 추측하거나 만들어내지 마세요.
+3. 날짜, 시간, 업무 내용 등은 컨텍스트에서 정확히 인용하세요.
+4. 여러 결과가 있으면 날짜순(최신순)으로 정리해서 답변하세요.
+5. 컨텍스트에 데이터가 없으면 "데이터에서 찾을 수 없습니다"라고 명확히 답변하세요.
+6. 자연스럽고 친절한 톤으로 답변하세요.
+7. 필요시 날짜, 시간, 카테고리 정보를 포함해서 답변하세요.
+
+답변 형식:
+- 질문에 대한 직접적인 답변
+- 근거가 되는 날짜/시간 정보 포함 (연도 포함)
+- 여러 결과가 있으면 날짜순(최신순) 목록으로 정리"""
+
+_UNRESOLVED_ANSWER_SYSTEM_PROMPT = _ANSWER_SYSTEM_PROMPT + "\n\n특별 규칙 (미종결 업무 질의):\n- 제공된 검색 결과는 이미 다음 날 수행 여부를 확인하여 필터링된 '진행되지 않은' 미종결 업무만 포함합니다.\n- 따라서 검색 결과에 나온 항목들은 모두 아직 미종결 상태입니다."
+
 
 class ReportRAGChain:
     """일일보고서 RAG 체인"""
@@ -52,12 +84,9 @@ class ReportRAGChain:
             embedding_model_type=embedding_model_type
         )
         
-        # Retriever 초기화 (하위 호환성 유지)
+        # Retriever 초기화 (하위 호환성 유지, 지정하지 않으면 프로세스 내 공유 retriever 사용)
         if retriever is None:
-            self.retriever = UnifiedRetriever(
-                collection=collection,
-                embedding_model_type=embedding_model_type
-            )
+            self.retriever = get_report_retriever()
         else:
             self.retriever = retriever
         
@@ -234,75 +263,6 @@ class ReportRAGChain:
         except (ValueError, TypeError):
             return None
     
-    def _get_document_ids_in_range(
-        self,
-        start_date: date,
-        end_date: date,
-        owner: Optional[str] = None
-    ) -> Set[str]:
-        """
-        날짜 범위에 해당하는 문서 ID 목록 추출 (검색 전 필터링)
-        
-        Args:
-            start_date: 시작 날짜
-            end_date: 종료 날짜
-            owner: 작성자 필터 (None이면 전체)
-            
-        Returns:
-            문서 ID 집합
-        """
-        collection = self.retriever.collection
-        
-        # 날짜 범위 내 모든 날짜 리스트 생성
-        date_list = []
-        current = start_date
-        while current <= end_date:
-            date_list.append(current.strftime("%Y-%m-%d"))
-            current += timedelta(days=1)
-        
-        print(f"[DEBUG] 날짜 범위 내 문서 ID 추출: {start_date} ~ {end_date} ({len(date_list)}일)")
-        
-        # 필터 조건 구성
-        conditions = [
-            {"report_type": {"$in": ["daily", "weekly", "monthly"]}},
-            {"level": "daily"},
-            {"date": {"$in": date_list}}
-        ]
-        
-        if owner:
-            conditions.append({"owner": owner})
-        
-        where_filter = {"$and": conditions} if len(conditions) > 1 else conditions[0]
-        
-        # ChromaDB에서 날짜 범위 내 모든 문서 가져오기
-        try:
-            results = collection.get(
-                where=where_filter,
-                limit=10000,  # 충분히 큰 수
-                include=["metadatas"]
-            )
-            
-            # doc_id 추출 (중복 제거)
-            doc_ids = set()
-            if results and results.get("ids"):
-                for metadata in results.get("metadatas", []):
-                    doc_id = metadata.get("doc_id")
-                    if doc_id:
-                        doc_ids.add(doc_id)
-            
-            print(f"[DEBUG] 날짜 범위 내 문서 ID 추출 완료: {len(doc_ids)}개 문서")
-            if doc_ids:
-                sample_ids = list(doc_ids)[:5]
-                print(f"[DEBUG] 샘플 문서 ID: {sample_ids}")
-            
-            return doc_ids
-            
-        except Exception as e:
-            print(f"[ERROR] 문서 ID 추출 실패: {e}")
-            import traceback
-            traceback.print_exc()
-            return set()
-    
     def _collect_daily_counts(
         self,
         date_range: Dict[str, date],
@@ -328,80 +288,65 @@ class ReportRAGChain:
         start_date = date_range["start"]
         end_date = date_range["end"]
         
-        print(f"[DEBUG] 통계 수집 시작: {start_date} ~ {end_date}, 카테고리: {category_keyword}")
-        
-        # 날짜 범위 내 문서 ID 추출
-        doc_ids = self._get_document_ids_in_range(start_date, end_date, owner)
-        
-        if not doc_ids:
-            print(f"[WARNING] 날짜 범위 내 문서를 찾을 수 없습니다.")
-            return {
-                "date_counts": {},
-                "max_date": None,
-                "max_count": 0,
-                "details": []
-            }
-        
-        # 해당 문서들에서 detail 청크만 가져오기
-        collection = self.retriever.collection
+        logger.debug("통계 수집 시작: %s ~ %s, 카테고리: %s", start_date, end_date, category_keyword)
         
-        # 필터 조건
-        conditions = [
-            {"doc_id": {"$in": list(doc_ids)}},
-            {"chunk_type": "detail"},
-            {"report_type": {"$in": ["daily", "weekly", "monthly"]}},
-            {"level": "daily"}
-        ]
+        empty_stats = {
+            "date_counts": {},
+            "max_date": None,
+            "max_count": 0,
+            "details": []
+        }
         
-        if owner:
-            conditions.append({"owner": owner})
+        # 날짜 범위 내 detail 청크를 한 번의 get()으로 조회
+        # (doc_id는 날짜별로 하나이므로 "범위 내 doc_id 추출 → 해당 doc_id의 detail 청크 조회" 두 번의 왕복과 결과가 같음)
+        detail_chunks = self.retriever.fetch_daily(
+            owner=owner,
+            period_start=start_date.isoformat(),
+            period_end=end_date.isoformat(),
+            limit=10000,
+            chunk_types=["detail"]
+        )
         
-        where_filter = {"$and": conditions}
+        if not detail_chunks:
+            logger.warning("날짜 범위 내 문서를 찾을 수 없습니다.")
+            return empty_stats
         
         try:
-            # 모든 detail 청크 가져오기
-            results = collection.get(
-                where=where_filter,
-                limit=10000,
-                include=["metadatas", "documents"]
-            )
-            
             # 날짜별 카운팅
             date_counts = Counter()
             details = []
             
-            if results and results.get("ids"):
-                for i, metadata in enumerate(results.get("metadatas", [])):
-                    doc_text = results.get("documents", [])[i] if results.get("documents") else ""
-                    
-                    # 카테고리 키워드 매칭
-                    category = metadata.get("category", "")
-                    text_lower = doc_text.lower()
-                    
-                    # 카테고리 또는 텍스트에 키워드 포함 여부 확인
-                    is_match = (
-                        category_keyword in category or
-                        category_keyword in text_lower
-                    )
-                    
-                    if is_match:
-                        doc_date = metadata.get("date")
-                        if doc_date:
-                            date_counts[doc_date] += 1
-                            details.append({
-                                "date": doc_date,
-                                "text": doc_text[:100] + "..." if len(doc_text) > 100 else doc_text,
-                                "category": category
-                            })
+            for chunk in detail_chunks:
+                metadata = chunk.metadata
+                doc_text = chunk.text or ""
+                
+                # 카테고리 키워드 매칭
+                category = metadata.get("category", "")
+                
+                # 카테고리 또는 텍스트에 키워드 포함 여부 확인
+                # (카테고리에서 먼저 매칭되면 본문 소문자 사본을 만들지 않음)
+                is_match = (
+                    category_keyword in category or
+                    category_keyword in doc_text.lower()
+                )
+                
+                if is_match:
+                    doc_date = metadata.get("date")
+                    if doc_date:
+                        date_counts[doc_date] += 1
+                        details.append({
+                            "date": doc_date,
+                            "text": doc_text[:100] + "..." if len(doc_text) > 100 else doc_text,
+                            "category": category
+                        })
             
             # 최대 count 날짜 찾기
             max_date = None
             max_count = 0
             if date_counts:
-                max_date = date_counts.most_common(1)[0][0]
-                max_count = date_counts.most_common(1)[0][1]
+                max_date, max_count = date_counts.most_common(1)[0]
             
-            print(f"[DEBUG] 통계 수집 완료: {len(date_counts)}개 날짜, 최대 count: {max_count} ({max_date})")
+            logger.debug("통계 수집 완료: %d개 날짜, 최대 count: %d (%s)", len(date_counts), max_count, max_date)
             
             return {
                 "date_counts": dict(date_counts),
@@ -411,15 +356,8 @@ class ReportRAGChain:
             }
             
         except Exception as e:
-            print(f"[ERROR] 통계 수집 실패: {e}")
-            import traceback
-            traceback.print_exc()
-            return {
-                "date_counts": {},
-                "max_date": None,
-                "max_count": 0,
-                "details": []
-            }
+            logger.exception("통계 수집 실패: %s", e)
+            return empty_stats
     
     def _filter_completed_unresolved_tasks(
         self,
@@ -437,44 +375,40 @@ class ReportRAGChain:
         if not issue_results:
             return []
         
-        filtered_results = []
-        
-        for issue_result in issue_results:
+        # 다음 날의 task 검색 인자 (같은 업무가 수행되었는지 확인), 날짜 정보 없는 항목은 검색 없이 포함
+        # 다음 날 하루의 문서 ID 목록은 single_date 필터와 같으므로 별도로 조회하지 않음
+        searches = []
+        search_index = {}
+        for idx, issue_result in enumerate(issue_results):
             issue_date = self._parse_date_from_metadata(issue_result.metadata)
             if not issue_date:
-                # 날짜 정보 없으면 포함
-                filtered_results.append(issue_result)
                 continue
-            
-            # 다음 날 날짜 계산
             next_day = issue_date + timedelta(days=1)
-            
-            # 다음 날의 task 검색 (같은 업무가 수행되었는지 확인)
-            # 날짜 범위 먼저 추출
-            doc_ids = self._get_document_ids_in_range(next_day, next_day, self.owner)
-            
-            next_day_tasks = self.retriever.search_daily(
-                query=issue_result.text,  # 미종결 업무 텍스트로 검색
-                owner=self.owner,
-                single_date=next_day.strftime("%Y-%m-%d"),
-                n_results=10,
-                chunk_types=["detail"],  # detail 타입만 (새로운 4청크 구조)
-                doc_ids=list(doc_ids) if doc_ids else None
-            )
+            search_index[idx] = len(searches)
+            searches.append({
+                "query": issue_result.text,  # 미종결 업무 텍스트로 검색
+                "owner": self.owner,
+                "single_date": next_day.strftime("%Y-%m-%d"),
+                "chunk_types": ["detail"]  # detail 타입만 (새로운 4청크 구조)
+            })
+        
+        # 임베딩은 한 번의 배치 호출로, 검색은 동시에 수행
+        next_day_results = self.retriever.search_daily_multi(searches, n_results=10)
+        
+        filtered_results = []
+        for idx, issue_result in enumerate(issue_results):
+            if idx not in search_index:
+                filtered_results.append(issue_result)
+                continue
             
             # 유사도가 높은 task가 있으면 수행된 것으로 간주
+            # 키워드 매칭 (50% 이상 겹치면 수행된 것으로 간주, 더 정교한 유사도 계산 가능)
+            issue_words = set(issue_result.text.lower().split())
             is_completed = False
-            for task in next_day_tasks:
-                # 텍스트 유사도 간단 체크 (더 정교한 유사도 계산 가능)
-                issue_text_lower = issue_result.text.lower()
-                task_text_lower = task.text.lower()
-                
-                # 키워드 매칭 (50% 이상 겹치면 수행된 것으로 간주)
-                issue_words = set(issue_text_lower.split())
-                task_words = set(task_text_lower.split())
-                if issue_words and task_words:
-                    overlap = len(issue_words & task_words) / len(issue_words)
-                    if overlap > 0.5:  # 50% 이상 겹치면
+            if issue_words:
+                for task in next_day_results[search_index[idx]]:
+                    task_words = set(task.text.lower().split())
+                    if task_words and len(issue_words & task_words) / len(issue_words) > 0.5:
                         is_completed = True
                         break
             
@@ -509,8 +443,7 @@ class ReportRAGChain:
         
         # 명시적 date_range가 있으면 키워드의 날짜 범위를 덮어쓰기
         if date_range:
-            keywords.date_range = date_range
-            keywords.single_date = None
+            keywords = replace(keywords, date_range=date_range, single_date=None)
         
         # 비교/통계 질의 감지
         is_comparison = self._is_comparison_query(query)
@@ -541,13 +474,16 @@ class ReportRAGChain:
         
         # 4. 최종 top_k 적용 (비교/통계 질의는 제한 없음)
         if requires_all_data:
-            print(f"[DEBUG] 비교/통계 질의: top_k 제한 제거, 모든 결과 반환 ({len(results)}개)")
+            logger.debug("비교/통계 질의: top_k 제한 제거, 모든 결과 반환 (%d개)", len(results))
             # 모든 결과 반환 (제한 없음)
             final_results = results
         else:
             final_results = results[:self.top_k]
         
-        print(f"[DEBUG] 최종 검색 결과: {len(final_results)}개 (요청된 top_k={self.top_k}, 비교/통계 질의: {requires_all_data})")
+        logger.debug(
+            "최종 검색 결과: %d개 (요청된 top_k=%d, 비교/통계 질의: %s)",
+            len(final_results), self.top_k, requires_all_data
+        )
         
         return final_results
     
@@ -643,7 +579,7 @@ class ReportRAGChain:
         is_statistical = self._is_statistical_query(query)
         
         if is_statistical and date_range:
-            print(f"[DEBUG] 통계형 질의 감지: '{query}'")
+            logger.debug("통계형 질의 감지: '%s'", query)
             
             # 카테고리 키워드 추출 (예: "상담", "업무" 등)
             query_lower = query.lower()
@@ -716,27 +652,7 @@ class ReportRAGChain:
         # 4. LLM 프롬프트 구성
         is_unresolved_query = self._is_unresolved_task_query(query)
         
-        system_prompt = """당신은 일일보고서 데이터를 기반으로 질문에 답변하는 전문 어시스턴트입니다.
-
-⚠️ 중요: 날짜 범위 필터링과 문서 검색은 이미 시스템에서 처리되었습니다.
-제공된 컨텍스트는 질문에 관련된 데이터만 포함되어 있습니다.
-
-규칙:
-1. 제공된 컨텍스트(일일보고서 데이터)만을 근거로 답변하세요.
-2. 컨텍스트에 없는 정보는 절대 추측하거나 만들어내지 마세요.
-3. 날짜, 시간, 업무 내용 등은 컨텍스트에서 정확히 인용하세요.
-4. 여러 결과가 있으면 날짜순(최신순)으로 정리해서 답변하세요.
-5. 컨텍스트에 데이터가 없으면 "데이터에서 찾을 수 없습니다"라고 명확히 답변하세요.
-6. 자연스럽고 친절한 톤으로 답변하세요.
-7. 필요시 날짜, 시간, 카테고리 정보를 포함해서 답변하세요.
-
-답변 형식:
-- 질문에 대한 직접적인 답변
-- 근거가 되는 날짜/시간 정보 포함 (연도 포함)
-- 여러 결과가 있으면 날짜순(최신순) 목록으로 정리"""
-        
-        if is_unresolved_query:
-            system_prompt += "\n\n특별 규칙 (미종결 업무 질의):\n- 제공된 검색 결과는 이미 다음 날 수행 여부를 확인하여 필터링된 '진행되지 않은' 미종결 업무만 포함합니다.\n- 따라서 검색 결과에 나온 항목들은 모두 아직 미종결 상태입니다."
+        system_prompt = _UNRESOLVED_ANSWER_SYSTEM_PROMPT if is_unresolved_query else _ANSWER_SYSTEM_PROMPT
         
         user_prompt = f"""사용자 질문: {query}
 
@@ -753,7 +669,7 @@ class ReportRAGChain:
                 temperature=0.7
             )
         except Exception as e:
-            print(f"[ERROR] LLM 호출 실패: {e}")
+            logger.exception("LLM 호출 실패: %s", e)
             return {
                 "answer": "죄송합니다. 응답 생성 중 오류가 발생했습니다.",
                 "sources": [],
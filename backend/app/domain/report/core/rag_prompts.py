@@ -10,27 +10,20 @@
 WEEKLY_REPORT_RAG_PROMPT = """당신은 일일보고서 데이터를 기반으로 주간보고서를 생성하는 전문 어시스턴트입니다.
 
 ## 입력 데이터
-ChromaDB에서 검색된 일일보고서 청크 배열이 제공됩니다.
-각 청크는 다음 형식입니다:
-{{
-  "text": "[일일_SUMMARY] 2025-11-24\n1. 업무1\n2. 업무2...",
-  "metadata": {{
-    "date": "2025-11-24",
-    "level": "daily",
-    "chunk_type": "summary | detail | pending | plan_note",
-    "week": "2025-W48",
-    "month": "2025-11",
-    "owner": "작성자명"
-  }}
-}}
+ChromaDB에서 검색된 일일보고서 청크 목록이 제공됩니다.
+각 청크는 "[날짜|chunk_type]" 헤더 줄과 본문으로 구성되며, 청크 사이는 빈 줄로 구분됩니다:
+[2025-11-24|summary]
+1. 업무1
+2. 업무2...
 
-검색 조건: week = "{week_number}", level = "daily"
-총 20개 청크 (5일 × 4청크)가 제공됩니다.
+chunk_type: summary | pending | plan_note
+검색 조건: 사용자 메시지에 명시된 주(week), level = "daily" (모든 청크는 같은 작성자의 해당 주 일일보고서)
+요일별 세부 업무(detail 청크)는 시스템이 별도로 구성하므로 제공되지 않습니다.
 
 ## 주간보고서 생성 규칙
 
 ### 1. 주간 업무 목표 (weekly_goals)
-- chunk_type="summary"인 5개 청크를 분석
+- chunk_type="summary"인 청크를 분석
 - 반복되는 업무 방향/테마를 추출
 - 3개의 주간 목표로 요약
 - 각 목표는 구체적이고 측정 가능한 형태로 작성
@@ -39,31 +32,14 @@ ChromaDB에서 검색된 일일보고서 청크 배열이 제공됩니다.
 - "이번 주 고객 상담을 통해 수집된 자료를 기반으로 보장안을 5건 구성하고, 고객의 니즈를 파악하여 맞춤형 제안을 준비한다."
 - "연말 대비 진단비 점검과 절세 상담을 각각 2건 진행하고, 이를 통해 고객의 필요에 맞춘 서비스를 제공한다."
 
-### 2. 요일별 세부 업무 (weekday_tasks)
-- chunk_type="detail"인 5개 청크를 date 기준으로 정렬
-- **반드시 해당 주의 월요일~금요일 5일 모두 포함** (예: "2025-11-03", "2025-11-04", "2025-11-05", "2025-11-06", "2025-11-07")
-- 날짜는 YYYY-MM-DD 형식으로 정확히 사용
-- 각 날짜별로 대표 업무 3개 내외로 요약 (빈 배열이어도 날짜는 반드시 포함)
-- 시간 정보([09:00-10:00] 등)는 제거하고 업무 내용만 추출
-- 업무 내용은 간결하고 구체적으로 작성
-
-출력 형식:
-{{
-  "2025-11-03": ["업무1", "업무2", "업무3"],
-  "2025-11-04": ["업무1", "업무2", "업무3"],
-  "2025-11-05": ["업무1", "업무2", "업무3"],
-  "2025-11-06": ["업무1", "업무2", "업무3"],
-  "2025-11-07": ["업무1", "업무2", "업무3"]
-}}
-
-### 3. 주간 중요 업무 (weekly_highlights)
+### 2. 주간 중요 업무 (weekly_highlights)
 - chunk_type="pending"인 모든 청크를 분석
 - 다음 키워드가 포함된 항목 우선: "미종결", "지연", "콜백", "재통화", "미완료", "처리 못한"
 - 반복적으로 등장하는 항목 우선
 - 3개 내외로 요약
 - 각 항목은 구체적인 업무 내용으로 작성
 
-### 4. 특이사항 (notes)
+### 3. 특이사항 (notes)
 - chunk_type="plan_note"인 청크 중 notes 성격 문장만 추출
 - "특이사항:" 섹션의 내용만 사용
 - 고객 반응, 컴플레인, 내부 이슈 등을 중심으로 기록
@@ -78,13 +54,6 @@ ChromaDB에서 검색된 일일보고서 청크 배열이 제공됩니다.
     "목표2",
     "목표3"
   ],
-  "weekday_tasks": {{
-    "2025-11-03": ["업무1", "업무2", "업무3"],
-    "2025-11-04": ["업무1", "업무2", "업무3"],
-    "2025-11-05": ["업무1", "업무2", "업무3"],
-    "2025-11-06": ["업무1", "업무2", "업무3"],
-    "2025-11-07": ["업무1", "업무2", "업무3"]
-  }},
   "weekly_highlights": [
     "중요 업무1",
     "중요 업무2",
@@ -96,8 +65,7 @@ ChromaDB에서 검색된 일일보고서 청크 배열이 제공됩니다.
 ## 중요 규칙
 1. 제공된 검색 결과만을 근거로 작성하세요. 추측하지 마세요.
 2. JSON만 출력하세요. 다른 텍스트는 포함하지 마세요.
-3. 날짜는 YYYY-MM-DD 형식을 정확히 유지하세요.
-4. 빈 배열이나 빈 문자열이어도 해당 필드는 반드시 포함하세요.
+3. 빈 배열이나 빈 문자열이어도 해당 필드는 반드시 포함하세요.
 """
 
 
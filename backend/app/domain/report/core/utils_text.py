@@ -6,6 +6,30 @@ import re
 from typing import List, Optional
 
 
+# 고객명이 아닌 일반 단어 (고객명 추출 결과에서 제외)
+_EXCLUDED_NAME_WORDS = frozenset({
+    "상담", "상담한", "상담했", "상담할", "상담하",  # 동사 형태
+    "보장", "리포트", "자료", "정리", "구성", "작성", "분석", 
+    "업무", "일정", "계획", "예정", "대기", "요청", "문의", "처리",
+    "고객", "최근", "언제", "했었", "했지", "했어", "했는", "했던",
+    "뽑아줘", "뽑아", "날짜", "다", "전부", "모두", "모든",  # 질문/요청 단어
+    "알려줘", "알려", "찾아줘", "찾아"
+})
+
+# 고객명 패턴 (청크마다/질의마다 호출되므로 모듈 로드 시 한 번만 컴파일)
+# 패턴끼리 매치 구간이 겹칠 수 있으므로 하나의 alternation으로 합치지 않고 각각 스캔
+_CUSTOMER_NAME_PATTERNS = (
+    re.compile(r'([가-힣]{2,4})\s*고객'),  # "이름 고객" 형식 (가장 정확)
+    re.compile(r'고객\s*([가-힣]{2,4})'),  # "고객 이름" 형식
+    re.compile(r'([가-힣]{2,4})(?:님|씨)'),  # "이름님", "이름씨" 형식
+    re.compile(r'([가-힣]{2,4})(?:에게|와|과)'),  # "이름에게", "이름와", "이름과" 형식
+)
+
+# 시간 범위 ("09:00 - 10:00", "09:00~10:00", "09:00-10:00") / 단일 시간
+_TIME_RANGE_RE = re.compile(r'(\d{2}:\d{2})\s*[-~]\s*(\d{2}:\d{2})')
+_SINGLE_TIME_RE = re.compile(r'\b(\d{2}:\d{2})\b')
+
+
 def extract_customer_names(text: str) -> List[str]:
     """
     텍스트에서 고객명 추출
@@ -22,48 +46,16 @@ def extract_customer_names(text: str) -> List[str]:
     Returns:
         고객명 리스트
     """
-    # 제외할 일반 단어 목록 (고객명이 아닌 단어)
-    excluded_words = {
-        "상담", "상담한", "상담했", "상담할", "상담하",  # 동사 형태
-        "보장", "리포트", "자료", "정리", "구성", "작성", "분석", 
-        "업무", "일정", "계획", "예정", "대기", "요청", "문의", "처리",
-        "고객", "최근", "언제", "했었", "했지", "했어", "했는", "했던",
-        "뽑아줘", "뽑아", "날짜", "다", "전부", "모두", "모든",  # 질문/요청 단어
-        "알려줘", "알려", "찾아줘", "찾아"
+    # 모든 패턴의 매치를 모아 중복 제거 및 필터링
+    # (패턴이 2-4자만 캡처하므로 길이 검사는 불필요, 제외 단어 목록에 없는 경우만 추가)
+    unique_names = {
+        name
+        for pattern in _CUSTOMER_NAME_PATTERNS
+        for name in pattern.findall(text)
+        if name not in _EXCLUDED_NAME_WORDS
     }
     
-    # 패턴 1: "이름 고객" 형식 (가장 정확)
-    pattern1 = r'([가-힣]{2,4})\s*고객'
-    matches1 = re.findall(pattern1, text)
-    
-    # 패턴 2: "고객 이름" 형식
-    pattern2 = r'고객\s*([가-힣]{2,4})'
-    matches2 = re.findall(pattern2, text)
-    
-    # 패턴 3: "이름님", "이름씨" 형식
-    pattern3 = r'([가-힣]{2,4})(?:님|씨)'
-    matches3 = re.findall(pattern3, text)
-    
-    # 패턴 4: "이름에게", "이름와", "이름과" 형식
-    pattern4 = r'([가-힣]{2,4})(?:에게|와|과)'
-    matches4 = re.findall(pattern4, text)
-    
-    # 모든 매치 합치기
-    all_matches = matches1 + matches2 + matches3 + matches4
-    
-    # 중복 제거 및 필터링
-    unique_names = []
-    for name in all_matches:
-        # 2-4자 이름만 허용
-        if 2 <= len(name) <= 4:
-            # 제외 단어 목록에 없는 경우만 추가
-            if name not in excluded_words:
-                unique_names.append(name)
-    
-    # 중복 제거
-    unique_names = list(set(unique_names))
-    
-    return unique_names
+    return list(unique_names)
 
 
 def extract_time_range(text: str) -> Optional[str]:
@@ -80,18 +72,12 @@ def extract_time_range(text: str) -> Optional[str]:
     Returns:
         시간 범위 문자열 (HH:MM-HH:MM) 또는 None
     """
-    # 다양한 시간 형식 패턴
-    patterns = [
-        r'(\d{2}:\d{2})\s*[-~]\s*(\d{2}:\d{2})',  # "09:00 - 10:00" 또는 "09:00~10:00"
-        r'(\d{2}:\d{2})\s*-\s*(\d{2}:\d{2})',     # "09:00-10:00"
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text)
-        if match:
-            start_time = match.group(1)
-            end_time = match.group(2)
-            return f"{start_time}-{end_time}"
+    # "09:00 - 10:00", "09:00~10:00", "09:00-10:00" 모두 하나의 패턴으로 처리
+    match = _TIME_RANGE_RE.search(text)
+    if match:
+        start_time = match.group(1)
+        end_time = match.group(2)
+        return f"{start_time}-{end_time}"
     
     return None
 
@@ -106,8 +92,7 @@ def extract_single_time(text: str) -> Optional[str]:
     Returns:
         시간 문자열 (HH:MM) 또는 None
     """
-    pattern = r'\b(\d{2}:\d{2})\b'
-    match = re.search(pattern, text)
+    match = _SINGLE_TIME_RE.search(text)
     if match:
         return match.group(1)
     return None
@@ -11,7 +11,6 @@ from datetime import date
 import hashlib
 import re
 import numpy as np
-import openai
 from functools import lru_cache
 
 from app.domain.report.core.canonical_models import (
@@ -20,6 +19,10 @@ from app.domain.report.core.canonical_models import (
     DetailTask
 )
 from app.core.config import settings
+from app.llm.client import get_openai_client
+
+# 유사도 계산용 정규화: 단어/공백/한글 이외 문자 제거
+_NON_WORD_RE = re.compile(r'[^\w\s가-힣]')
 
 
 @lru_cache(maxsize=1000)
@@ -34,7 +37,7 @@ def get_embedding(text: str) -> np.ndarray:
         임베딩 벡터 (numpy array)
     """
     try:
-        client = openai.OpenAI(api_key=settings.OPENAI_API_KEY)
+        client = get_openai_client(settings.OPENAI_API_KEY)
         response = client.embeddings.create(
             model="text-embedding-3-small",  # 빠르고 비용 효율적
             input=text.strip()
@@ -107,7 +110,7 @@ def calculate_text_similarity(text1: str, text2: str) -> float:
     # 정규화: 소문자, 공백 제거, 특수문자 제거
     def normalize(text: str) -> Set[str]:
         text = text.lower()
-        text = re.sub(r'[^\w\s가-힣]', '', text)
+        text = _NON_WORD_RE.sub('', text)
         # 2글자 이상의 단어만 추출 (조사 제거)
         words = [w for w in text.split() if len(w) >= 2]
         return set(words)
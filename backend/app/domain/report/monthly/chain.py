@@ -5,6 +5,8 @@
 from datetime import date
 from typing import List, Dict, Any, Optional
 from sqlalchemy.orm import Session
+import asyncio
+import logging
 import uuid
 import json
 from calendar import monthrange
@@ -12,12 +14,12 @@ from calendar import monthrange
 from app.domain.report.core.canonical_models import CanonicalReport, CanonicalMonthly
 from app.domain.report.weekly.repository import WeeklyReportRepository
 from app.domain.report.daily.repository import DailyReportRepository
-from app.infrastructure.vector_store_report import get_report_vector_store
-from app.domain.report.search.retriever import UnifiedRetriever
+from app.domain.report.search.retriever import UnifiedSearchResult, get_report_retriever
 from app.llm.client import get_llm
-from app.core.config import settings
 from app.domain.report.core.rag_prompts import MONTHLY_REPORT_RAG_PROMPT
 
+logger = logging.getLogger(__name__)
+
 
 def get_month_range(target_date: date) -> tuple[date, date]:
     """
@@ -35,79 +37,78 @@ def get_month_range(target_date: date) -> tuple[date, date]:
     return (first_day, last_day)
 
 
-def generate_monthly_report(
-    db: Session,
-    owner: str,
-    target_date: date,
-    kpi_data: Optional[Dict[str, Any]] = None
-) -> CanonicalReport:
-    """
-    월간 보고서 자동 생성 (새로운 4청크 구조 기반)
-    
-    Args:
-        db: 데이터베이스 세션
-        owner: 작성자
-        target_date: 기준 날짜 (해당 월의 아무 날짜)
-        kpi_data: PostgreSQL에서 조회한 월간 KPI 숫자 JSON (선택)
-        
-    Returns:
-        CanonicalReport (monthly)
-    """
-    # 1. 해당 월의 1일~말일 날짜 계산
-    first_day, last_day = get_month_range(target_date)
-    month_str = target_date.strftime("%Y-%m")
-    
-    # 2. DB에서 해당 월의 모든 주간보고서 조회
-    weekly_reports = WeeklyReportRepository.list_by_owner_and_period_range(
+def _list_weekly_reports_json(db: Session, owner: str, first_day: date, last_day: date) -> List[Dict[str, Any]]:
+    """DB에서 해당 월의 주간보고서를 조회해 weekly JSON 목록으로 변환"""
+    # 행 전체 대신 report_json의 weekly 섹션만 DB에서 선택
+    weekly_reports_json = WeeklyReportRepository.list_weekly_sections_by_owner_and_period_range(
         db=db,
         owner=owner,
         period_start=first_day,
         period_end=last_day
     )
     
-    print(f"[INFO] 주간보고서 {len(weekly_reports)}개 발견: {first_day}~{last_day}")
-    
-    # 3. 벡터DB에서 해당 월의 일일보고서 청크 검색
-    import os
-    vector_store = get_report_vector_store()
-    collection = vector_store.get_collection()
-    embedding_model_type = os.getenv("REPORT_EMBEDDING_MODEL_TYPE", "hf")
-    retriever = UnifiedRetriever(
-        collection=collection,
-        openai_api_key=settings.OPENAI_API_KEY,
-        embedding_model_type=embedding_model_type
-    )
+    logger.info("주간보고서 %d개 발견: %s~%s", len(weekly_reports_json), first_day, last_day)
+    return weekly_reports_json
+
+
+def _fetch_monthly_chunks(owner: str, month_str: str) -> List[UnifiedSearchResult]:
+    """
+    벡터DB에서 해당 월의 일일보고서 청크 전체 조회 (날짜순)
     
-    # 해당 월의 모든 일일보고서 청크 검색
-    daily_chunks = retriever.search_daily(
-        query=f"{owner} 월간 업무",
+    Args:
+        owner: 작성자
+        month_str: 월 문자열 (예: "2025-11")
+        
+    Returns:
+        청크 리스트
+    """
+    # 청크 메타데이터의 month 필드로 등호 필터링: 한 달치 날짜 목록 $in 대신 조건 하나
+    # 한 달치 청크 전체가 필요하고 고정 쿼리("{owner} 월간 업무")와의 유사도 순위는 의미 없으므로
+    # 쿼리 임베딩 없이 get()으로 조회한 뒤 날짜순으로 정렬
+    daily_chunks = get_report_retriever().fetch_daily(
         owner=owner,
-        period_start=first_day.isoformat(),
-        period_end=last_day.isoformat(),
-        n_results=500,  # 충분한 데이터 수집
+        month=month_str,
+        limit=500,  # 충분한 데이터 수집
         chunk_types=None  # 모든 청크 타입
     )
+    daily_chunks.sort(key=lambda chunk: chunk.metadata.get("date", ""))
     
-    print(f"[INFO] 일일보고서 청크 {len(daily_chunks)}개 발견: {first_day}~{last_day}")
-    
-    # 4. 주간보고서 JSON 변환
-    weekly_reports_json = []
-    for weekly_report in weekly_reports:
-        if weekly_report.report_json:
-            weekly_reports_json.append(weekly_report.report_json.get("weekly", {}))
-    
-    # 5. 일일보고서 청크 변환
-    daily_chunks_data = []
-    for chunk in daily_chunks:
-        daily_chunks_data.append({
-            "text": chunk.text,
-            "metadata": chunk.metadata
-        })
+    logger.info("일일보고서 청크 %d개 발견: %s", len(daily_chunks), month_str)
+    return daily_chunks
+
+
+def _require_monthly_source_data(
+    owner: str,
+    month_str: str,
+    weekly_reports_json: List[Dict[str, Any]],
+    daily_chunks: List[UnifiedSearchResult],
+    kpi_data: Optional[Dict[str, Any]]
+) -> None:
+    """
+    근거 데이터(주간보고서/일일보고서 청크/KPI)가 하나도 없으면 LLM 호출 전에 실패
     
-    # 6. LLM 프롬프트 구성
-    llm_client = get_llm()
+    빈 입력으로는 의미 있는 월간보고서를 만들 수 없으므로 LLM 호출 비용을 들이지 않습니다.
     
-    user_prompt = f"""다음은 해당 월({month_str})의 데이터입니다:
+    Raises:
+        ValueError: 해당 월의 데이터가 없을 때 (엔드포인트에서 404로 변환)
+    """
+    if not weekly_reports_json and not daily_chunks and not kpi_data:
+        raise ValueError(f"{owner}의 {month_str} 월간보고서를 생성할 데이터가 없습니다.")
+
+
+def _build_monthly_user_prompt(
+    month_str: str,
+    weekly_reports_json: List[Dict[str, Any]],
+    daily_chunks: List[UnifiedSearchResult],
+    kpi_data: Optional[Dict[str, Any]]
+) -> str:
+    """월간 보고서 LLM 사용자 프롬프트 구성"""
+    daily_chunks_data = [
+        {"text": chunk.text, "metadata": chunk.metadata}
+        for chunk in daily_chunks
+    ]
+    
+    return f"""다음은 해당 월({month_str})의 데이터입니다:
 
 ### 주간보고서 JSON (4개):
 {json.dumps(weekly_reports_json, ensure_ascii=False, indent=2)}
@@ -119,24 +120,16 @@ def generate_monthly_report(
 {json.dumps(kpi_data or {}, ensure_ascii=False, indent=2)}
 
 위 데이터를 기반으로 월간보고서를 생성해주세요."""
-    
-    # 7. LLM 호출
-    try:
-        response = llm_client.complete_json(
-            system_prompt=MONTHLY_REPORT_RAG_PROMPT,
-            user_prompt=user_prompt,
-            temperature=0.7
-        )
-        
-        monthly_data = response if isinstance(response, dict) else json.loads(response)
-        
-    except Exception as e:
-        print(f"[ERROR] 월간보고서 생성 실패: {e}")
-        import traceback
-        traceback.print_exc()
-        raise
-    
-    # 8. CanonicalMonthly 생성
+
+
+def _build_monthly_report(
+    owner: str,
+    target_date: date,
+    first_day: date,
+    last_day: date,
+    monthly_data: Dict[str, Any]
+) -> CanonicalReport:
+    """LLM 응답(JSON)으로 CanonicalReport (monthly) 구성"""
     header = {
         "월": f"{target_date.year}년 {target_date.month}월",
         "작성일자": last_day.isoformat(),
@@ -149,8 +142,7 @@ def generate_monthly_report(
         next_month_plan=monthly_data.get("next_month_plan", "")
     )
     
-    # 9. CanonicalReport 생성
-    report = CanonicalReport(
+    return CanonicalReport(
         report_id=str(uuid.uuid4()),
         report_type="monthly",
         owner=owner,
@@ -158,5 +150,95 @@ def generate_monthly_report(
         period_end=last_day,
         monthly=canonical_monthly
     )
+
+
+def generate_monthly_report(
+    db: Session,
+    owner: str,
+    target_date: date,
+    kpi_data: Optional[Dict[str, Any]] = None
+) -> CanonicalReport:
+    """
+    월간 보고서 자동 생성 (새로운 4청크 구조 기반)
+    
+    Args:
+        db: 데이터베이스 세션
+        owner: 작성자
+        target_date: 기준 날짜 (해당 월의 아무 날짜)
+        kpi_data: PostgreSQL에서 조회한 월간 KPI 숫자 JSON (선택)
+        
+    Returns:
+        CanonicalReport (monthly)
+        
+    Raises:
+        ValueError: 해당 월의 주간보고서·일일보고서 청크·KPI가 모두 없을 때
+    """
+    # 1. 해당 월의 1일~말일 날짜 계산
+    first_day, last_day = get_month_range(target_date)
+    month_str = target_date.strftime("%Y-%m")
+    
+    # 2. DB에서 해당 월의 모든 주간보고서 조회
+    weekly_reports_json = _list_weekly_reports_json(db, owner, first_day, last_day)
+    
+    # 3. 벡터DB에서 해당 월의 일일보고서 청크 조회
+    daily_chunks = _fetch_monthly_chunks(owner, month_str)
+    _require_monthly_source_data(owner, month_str, weekly_reports_json, daily_chunks, kpi_data)
+    
+    # 4. LLM 프롬프트 구성 및 호출
+    user_prompt = _build_monthly_user_prompt(month_str, weekly_reports_json, daily_chunks, kpi_data)
+    llm_client = get_llm()
+    
+    try:
+        monthly_data = llm_client.complete_json(
+            system_prompt=MONTHLY_REPORT_RAG_PROMPT,
+            user_prompt=user_prompt,
+            temperature=0.7,
+            use_cache=True  # 주간보고서·청크·KPI가 그대로면 이전 응답 재사용
+        )
+    except Exception as e:
+        logger.exception("월간보고서 생성 실패: %s", e)
+        raise
+    
+    # 5. CanonicalReport 생성
+    return _build_monthly_report(owner, target_date, first_day, last_day, monthly_data)
+
+
+async def generate_monthly_report_async(
+    db: Session,
+    owner: str,
+    target_date: date,
+    kpi_data: Optional[Dict[str, Any]] = None
+) -> CanonicalReport:
+    """
+    월간 보고서 자동 생성 (비동기 버전)
+    
+    서로 독립적인 주간보고서 DB 조회와 벡터DB 청크 조회를 동시에 수행하고,
+    LLM 호출은 acomplete_json으로 수행하여 이벤트 루프를 막지 않습니다.
+    인자와 반환값은 generate_monthly_report와 동일합니다.
+    """
+    first_day, last_day = get_month_range(target_date)
+    month_str = target_date.strftime("%Y-%m")
+    
+    # 동기 DB 조회와 벡터DB 조회를 각각 스레드에서 동시에 실행 (이벤트 루프를 막지 않음)
+    # DB 세션은 주간보고서 조회 스레드 하나만 사용하므로 동시에 공유되지 않음
+    weekly_reports_json, daily_chunks = await asyncio.gather(
+        asyncio.to_thread(_list_weekly_reports_json, db, owner, first_day, last_day),
+        asyncio.to_thread(_fetch_monthly_chunks, owner, month_str)
+    )
+    _require_monthly_source_data(owner, month_str, weekly_reports_json, daily_chunks, kpi_data)
+    
+    user_prompt = _build_monthly_user_prompt(month_str, weekly_reports_json, daily_chunks, kpi_data)
+    llm_client = get_llm()
+    
+    try:
+        monthly_data = await llm_client.acomplete_json(
+            system_prompt=MONTHLY_REPORT_RAG_PROMPT,
+            user_prompt=user_prompt,
+            temperature=0.7,
+            use_cache=True  # 주간보고서·청크·KPI가 그대로면 이전 응답 재사용
+        )
+    except Exception as e:
+        logger.exception("월간보고서 생성 실패: %s", e)
+        raise
     
-    return report
+    return _build_monthly_report(owner, target_date, first_day, last_day, monthly_data)
@@ -6,8 +6,9 @@ LangChain 기반 오늘의 일정 플래닝 체인
 Author: AI Assistant
 Created: 2025-11-18
 """
-from typing import Optional, List
+from typing import Optional, List, Dict
 from datetime import date
+from itertools import chain
 
 from app.llm.client import LLMClient
 from app.domain.report.planner.tools import YesterdayReportTool
@@ -144,19 +145,16 @@ class TodayPlanGenerator:
                     f"{request.owner} 업무 진행",
                 ]
                 
-                all_results = []
-                
-                for query in search_queries:
-                    # 날짜 필터 없이 검색 (더 많은 결과 확보)
-                    results = self.vector_retriever.search_daily(
-                        query=query,
-                        owner=request.owner,
-                        n_results=20,  # 날짜 필터 없이 더 많은 결과 가져오기
-                        chunk_types=["detail", "summary"]
-                    )
-                    all_results.extend(results)
+                # 날짜 필터 없이 검색 (더 많은 결과 확보), 쿼리들은 한 번에 동시 검색
+                result_batches = self.vector_retriever.search_daily_multi(
+                    [
+                        {"query": query, "owner": request.owner, "chunk_types": ["detail", "summary"]}
+                        for query in search_queries
+                    ],
+                    n_results=20  # 날짜 필터 없이 더 많은 결과 가져오기
+                )
                 
-                print(f"[INFO] 초기 검색 결과: {len(all_results)}개 발견")
+                print(f"[INFO] 초기 검색 결과: {sum(len(results) for results in result_batches)}개 발견")
                 
                 # 날짜 기준으로 필터링 및 정렬 (최신순)
                 # 최근 30일 이내 데이터만 선택
@@ -165,61 +163,13 @@ class TodayPlanGenerator:
                 min_date_str = min_date.isoformat()
                 max_date_str = max_date.isoformat()
                 
-                filtered_results = []
-                for result in all_results:
-                    result_date_str = result.metadata.get("date", "")
-                    # 날짜 필터링: 최근 30일 이내만
-                    if result_date_str and min_date_str <= result_date_str <= max_date_str:
-                        filtered_results.append(result)
+                # 날짜 필터링(최근 30일 이내) + 쿼리 간 중복 청크 제거
+                filtered_results = self._merge_recent_results(result_batches, min_date_str, max_date_str)
                 
                 print(f"[INFO] 날짜 필터링 후 ({min_date_str} ~ {max_date_str}): {len(filtered_results)}개")
                 
                 # 완료된 업무 필터링: 다음날에 완료된 업무는 제외
-                from datetime import datetime
-                incomplete_results = []
-                for result in filtered_results:
-                    result_date_str = result.metadata.get("date", "")
-                    if not result_date_str:
-                        incomplete_results.append(result)
-                        continue
-                    
-                    try:
-                        result_date = datetime.strptime(result_date_str, "%Y-%m-%d").date()
-                        next_day = result_date + timedelta(days=1)
-                        
-                        # 다음날 업무 검색 (완료 여부 확인)
-                        task_text = result.text
-                        # 청크 타입이 detail인 경우 실제 업무 내용 추출
-                        if "[일일_DETAIL]" in task_text:
-                            # 시간 범위 제거하고 업무 내용만 추출
-                            lines = task_text.split('\n')
-                            task_content = " ".join([line.strip() for line in lines[1:] if line.strip()])
-                        else:
-                            task_content = task_text
-                        
-                        # 다음날 같은 업무가 있는지 확인
-                        next_day_tasks = self.vector_retriever.search_daily(
-                            query=task_content[:100],  # 업무 내용으로 검색
-                            owner=request.owner,
-                            single_date=next_day.isoformat(),
-                            n_results=5,
-                            chunk_types=["detail"]
-                        )
-                        
-                        # 유사도가 높은 업무가 있으면 완료된 것으로 간주
-                        is_completed = False
-                        for next_task in next_day_tasks:
-                            # 유사한 업무가 있으면 완료된 것으로 간주
-                            if next_task.score > 0.7:  # 유사도 임계값
-                                is_completed = True
-                                break
-                        
-                        if not is_completed:
-                            incomplete_results.append(result)
-                    except Exception as e:
-                        # 날짜 파싱 실패 시 포함
-                        print(f"[WARNING] 날짜 파싱 실패 ({result_date_str}): {e}")
-                        incomplete_results.append(result)
+                incomplete_results = self._exclude_completed_tasks(request.owner, filtered_results)
                 
                 print(f"[INFO] 완료된 업무 필터링 후: {len(incomplete_results)}개 (제외: {len(filtered_results) - len(incomplete_results)}개)")
                 
@@ -394,18 +344,16 @@ class TodayPlanGenerator:
                     f"{request.owner} 업무 진행",
                 ]
                 
-                all_results = []
-                for query in search_queries:
-                    # 날짜 필터 없이 검색 (더 많은 결과 확보)
-                    results = self.vector_retriever.search_daily(
-                        query=query,
-                        owner=request.owner,
-                        n_results=20,  # 날짜 필터 없이 더 많은 결과 가져오기
-                        chunk_types=["detail", "summary"]
-                    )
-                    all_results.extend(results)
+                # 날짜 필터 없이 검색 (더 많은 결과 확보), 쿼리들은 한 번에 동시 검색
+                result_batches = self.vector_retriever.search_daily_multi(
+                    [
+                        {"query": query, "owner": request.owner, "chunk_types": ["detail", "summary"]}
+                        for query in search_queries
+                    ],
+                    n_results=20  # 날짜 필터 없이 더 많은 결과 가져오기
+                )
                 
-                print(f"[INFO] 초기 검색 결과: {len(all_results)}개 발견")
+                print(f"[INFO] 초기 검색 결과: {sum(len(results) for results in result_batches)}개 발견")
                 
                 # 날짜 기준으로 필터링 및 정렬 (최신순)
                 # 최근 30일 이내 데이터만 선택
@@ -414,61 +362,13 @@ class TodayPlanGenerator:
                 min_date_str = min_date.isoformat()
                 max_date_str = max_date.isoformat()
                 
-                filtered_results = []
-                for result in all_results:
-                    result_date_str = result.metadata.get("date", "")
-                    # 날짜 필터링: 최근 30일 이내만
-                    if result_date_str and min_date_str <= result_date_str <= max_date_str:
-                        filtered_results.append(result)
+                # 날짜 필터링(최근 30일 이내) + 쿼리 간 중복 청크 제거
+                filtered_results = self._merge_recent_results(result_batches, min_date_str, max_date_str)
                 
                 print(f"[INFO] 날짜 필터링 후 ({min_date_str} ~ {max_date_str}): {len(filtered_results)}개")
                 
                 # 완료된 업무 필터링: 다음날에 완료된 업무는 제외
-                from datetime import datetime
-                incomplete_results = []
-                for result in filtered_results:
-                    result_date_str = result.metadata.get("date", "")
-                    if not result_date_str:
-                        incomplete_results.append(result)
-                        continue
-                    
-                    try:
-                        result_date = datetime.strptime(result_date_str, "%Y-%m-%d").date()
-                        next_day = result_date + timedelta(days=1)
-                        
-                        # 다음날 업무 검색 (완료 여부 확인)
-                        task_text = result.text
-                        # 청크 타입이 detail인 경우 실제 업무 내용 추출
-                        if "[일일_DETAIL]" in task_text:
-                            # 시간 범위 제거하고 업무 내용만 추출
-                            lines = task_text.split('\n')
-                            task_content = " ".join([line.strip() for line in lines[1:] if line.strip()])
-                        else:
-                            task_content = task_text
-                        
-                        # 다음날 같은 업무가 있는지 확인
-                        next_day_tasks = self.vector_retriever.search_daily(
-                            query=task_content[:100],  # 업무 내용으로 검색
-                            owner=request.owner,
-                            single_date=next_day.isoformat(),
-                            n_results=5,
-                            chunk_types=["detail"]
-                        )
-                        
-                        # 유사도가 높은 업무가 있으면 완료된 것으로 간주
-                        is_completed = False
-                        for next_task in next_day_tasks:
-                            # 유사한 업무가 있으면 완료된 것으로 간주
-                            if next_task.score > 0.7:  # 유사도 임계값
-                                is_completed = True
-                                break
-                        
-                        if not is_completed:
-                            incomplete_results.append(result)
-                    except Exception as e:
-                        # 날짜 파싱 실패 시 포함
-                        print(f"[WARNING] 날짜 파싱 실패 ({result_date_str}): {e}")
-                        incomplete_results.append(result)
+                incomplete_results = self._exclude_completed_tasks(request.owner, filtered_results)
                 
                 print(f"[INFO] 완료된 업무 필터링 후: {len(incomplete_results)}개 (제외: {len(filtered_results) - len(incomplete_results)}개)")
                 
@@ -592,6 +492,99 @@ class TodayPlanGenerator:
             owner=request.owner
         )
     
+    @staticmethod
+    def _merge_recent_results(
+        result_batches: List[List[UnifiedSearchResult]],
+        min_date_str: str,
+        max_date_str: str
+    ) -> List[UnifiedSearchResult]:
+        """
+        쿼리별 검색 결과를 합치면서 기간 밖 결과와 중복 청크를 한 번에 제거
+        
+        여러 쿼리가 같은 청크를 반환하는 경우가 많으므로, chunk_id 기준으로 합쳐
+        중복 청크마다 다음날 완료 여부 검색이 반복되지 않게 합니다.
+        
+        Args:
+            result_batches: search_daily_multi 결과 (쿼리별 결과 리스트)
+            min_date_str: 시작일 (YYYY-MM-DD)
+            max_date_str: 종료일 (YYYY-MM-DD)
+            
+        Returns:
+            기간 내 결과 리스트 (처음 나온 순서 유지, 중복은 유사도가 높은 쪽 유지)
+        """
+        merged: Dict[str, UnifiedSearchResult] = {}
+        for result in chain.from_iterable(result_batches):
+            # 날짜가 없으면 빈 문자열이라 min_date_str보다 작아 자연히 제외됨
+            if not min_date_str <= result.metadata.get("date", "") <= max_date_str:
+                continue
+            existing = merged.get(result.chunk_id)
+            if existing is None or result.score > existing.score:
+                merged[result.chunk_id] = result
+        return list(merged.values())
+    
+    def _exclude_completed_tasks(
+        self,
+        owner: str,
+        results: List[UnifiedSearchResult]
+    ) -> List[UnifiedSearchResult]:
+        """
+        다음날 같은 업무가 있는(완료된 것으로 보이는) 업무를 제외
+        
+        결과마다 다음날 detail 청크를 검색하므로, 검색들을 search_daily_multi로 모아 동시에 수행합니다.
+        
+        Args:
+            owner: 작성자
+            results: 날짜 필터링된 검색 결과
+            
+        Returns:
+            미완료 업무 리스트 (입력 순서 유지)
+        """
+        from datetime import datetime, timedelta
+        
+        # 다음날 검색이 필요한 결과와 그 검색 인자 (날짜가 없거나 파싱 실패 시 검색 없이 포함)
+        searches = []
+        search_index = {}
+        for idx, result in enumerate(results):
+            result_date_str = result.metadata.get("date", "")
+            if not result_date_str:
+                continue
+            try:
+                result_date = datetime.strptime(result_date_str, "%Y-%m-%d").date()
+            except ValueError as e:
+                print(f"[WARNING] 날짜 파싱 실패 ({result_date_str}): {e}")
+                continue
+            next_day = result_date + timedelta(days=1)
+            
+            task_text = result.text
+            # 청크 타입이 detail인 경우 실제 업무 내용 추출
+            if "[일일_DETAIL]" in task_text:
+                # 시간 범위 제거하고 업무 내용만 추출
+                lines = task_text.split('\n')
+                task_content = " ".join([line.strip() for line in lines[1:] if line.strip()])
+            else:
+                task_content = task_text
+            
+            search_index[idx] = len(searches)
+            searches.append({
+                "query": task_content[:100],  # 업무 내용으로 검색
+                "owner": owner,
+                "single_date": next_day.isoformat(),
+                "chunk_types": ["detail"]
+            })
+        
+        next_day_results = self.vector_retriever.search_daily_multi(searches, n_results=5)
+        
+        incomplete_results = []
+        for idx, result in enumerate(results):
+            if idx in search_index:
+                # 다음날 유사도가 높은 업무가 있으면 완료된 것으로 간주
+                next_day_tasks = next_day_results[search_index[idx]]
+                if any(next_task.score > 0.7 for next_task in next_day_tasks):  # 유사도 임계값
+                    continue
+            incomplete_results.append(result)
+        
+        return incomplete_results
+    
     def _build_user_prompt(
         self,
         today: date,
@@ -616,13 +609,13 @@ class TodayPlanGenerator:
             구성된 프롬프트
         """
         # 미종결 업무 포맷팅
-        unresolved_text = "\n".join([f"- {item}" for item in unresolved]) if unresolved else "없음"
+        unresolved_text = "\n".join(f"- {item}" for item in unresolved) if unresolved else "없음"
         
         # 익일 계획 포맷팅
-        next_day_plan_text = "\n".join([f"- {item}" for item in next_day_plan]) if next_day_plan else "없음"
+        next_day_plan_text = "\n".join(f"- {item}" for item in next_day_plan) if next_day_plan else "없음"
         
         # 전날 작업 포맷팅
-        tasks_text = "\n".join([f"- {item}" for item in (tasks or [])]) if tasks else "없음"
+        tasks_text = "\n".join(f"- {item}" for item in tasks) if tasks else "없음"
         
         # 🔥 VectorDB에서 가져온 최근 5일 업무 패턴 포맷팅
         similar_tasks_text = "없음"
@@ -634,14 +627,13 @@ class TodayPlanGenerator:
                 print(f"  [{idx+1}] 날짜={task_date}, chunk_type={result.chunk_type}, score={result.score:.3f}, text={result.text[:50]}...")
             
             # 최근 업무 패턴 추출 (detail과 summary만 포함)
-            task_patterns = []
-            for result in similar_tasks[:15]:  # 상위 15개 (더 많은 패턴 제공)
-                chunk_type = result.chunk_type
-                task_date = result.metadata.get("date", "N/A")
-                # 새로운 4청크 구조: detail(세부 업무), summary(요약)만 사용
-                if chunk_type in ["detail", "summary"]:
-                    # 날짜 정보와 함께 표시하여 최근 패턴임을 명확히
-                    task_patterns.append(f"- [{task_date}] {result.text}")
+            # 상위 15개 (더 많은 패턴 제공), 새로운 4청크 구조: detail(세부 업무), summary(요약)만 사용
+            # 날짜 정보와 함께 표시하여 최근 패턴임을 명확히
+            task_patterns = [
+                f"- [{result.metadata.get('date', 'N/A')}] {result.text}"
+                for result in similar_tasks[:15]
+                if result.chunk_type in ("detail", "summary")
+            ]
             
             print(f"[DEBUG] 최근 5일 업무 패턴 필터링 결과: {len(task_patterns)}개")
             
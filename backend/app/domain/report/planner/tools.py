@@ -7,6 +7,7 @@ Author: AI Assistant
 Created: 2025-11-18
 Updated: 2025-11-19 (PostgreSQL 직접 조회로 변경)
 """
+import logging
 from typing import Dict, List, Any
 from datetime import date, timedelta
 from sqlalchemy.orm import Session
@@ -14,6 +15,8 @@ from sqlalchemy.orm import Session
 from app.domain.report.daily.repository import DailyReportRepository
 from app.domain.report.core.schemas import CanonicalReport
 
+logger = logging.getLogger(__name__)
+
 
 class YesterdayReportTool:
     """전날 보고서 검색 도구 (PostgreSQL 직접 조회)"""
@@ -54,13 +57,16 @@ class YesterdayReportTool:
         if weekday == 0:  # 월요일
             # 전주 금요일 (3일 전)
             yesterday = target_date - timedelta(days=3)
-            print(f"[DEBUG] YesterdayReportTool: 월요일 감지 - 전주 금요일({yesterday}) 사용")
+            logger.debug("YesterdayReportTool: 월요일 감지 - 전주 금요일(%s) 사용", yesterday)
         else:
             yesterday = target_date - timedelta(days=1)
         
         yesterday_str = yesterday.isoformat()
         
-        print(f"[DEBUG] YesterdayReportTool: owner={owner}, target_date={target_date}, yesterday={yesterday}")
+        logger.debug(
+            "YesterdayReportTool: owner=%s, target_date=%s, yesterday=%s",
+            owner, target_date, yesterday
+        )
         
         # PostgreSQL에서 전날 보고서 직접 조회
         daily_report = DailyReportRepository.get_by_owner_and_date(
@@ -71,7 +77,7 @@ class YesterdayReportTool:
         
         if not daily_report:
             # 🔥 전날 데이터가 없으면 최근 데이터 찾기 (최대 7일 전까지)
-            print(f"[DEBUG] 전날({yesterday}) 데이터 없음. 최근 데이터 검색 중...")
+            logger.debug("전날(%s) 데이터 없음. 최근 데이터 검색 중...", yesterday)
             recent_reports = DailyReportRepository.list_by_owner(
                 self.db,
                 owner,
@@ -89,15 +95,17 @@ class YesterdayReportTool:
                         closest_report = report
             
             if closest_report:
-                print(f"[DEBUG] 최근 데이터 발견: {closest_date} (전날 대신 사용)")
+                logger.debug("최근 데이터 발견: %s (전날 대신 사용)", closest_date)
                 daily_report = closest_report
                 yesterday = closest_date
                 yesterday_str = yesterday.isoformat()
             else:
                 # 최근 데이터도 없음
-                print(f"[DEBUG] 최근 데이터도 없음. owner={owner}의 모든 보고서 개수 확인 중...")
-                total_count = DailyReportRepository.count_by_owner(self.db, owner)
-                print(f"[DEBUG] {owner}의 전체 보고서 개수: {total_count}개")
+                # 진단용 COUNT 쿼리는 디버그 로깅이 켜져 있을 때만 실행
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("최근 데이터도 없음. owner=%s의 모든 보고서 개수 확인 중...", owner)
+                    total_count = DailyReportRepository.count_by_owner(self.db, owner)
+                    logger.debug("%s의 전체 보고서 개수: %d개", owner, total_count)
                 
                 return {
                     "unresolved": [],
@@ -5,33 +5,197 @@ Hybrid Search Implementation
 Author: AI Assistant
 Created: 2025-12-02
 """
-from typing import List, Optional, Dict, Any, Set
+from typing import List, Optional, Dict, Any, Mapping, Set, Tuple
+from collections import OrderedDict
 from datetime import date, datetime, timedelta
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter
+from threading import Lock
+from types import MappingProxyType
+import hashlib
+import logging
+import os
 import re
 import numpy as np
 
 from chromadb import Collection
-from app.domain.report.search.retriever import UnifiedSearchResult, UnifiedRetriever
+from app.domain.report.search.retriever import (
+    UnifiedSearchResult,
+    UnifiedRetriever,
+    combine_where_conditions,
+    date_range_conditions,
+    distances_to_scores,
+    supports_numeric_date_range,
+    daily_base_conditions,
+    daily_chunks_have_report_type,
+    QUERY_INCLUDE,
+)
 from app.domain.report.core.utils_text import extract_customer_names
+from app.infrastructure.vector_store_report import get_write_generation
 from ingestion.embed import get_embedding_service
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# top_k 적용 여부 판단용 키워드 (모듈 로드 시 한 번만 컴파일)
+ALL_DATE_KEYWORDS = frozenset(["다", "모두", "전부", "전체", "모든", "일체", "전체다", "다알려줘", "다알려", "전부알려줘", "알려줘"])
+COMPARISON_KEYWORDS = frozenset(["비교", "비율", "차이", "변화", "증가", "감소", "늘어", "줄어", "대비", "대조"])
+STATISTICAL_KEYWORDS = frozenset(["가장", "많이", "몰린", "많은", "통계", "집계", "건수"])
+
+# top_k 판단용 질의 분류 비트 플래그
+MASK_ALL_DATES = 1
+MASK_COMPARISON = 2
+MASK_STATISTICAL = 4
+MASK_CUSTOMER = 8
+_KEYWORD_MASK_FULL = MASK_ALL_DATES | MASK_COMPARISON | MASK_STATISTICAL
+# 모든 결과를 반환해야 하는 분류 (정확한 수치 계산/날짜 누락 방지)
+_RETURN_ALL_MASK = MASK_ALL_DATES | MASK_COMPARISON | MASK_STATISTICAL | MASK_CUSTOMER
+
+# 키워드 -> 비트 매핑 + 전체 키워드를 하나로 합친 정규식 (쿼리를 한 번만 스캔)
+# 한국어 키워드는 대부분 더 긴 어절의 부분 문자열("비교" ⊂ "비교해줘")이므로 토큰 교집합 대신
+# 부분 문자열 매칭을 유지하고, lookahead로 겹치는 위치의 키워드도 놓치지 않도록 함
+_QUERY_MASK_BY_KEYWORD: Dict[str, int] = {
+    **{k: MASK_ALL_DATES for k in ALL_DATE_KEYWORDS},
+    **{k: MASK_COMPARISON for k in COMPARISON_KEYWORDS},
+    **{k: MASK_STATISTICAL for k in STATISTICAL_KEYWORDS},
+}
+_QUERY_CATEGORY_RE = re.compile(
+    "(?=(" + "|".join(map(re.escape, sorted(_QUERY_MASK_BY_KEYWORD, key=len, reverse=True))) + "))"
+)
+
+
+# 고객명 청크의 정규화 float32 임베딩 캐시 (요청마다 HybridSearcher가 새로 만들어지므로 프로세스 공유 LRU)
+# - 키: (chunk_id, 문서 텍스트 해시) → 다른 프로세스가 텍스트를 바꿔 재업서트한 청크는 자동으로 미스
+# - 이 프로세스의 insert_chunks 이후에는 쓰기 세대 번호가 바뀌므로 전체 비움
+# - float16은 NumPy matmul에 BLAS 경로가 없어 오히려 느리므로 float32로 보관
+EMB_CACHE_MAX_SIZE = int(os.getenv("REPORT_EMB_CACHE_SIZE", "2048"))
+_emb_cache: "OrderedDict[Tuple[str, bytes], np.ndarray]" = OrderedDict()
+_emb_cache_lock = Lock()
+_emb_cache_generation = -1
+
+
+def _emb_cache_key(chunk_id: str, document: Optional[str]) -> Tuple[str, bytes]:
+    """임베딩 캐시 키 (chunk_id + 문서 텍스트의 blake2b 해시)"""
+    return chunk_id, hashlib.blake2b((document or "").encode("utf-8"), digest_size=16).digest()
+
+
+def _get_normalized_embeddings(
+    collection: Collection,
+    chunk_ids: List[str],
+    documents: List[str]
+) -> Optional[np.ndarray]:
+    """
+    청크 임베딩을 L2 정규화된 float32 행렬로 반환 (캐시 미스 청크만 ChromaDB에서 조회)
+    
+    Args:
+        collection: ChromaDB Collection
+        chunk_ids: 청크 ID 리스트
+        documents: 청크 ID와 같은 순서의 문서 텍스트 (캐시 키용)
+        
+    Returns:
+        (len(chunk_ids), dim) float32 행렬 또는 None (임베딩이 없는 청크가 있는 경우)
+    """
+    global _emb_cache_generation
+    keys = [
+        _emb_cache_key(chunk_id, documents[idx] if idx < len(documents) else "")
+        for idx, chunk_id in enumerate(chunk_ids)
+    ]
+    rows: List[Optional[np.ndarray]] = [None] * len(keys)
+    
+    with _emb_cache_lock:
+        generation = get_write_generation()
+        if generation != _emb_cache_generation:
+            _emb_cache.clear()
+            _emb_cache_generation = generation
+        for idx, key in enumerate(keys):
+            row = _emb_cache.get(key)
+            if row is not None:
+                _emb_cache.move_to_end(key)
+                rows[idx] = row
+    
+    missing = [idx for idx, row in enumerate(rows) if row is None]
+    if missing:
+        fetched = collection.get(ids=[chunk_ids[idx] for idx in missing], include=["embeddings"])
+        fetched_embeddings = fetched.get("embeddings")
+        if fetched_embeddings is None or len(fetched_embeddings) == 0:
+            return None
+        # get() 결과 순서는 요청 순서와 같다고 보장되지 않으므로 ID로 매핑
+        embedding_by_id = dict(zip(fetched.get("ids", []), fetched_embeddings))
+        if any(chunk_ids[idx] not in embedding_by_id for idx in missing):
+            return None
+        
+        matrix = np.asarray([embedding_by_id[chunk_ids[idx]] for idx in missing], dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix /= np.where(norms > 0, norms, 1.0)
+        
+        with _emb_cache_lock:
+            for row_idx, idx in enumerate(missing):
+                # 캐시 항목은 행 복사본으로 보관 (한 행이 남아 있다고 배치 행렬 전체가 유지되지 않도록)
+                rows[idx] = matrix[row_idx].copy()
+                _emb_cache[keys[idx]] = rows[idx]
+            while len(_emb_cache) > EMB_CACHE_MAX_SIZE:
+                _emb_cache.popitem(last=False)
+    
+    return np.stack(rows)
+
+
+def _classify_query(query_lower: str) -> int:
+    """
+    쿼리에 포함된 top_k 판단용 키워드 분류를 한 번의 스캔으로 비트 마스크로 수집
+    
+    Args:
+        query_lower: 소문자화된 쿼리
+        
+    Returns:
+        MASK_ALL_DATES / MASK_COMPARISON / MASK_STATISTICAL 비트의 조합
+    """
+    mask = 0
+    for match in _QUERY_CATEGORY_RE.finditer(query_lower):
+        mask |= _QUERY_MASK_BY_KEYWORD[match.group(1)]
+        if mask == _KEYWORD_MASK_FULL:
+            break
+    return mask
+
+
+@lru_cache(maxsize=256)
+def _minimal_filter(
+    owner: Optional[str] = None,
+    chunk_types: Optional[Tuple[str, ...]] = None,
+    report_type_implied: bool = False
+) -> Dict[str, Any]:
+    """
+    날짜 조건 없이 기본 조건 + owner/chunk_type만으로 where 필터 구성
+    
+    (owner, chunk_types) 조합별로 캐시되어 같은 dict를 공유하므로 반환값을 수정하지 않아야 함
+    """
+    conditions = list(daily_base_conditions(report_type_implied))
+    if owner:
+        conditions.append({"owner": owner})
+    if chunk_types:
+        conditions.append({"chunk_type": {"$in": list(chunk_types)}})
+    return combine_where_conditions(conditions)
+
+
+@lru_cache(maxsize=128)
+def _compile_name_pattern(names: Tuple[str, ...]) -> "re.Pattern[str]":
+    """고객명 목록을 하나의 정규식 alternation으로 컴파일 (텍스트를 한 번만 스캔)"""
+    return re.compile("|".join(map(re.escape, names)))
+
+
+@dataclass(frozen=True)
 class SearchKeywords:
-    """추출된 검색 키워드"""
-    customer_names: List[str] = None
-    date_range: Optional[Dict[str, date]] = None
+    """추출된 검색 키워드 (불변 객체, 캐시된 인스턴스 공유 가능)"""
+    customer_names: Tuple[str, ...] = ()
+    date_range: Optional[Mapping[str, date]] = None
     single_date: Optional[str] = None
-    chunk_types: List[str] = None
+    chunk_types: Tuple[str, ...] = ()
     is_unresolved_query: bool = False
     is_statistical_query: bool = False
     
     def __post_init__(self):
-        if self.customer_names is None:
-            self.customer_names = []
-        if self.chunk_types is None:
-            self.chunk_types = []
+        # 날짜 범위는 복사본의 읽기 전용 뷰로 보관 (공유되는 캐시 인스턴스를 호출자가 수정하지 못하도록)
+        if self.date_range is not None and not isinstance(self.date_range, MappingProxyType):
+            object.__setattr__(self, "date_range", MappingProxyType(dict(self.date_range)))
 
 
 class QueryAnalyzer:
@@ -46,6 +210,8 @@ class QueryAnalyzer:
         """
         쿼리에서 검색 키워드 추출
         
+        동일한 (query, base_date, owner) 조합은 캐시된 결과를 반환합니다.
+        
         Args:
             query: 사용자 질문
             base_date: 기준 날짜 (상대적 날짜 계산용)
@@ -57,6 +223,18 @@ class QueryAnalyzer:
         if base_date is None:
             base_date = date.today()
         
+        return QueryAnalyzer._extract_cached(query, base_date.isoformat(), owner)
+    
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _extract_cached(
+        query: str,
+        base_date_iso: str,
+        owner: Optional[str]
+    ) -> SearchKeywords:
+        """extract_keywords의 캐시된 구현"""
+        base_date = date.fromisoformat(base_date_iso)
+        
         # 고객명 추출
         customer_names = extract_customer_names(query)
         
@@ -77,10 +255,10 @@ class QueryAnalyzer:
         is_statistical = QueryAnalyzer._is_statistical_query(query)
         
         return SearchKeywords(
-            customer_names=customer_names,
+            customer_names=tuple(customer_names),
             date_range=date_range,
             single_date=single_date,
-            chunk_types=chunk_types,
+            chunk_types=tuple(chunk_types),
             is_unresolved_query=is_unresolved,
             is_statistical_query=is_statistical
         )
@@ -224,7 +402,9 @@ class KeywordFilter:
     def build_where_filter(
         keywords: SearchKeywords,
         owner: Optional[str] = None,
-        base_date_range: Optional[Dict[str, date]] = None
+        base_date_range: Optional[Dict[str, date]] = None,
+        numeric_date_range: bool = False,
+        report_type_implied: bool = False
     ) -> Dict[str, Any]:
         """
         ChromaDB where 필터 조건 구성
@@ -233,17 +413,16 @@ class KeywordFilter:
             keywords: 추출된 키워드
             owner: 작성자 필터
             base_date_range: 기본 날짜 범위 (쿼리에서 추출되지 않은 경우)
+            numeric_date_range: 기간 필터를 date_num 정수 범위로 구성할지 여부
+            report_type_implied: True면 report_type 조건 생략 (이전 구조 청크가 없는 컬렉션)
             
         Returns:
             ChromaDB where 필터 딕셔너리
         """
         conditions = []
         
-        # 기본 조건: report_type, level
-        conditions.append({
-            "report_type": {"$in": ["daily", "weekly", "monthly"]}
-        })
-        conditions.append({"level": "daily"})
+        # 기본 조건: report_type(이전 구조 청크가 없으면 생략), level
+        conditions.extend(daily_base_conditions(report_type_implied))
         
         # 작성자 필터
         if owner:
@@ -254,41 +433,28 @@ class KeywordFilter:
         if keywords.single_date:
             conditions.append({"date": keywords.single_date})
         elif date_range:
-            start = date_range["start"]
-            end = date_range["end"]
-            date_list = []
-            current = start
-            while current <= end:
-                date_list.append(current.strftime("%Y-%m-%d"))
-                current += timedelta(days=1)
-            if date_list:
-                conditions.append({"date": {"$in": date_list}})
+            conditions.extend(date_range_conditions(
+                date_range["start"].isoformat(), date_range["end"].isoformat(), numeric_date_range
+            ))
         else:
             # 기본값: 최근 1년
             end_date = date.today()
             start_date = end_date - timedelta(days=365)
-            date_list = []
-            current = start_date
-            while current <= end_date:
-                date_list.append(current.strftime("%Y-%m-%d"))
-                current += timedelta(days=1)
-            if date_list:
-                conditions.append({"date": {"$in": date_list}})
+            conditions.extend(date_range_conditions(
+                start_date.isoformat(), end_date.isoformat(), numeric_date_range
+            ))
         
         # 청크 타입 필터
         if keywords.chunk_types:
             conditions.append({
-                "chunk_type": {"$in": keywords.chunk_types}
+                "chunk_type": {"$in": list(keywords.chunk_types)}
             })
         
         # 고객명 필터 (ChromaDB는 문자열 포함 검색을 직접 지원하지 않으므로,
         # 여기서는 조건만 준비하고, 실제 필터링은 검색 후 수행)
         
-        # 조건이 하나만 있으면 그대로, 여러개면 $and로 묶기
-        if len(conditions) == 1:
-            return conditions[0]
-        else:
-            return {"$and": conditions}
+        # 같은 필드 조건은 합치고, 조건이 하나만 있으면 그대로, 여러개면 $and로 묶기
+        return combine_where_conditions(conditions)
     
     @staticmethod
     def filter_by_customer(
@@ -308,16 +474,15 @@ class KeywordFilter:
         if not customer_names:
             return results
         
+        name_re = _compile_name_pattern(tuple(customer_names))
         filtered = []
         for result in results:
             # 텍스트나 메타데이터에서 고객명 확인
             text_lower = result.text.lower()
             metadata_customer = str(result.metadata.get("customer", "")).strip().lower()
             
-            for customer_name in customer_names:
-                if customer_name in text_lower or customer_name in metadata_customer:
-                    filtered.append(result)
-                    break
+            if name_re.search(text_lower) or name_re.search(metadata_customer):
+                filtered.append(result)
         
         return filtered
 
@@ -370,16 +535,22 @@ class HybridSearcher:
         # 1. Keyword Filter: where 조건 구성
         # 고객명이 있으면 날짜 필터 제거 (전체 기간 검색)
         effective_date_range = None if keywords.customer_names else base_date_range
+        report_type_implied = daily_chunks_have_report_type(self.collection)
         
         where_filter = KeywordFilter.build_where_filter(
             keywords=keywords,
             owner=owner,
-            base_date_range=effective_date_range
+            base_date_range=effective_date_range,
+            numeric_date_range=supports_numeric_date_range(self.collection),
+            report_type_implied=report_type_implied
         )
         
-        print(f"[DEBUG] 하이브리드 검색 시작: query='{query}'")
-        print(f"[DEBUG] 추출된 키워드: 고객명={keywords.customer_names}, 날짜범위={keywords.date_range}, 청크타입={keywords.chunk_types}")
-        print(f"[DEBUG] where 필터 (고객명 있으면 날짜 제외): {where_filter}")
+        logger.debug("하이브리드 검색 시작: query='%s'", query)
+        logger.debug(
+            "추출된 키워드: 고객명=%s, 날짜범위=%s, 청크타입=%s",
+            keywords.customer_names, keywords.date_range, keywords.chunk_types
+        )
+        logger.debug("where 필터 (고객명 있으면 날짜 제외): %s", where_filter)
         
         # 고객명이 추출된 경우: 메타데이터에서 직접 고객명 검색 (키워드 기반 필터링)
         customer_matched_chunk_ids = set()
@@ -390,82 +561,50 @@ class HybridSearcher:
             actual_customer_names = [name for name in keywords.customer_names if name not in excluded_words]
             
             if actual_customer_names:
-                print(f"[DEBUG] 고객명 키워드 기반 검색 시작: {actual_customer_names}")
-                
-                # 날짜 범위 설정
-                date_range = keywords.date_range or base_date_range
-                
-                # 기본 필터 조건
-                base_filter = {
-                    "$and": [
-                        {"report_type": {"$in": ["daily", "weekly", "monthly"]}},
-                        {"level": "daily"}
-                    ]
-                }
+                logger.debug("고객명 키워드 기반 검색 시작: %s", actual_customer_names)
                 
                 # 고객명 검색 시 날짜 필터 완전 제거 (모든 기간 검색)
                 # 고객명은 오래된 기록도 중요하므로 날짜 제한 없이 전체 검색
-                print(f"[DEBUG] 고객명 검색: 날짜 필터 제거, 전체 기간 검색 수행")
-                # 날짜 필터 추가하지 않음 (전체 검색)
-                
-                if owner:
-                    base_filter["$and"].append({"owner": owner})
-                
-                if keywords.chunk_types:
-                    base_filter["$and"].append({"chunk_type": {"$in": keywords.chunk_types}})
+                logger.debug("고객명 검색: 날짜 필터 제거, 전체 기간 검색 수행")
+                base_filter = _minimal_filter(owner, keywords.chunk_types, report_type_implied)
                 
-                # 고객명이 포함된 청크를 메타데이터에서 직접 검색
+                # 고객명 포함 여부는 ChromaDB where_document($contains)로 직접 필터링
+                # (customer 메타데이터는 청크 텍스트에서 추출되므로 본문 검색만으로 충분)
+                contains_conditions = [{"$contains": name} for name in actual_customer_names]
+                if len(contains_conditions) == 1:
+                    document_filter = contains_conditions[0]
+                else:
+                    document_filter = {"$or": contains_conditions}
+
                 try:
-                    # 필터 조건 내 모든 청크 가져오기
+                    # 매칭된 청크의 메타데이터만 가져오기 (문서 본문/임베딩은 이후 ids로 조회)
                     # ids는 기본 포함이므로 include에서 제외
                     all_chunks = self.collection.get(
                         where=base_filter,
+                        where_document=document_filter,
                         limit=50000,  # 더 큰 수로 증가
-                        include=["metadatas", "documents"]
+                        include=["metadatas"]
                     )
-                    
-                    print(f"[DEBUG] 고객명 검색: 전체 청크 {len(all_chunks.get('ids', [])) if all_chunks and all_chunks.get('ids') else 0}개 조회됨")
-                    
-                    # 고객명이 포함된 청크만 필터링
+
+
+                    # 매칭된 청크 ID와 발견된 날짜를 한 번의 순회로 수집
+                    dates_found = set()
                     if all_chunks and all_chunks.get("ids"):
                         ids = all_chunks.get("ids", [])
-                        metadatas = all_chunks.get("metadatas", [])
-                        documents = all_chunks.get("documents", [])
-                        
+                        metadatas = all_chunks.get("metadatas") or []
                         for idx in range(len(ids)):
-                            metadata = metadatas[idx] if idx < len(metadatas) else {}
-                            document_text = documents[idx] if idx < len(documents) else ""
-                            
-                            customer_field = str(metadata.get("customer", "")).strip()
-                            text_for_search = f"{customer_field} {document_text}".lower()
-                            
-                            # 고객명이 메타데이터나 텍스트에 포함된 경우
-                            for customer_name in actual_customer_names:
-                                if customer_name in text_for_search:
-                                    chunk_id = ids[idx]
-                                    customer_matched_chunk_ids.add(chunk_id)
-                                    break
-                    
-                    print(f"[DEBUG] 고객명 키워드 기반 검색: {len(customer_matched_chunk_ids)}개 청크 발견 (고객명: {actual_customer_names})")
+                            customer_matched_chunk_ids.add(ids[idx])
+                            date_str = metadatas[idx].get("date") if idx < len(metadatas) else None
+                            if date_str:
+                                dates_found.add(date_str)
                     
-                    # 발견된 날짜 확인
-                    if customer_matched_chunk_ids and all_chunks:
-                        dates_found = set()
-                        ids = all_chunks.get("ids", [])
-                        metadatas = all_chunks.get("metadatas", [])
-                        for chunk_id in customer_matched_chunk_ids:
-                            if chunk_id in ids:
-                                idx = ids.index(chunk_id)
-                                if idx < len(metadatas):
-                                    date_str = metadatas[idx].get("date", "")
-                                    if date_str:
-                                        dates_found.add(date_str)
-                        print(f"[DEBUG] 고객명 검색으로 발견된 날짜: {sorted(dates_found)}")
+                    logger.debug(
+                        "고객명 키워드 기반 검색: %d개 청크, %d개 날짜 발견 (고객명: %s)",
+                        len(customer_matched_chunk_ids), len(dates_found), actual_customer_names
+                    )
                     
                 except Exception as e:
-                    print(f"[WARNING] 고객명 직접 검색 실패: {e}")
-                    import traceback
-                    traceback.print_exc()
+                    logger.warning("고객명 직접 검색 실패: %s", e, exc_info=True)
                     customer_matched_chunk_ids = set()
         
         # 2. Vector Search: 필터된 문서에 대해 벡터 검색
@@ -473,39 +612,41 @@ class HybridSearcher:
         
         # 검색 결과 개수 결정: 고객명이 있으면 최대한 많이 가져오기 (모든 날짜 포함)
         n_results_for_query = max(top_k * 50 if keywords.customer_names else top_k * 5, 500)
-        print(f"[DEBUG] 벡터 검색: n_results={n_results_for_query} (고객명 질의: 더 많이 검색)")
+        logger.debug("벡터 검색: n_results=%d (고객명 질의: 더 많이 검색)", n_results_for_query)
         
         # 고객명으로 직접 찾은 청크가 있으면, 그 청크들만 대상으로 벡터 검색
         if customer_matched_chunk_ids:
             # 고객명으로 찾은 청크들을 직접 결과로 사용
             try:
+                # 임베딩은 캐시 미스 청크만 _get_normalized_embeddings에서 따로 조회
                 customer_chunks = self.collection.get(
                     ids=list(customer_matched_chunk_ids),
-                    include=["metadatas", "documents", "embeddings"]
+                    include=["metadatas", "documents"]
                 )
                 
                 # 고객명 매칭 청크들을 UnifiedSearchResult로 변환
                 search_results_from_customer = []
                 if customer_chunks and customer_chunks.get("ids"):
-                    query_embedding = self.embedding_service.embed_text(query)
-                    
-                    # 각 청크의 임베딩과 쿼리 임베딩 간 유사도 계산
-                    for idx, chunk_id in enumerate(customer_chunks.get("ids", [])):
-                        chunk_embedding = customer_chunks.get("embeddings", [])[idx] if customer_chunks.get("embeddings") else None
-                        document_text = customer_chunks.get("documents", [])[idx] if idx < len(customer_chunks.get("documents", [])) else ""
-                        metadata = customer_chunks.get("metadatas", [])[idx] if idx < len(customer_chunks.get("metadatas", [])) else {}
-                        
-                        # 유사도 계산 (임베딩이 있는 경우)
-                        if chunk_embedding:
-                            # 코사인 유사도 계산
-                            query_vec = np.array(query_embedding)
-                            chunk_vec = np.array(chunk_embedding)
-                            similarity = np.dot(query_vec, chunk_vec) / (np.linalg.norm(query_vec) * np.linalg.norm(chunk_vec))
-                            score = float(similarity)
-                        else:
-                            # 임베딩이 없으면 기본 점수
-                            score = 1.0
-                        
+                    chunk_ids = customer_chunks.get("ids", [])
+                    documents = customer_chunks.get("documents") or []
+                    metadatas = customer_chunks.get("metadatas") or []
+
+                    # 유사도 계산: 정규화된 float32 임베딩 행렬과 쿼리 벡터의 내적 (코사인 유사도, BLAS 경로)
+                    # (임베딩이 없으면 기본 점수 1.0)
+                    scores = [1.0] * len(chunk_ids)
+                    chunk_matrix = _get_normalized_embeddings(self.collection, chunk_ids, documents)
+                    if chunk_matrix is not None:
+                        query_vec = np.asarray(query_embedding, dtype=np.float32)
+                        query_norm = np.linalg.norm(query_vec)
+                        if query_norm > 0:
+                            query_vec = query_vec / query_norm
+                        scores = (chunk_matrix @ query_vec).tolist()
+
+                    for idx, chunk_id in enumerate(chunk_ids):
+                        document_text = documents[idx] if idx < len(documents) else ""
+                        metadata = metadatas[idx] if idx < len(metadatas) else {}
+                        score = scores[idx]
+
                         search_results_from_customer.append(
                             UnifiedSearchResult(
                                 chunk_id=chunk_id,
@@ -519,35 +660,29 @@ class HybridSearcher:
                         )
                     
                     # 유사도 기준 정렬
-                    search_results_from_customer.sort(key=lambda r: -r.score)
-                    print(f"[DEBUG] 고객명 직접 검색 결과: {len(search_results_from_customer)}개 청크, 유사도 계산 완료")
+                    search_results_from_customer.sort(key=attrgetter("score"), reverse=True)
+                    logger.debug("고객명 직접 검색 결과: %d개 청크, 유사도 계산 완료", len(search_results_from_customer))
                     
             except Exception as e:
-                print(f"[WARNING] 고객명 청크 유사도 계산 실패: {e}")
+                logger.warning("고객명 청크 유사도 계산 실패: %s", e)
                 search_results_from_customer = []
                 customer_matched_chunk_ids = set()
         
         # 고객명으로 직접 찾은 결과가 있으면 우선 사용
         if customer_matched_chunk_ids and search_results_from_customer:
             # 고객명 직접 검색 결과를 우선 사용
-            print(f"[DEBUG] 고객명 직접 검색 결과 우선 사용: {len(search_results_from_customer)}개")
-            
-            # "모든 날짜" 요청인지 확인 ("다", "모두", "전부", "전체", "모든" 키워드)
-            query_lower = query.lower()
-            all_date_keywords = ["다", "모두", "전부", "전체", "모든", "일체", "모두", "전체다", "다알려줘", "다알려", "전부알려줘"]
-            is_all_dates_query = any(keyword in query_lower for keyword in all_date_keywords)
+            logger.debug("고객명 직접 검색 결과 우선 사용: %d개", len(search_results_from_customer))
             
             # 고객명 질의는 항상 모든 결과 반환 (날짜 누락 방지)
-            print(f"[DEBUG] 고객명 직접 검색 결과: 모든 결과 반환 ({len(search_results_from_customer)}개)")
             final_results = search_results_from_customer
             
-            # 날짜별로 그룹화하여 모든 날짜가 포함되었는지 확인
-            dates_found = set()
-            for result in final_results:
-                date_str = result.metadata.get("date", "")
-                if date_str:
-                    dates_found.add(date_str)
-            print(f"[DEBUG] 최종 검색 결과 (고객명 직접 검색): {len(final_results)}개 청크, {len(dates_found)}개 날짜 발견: {sorted(dates_found)}")
+            # 날짜별로 그룹화하여 모든 날짜가 포함되었는지 확인 (디버그 로그 전용)
+            if logger.isEnabledFor(logging.DEBUG):
+                dates_found = {result.metadata.get("date") for result in final_results} - {None, ""}
+                logger.debug(
+                    "최종 검색 결과 (고객명 직접 검색): %d개 청크, %d개 날짜 발견",
+                    len(final_results), len(dates_found)
+                )
             
             return final_results
         
@@ -557,53 +692,45 @@ class HybridSearcher:
             results = self.collection.query(
                 query_embeddings=[query_embedding],
                 n_results=n_results_for_query,
-                where=where_filter
+                where=where_filter,
+                include=QUERY_INCLUDE
             )
         except Exception as e:
-            print(f"[ERROR] ChromaDB query 실패: {e}")
+            logger.error("ChromaDB query 실패: %s", e)
             results = None
         
         # 검색 결과가 없으면 필터를 완화하여 재검색 시도
         if not results or not results.get('ids') or len(results['ids'][0]) == 0:
-            print(f"[DEBUG] 초기 검색 결과 없음, 필터 완화하여 재검색 시도...")
+            logger.debug("초기 검색 결과 없음, 필터 완화하여 재검색 시도...")
             
             # 1차 재시도: 날짜 필터만 제거
-            simplified_filter = KeywordFilter.build_where_filter(
-                keywords=SearchKeywords(chunk_types=keywords.chunk_types),
-                owner=owner,
-                base_date_range=None  # 날짜 범위 제거
-            )
+            simplified_filter = _minimal_filter(owner, keywords.chunk_types, report_type_implied)
             
             try:
                 results = self.collection.query(
                     query_embeddings=[query_embedding],
                     n_results=n_results_for_query * 2,
-                    where=simplified_filter
+                    where=simplified_filter,
+                    include=QUERY_INCLUDE
                 )
                 
                 # 여전히 결과가 없으면 2차 재시도: 최소 필터만 사용
                 if not results or not results.get('ids') or len(results['ids'][0]) == 0:
-                    print(f"[DEBUG] 1차 재검색도 결과 없음, 최소 필터로 재검색 시도...")
-                    minimal_filter = {
-                        "$and": [
-                            {"report_type": {"$in": ["daily", "weekly", "monthly"]}},
-                            {"level": "daily"}
-                        ]
-                    }
-                    if owner:
-                        minimal_filter["$and"].append({"owner": owner})
+                    logger.debug("1차 재검색도 결과 없음, 최소 필터로 재검색 시도...")
+                    minimal_filter = _minimal_filter(owner, report_type_implied=report_type_implied)
                     
                     results = self.collection.query(
                         query_embeddings=[query_embedding],
                         n_results=n_results_for_query * 3,
-                        where=minimal_filter
+                        where=minimal_filter,
+                        include=QUERY_INCLUDE
                     )
-                    print(f"[DEBUG] 최소 필터 재검색: {len(results.get('ids', [[]])[0]) if results and results.get('ids') else 0}개 발견")
+                    logger.debug("최소 필터 재검색: %d개 발견", len(results.get('ids', [[]])[0]) if results and results.get('ids') else 0)
                 else:
-                    print(f"[DEBUG] 1차 재검색 성공: {len(results.get('ids', [[]])[0]) if results and results.get('ids') else 0}개 발견")
+                    logger.debug("1차 재검색 성공: %d개 발견", len(results.get('ids', [[]])[0]))
                     
             except Exception as e2:
-                print(f"[WARNING] 재검색 실패: {e2}")
+                logger.warning("재검색 실패: %s", e2)
                 return []
         
         # 3. 검색 결과 변환
@@ -612,17 +739,17 @@ class HybridSearcher:
         if results and results.get('ids') and len(results['ids']) > 0:
             initial_result_count = len(results['ids'][0])
         
-        print(f"[DEBUG] ChromaDB 검색 결과: {initial_result_count}개 발견")
+        logger.debug("ChromaDB 검색 결과: %d개 발견", initial_result_count)
         
         if results and results.get('ids') and len(results['ids']) > 0:
             ids = results['ids'][0]
             documents = results['documents'][0]
             metadatas = results['metadatas'][0]
-            distances = results['distances'][0]
+            # 거리를 유사도 점수로 변환 (한 번에 벡터 연산)
+            scores = distances_to_scores(results['distances'][0])
             
             for i in range(len(ids)):
-                # 거리를 유사도 점수로 변환
-                score = 1.0 / (1.0 + distances[i])
+                score = scores[i]
                 
                 search_results.append(
                     UnifiedSearchResult(
@@ -649,6 +776,8 @@ class HybridSearcher:
             actual_customer_names = [name for name in keywords.customer_names if name not in excluded_words]
             
             if actual_customer_names:
+                name_re = _compile_name_pattern(tuple(actual_customer_names))
+                
                 # 고객명 필터링 전에 모든 결과를 확인
                 filtered_by_customer = []
                 for result in search_results:
@@ -656,31 +785,30 @@ class HybridSearcher:
                     metadata_customer = str(result.metadata.get("customer", "")).strip().lower()
                     
                     # 고객명이 텍스트나 메타데이터에 포함된 경우
-                    for customer_name in actual_customer_names:
-                        if customer_name in text_lower or customer_name in metadata_customer:
-                            filtered_by_customer.append(result)
-                            break
+                    if name_re.search(text_lower) or name_re.search(metadata_customer):
+                        filtered_by_customer.append(result)
                 
-                print(f"[DEBUG] 고객명 필터링: 원본 {len(search_results)}개 → 필터링 후 {len(filtered_by_customer)}개 (고객명: {actual_customer_names})")
+                logger.debug(
+                    "고객명 필터링: 원본 %d개 → 필터링 후 %d개 (고객명: %s)",
+                    len(search_results), len(filtered_by_customer), actual_customer_names
+                )
                 
                 # 고객명 필터링 결과가 있으면 사용, 없어도 최소한 원본 결과에서 고객명 포함된 항목 우선 정렬
                 if len(filtered_by_customer) > 0:
                     search_results = filtered_by_customer
                 else:
-                    print(f"[WARNING] 고객명 '{actual_customer_names}' 매칭 결과 없음")
+                    logger.warning("고객명 '%s' 매칭 결과 없음", actual_customer_names)
                     # 원본 결과를 사용하되, 고객명이 포함된 항목을 우선 정렬
                     customer_partial_match = []
                     other_results = []
                     for result in search_results:
-                        text_lower = result.text.lower()
-                        has_partial = any(name in text_lower for name in actual_customer_names)
-                        if has_partial:
+                        if name_re.search(result.text.lower()):
                             customer_partial_match.append(result)
                         else:
                             other_results.append(result)
                     search_results = customer_partial_match + other_results
             else:
-                print(f"[DEBUG] 실제 고객명 없음 (모두 제외 단어), 필터링 건너뜀")
+                logger.debug("실제 고객명 없음 (모두 제외 단어), 필터링 건너뜀")
         
         # 5. Relevance 기준 정렬 및 top_k 적용
         # 고객명이 포함된 경우 우선 정렬
@@ -690,6 +818,7 @@ class HybridSearcher:
             actual_customer_names = [name for name in keywords.customer_names if name not in excluded_words]
             
             if actual_customer_names:
+                name_re = _compile_name_pattern(tuple(actual_customer_names))
                 customer_matched = []
                 customer_unmatched = []
                 
@@ -698,25 +827,23 @@ class HybridSearcher:
                     metadata_customer = str(result.metadata.get("customer", "")).strip().lower()
                     
                     # 실제 고객명만으로 매칭 확인
-                    is_matched = any(
-                        customer_name in text_lower or customer_name in metadata_customer
-                        for customer_name in actual_customer_names
-                    )
-                    
-                    if is_matched:
+                    if name_re.search(text_lower) or name_re.search(metadata_customer):
                         customer_matched.append(result)
                     else:
                         customer_unmatched.append(result)
                 
                 # 고객명 매칭 결과를 먼저 정렬 (relevance 높은 순)
-                customer_matched.sort(key=lambda r: -r.score)
-                customer_unmatched.sort(key=lambda r: -r.score)
+                customer_matched.sort(key=attrgetter("score"), reverse=True)
+                customer_unmatched.sort(key=attrgetter("score"), reverse=True)
                 
                 search_results = customer_matched + customer_unmatched
-                print(f"[DEBUG] 고객명 매칭: {len(customer_matched)}개 (고객명: {actual_customer_names}), 전체: {len(search_results)}개")
+                logger.debug(
+                    "고객명 매칭: %d개 (고객명: %s), 전체: %d개",
+                    len(customer_matched), actual_customer_names, len(search_results)
+                )
         
         # relevance 기준 정렬
-        search_results.sort(key=lambda r: -r.score)
+        search_results.sort(key=attrgetter("score"), reverse=True)
         
         # 6. 쿼리 키워드 매칭 강화 (특정 키워드가 포함된 결과 우선 정렬)
         # "연금", "상담" 같은 키워드가 포함된 결과를 우선 정렬
@@ -737,59 +864,40 @@ class HybridSearcher:
         if meaningful_keywords:
             keyword_matched = []
             keyword_unmatched = []
+            keywords_lower = [keyword.lower() for keyword in meaningful_keywords]
             
+            # search_results는 바로 위에서 relevance 순으로 정렬되어 있으므로
+            # 순서를 유지한 채 나누기만 하면 각 그룹도 relevance 순 (재정렬 불필요)
             for result in search_results:
                 text_lower = result.text.lower()
                 # 의미 있는 키워드가 텍스트에 포함되어 있는지 확인
-                has_keyword = any(
-                    keyword.lower() in text_lower 
-                    for keyword in meaningful_keywords
-                )
-                
-                if has_keyword:
-                    keyword_matched.append(result)
-                else:
-                    keyword_unmatched.append(result)
-            
-            # 키워드 매칭 결과를 먼저 정렬
-            keyword_matched.sort(key=lambda r: -r.score)
-            keyword_unmatched.sort(key=lambda r: -r.score)
+                has_keyword = any(keyword in text_lower for keyword in keywords_lower)
+                (keyword_matched if has_keyword else keyword_unmatched).append(result)
             
             search_results = keyword_matched + keyword_unmatched
-            print(f"[DEBUG] 키워드 매칭: {len(keyword_matched)}개 (키워드: {meaningful_keywords}), 전체: {len(search_results)}개")
+            logger.debug(
+                "키워드 매칭: %d개 (키워드: %s), 전체: %d개",
+                len(keyword_matched), meaningful_keywords, len(search_results)
+            )
         
         # 7. Top-k 적용
-        # 비교/통계/고객명 질의는 모든 결과 반환 (정확한 수치 계산을 위해)
-        query_lower = query.lower()
-        all_date_keywords = ["다", "모두", "전부", "전체", "모든", "일체", "전체다", "다알려줘", "다알려", "전부알려줘", "알려줘"]
-        comparison_keywords = ["비교", "비율", "차이", "변화", "증가", "감소", "늘어", "줄어", "대비", "대조"]
-        statistical_keywords = ["가장", "많이", "몰린", "많은", "통계", "집계", "건수"]
-        
-        is_all_dates_query = any(keyword in query_lower for keyword in all_date_keywords)
-        is_comparison_query = any(keyword in query_lower for keyword in comparison_keywords)
-        is_statistical_query = any(keyword in query_lower for keyword in statistical_keywords)
-        requires_all_data = is_comparison_query or is_statistical_query or keywords.is_statistical_query
-        
-        # 고객명 질의, 비교/통계 질의, 모든 날짜 요청인 경우 모든 결과 반환
+        # 비교/통계/고객명/모든 날짜 질의는 모든 결과 반환 (정확한 수치 계산을 위해)
+        # 고객명 질의나 통계 질의로 이미 결정되면 키워드 스캔 생략
         if keywords.customer_names:
-            print(f"[DEBUG] 고객명 질의: 모든 결과 반환 ({len(search_results)}개 청크)")
-            final_results = search_results
-        elif requires_all_data:
-            print(f"[DEBUG] 비교/통계 질의: 모든 결과 반환 ({len(search_results)}개 청크)")
-            final_results = search_results
-        elif is_all_dates_query:
-            # 고객명 없지만 모든 날짜 요청: 모든 결과 반환
-            print(f"[DEBUG] '모든 날짜' 요청: top_k 제한 제거, 모든 결과 반환 ({len(search_results)}개)")
+            mask = MASK_CUSTOMER
+        elif keywords.is_statistical_query:
+            mask = MASK_STATISTICAL
+        else:
+            mask = _classify_query(query.lower())
+        
+        if mask & _RETURN_ALL_MASK:
+            logger.debug("모든 결과 반환 (질의 분류 mask=%d, %d개 청크)", mask, len(search_results))
             final_results = search_results
         else:
             final_results = search_results[:top_k]
         
-        # 날짜별로 그룹화하여 모든 날짜가 포함되었는지 확인
-        dates_found = set()
-        for result in final_results:
-            date_str = result.metadata.get("date", "")
-            if date_str:
-                dates_found.add(date_str)
-        
-        print(f"[DEBUG] 최종 검색 결과: {len(final_results)}개 청크, {len(dates_found)}개 날짜 발견: {sorted(dates_found)}")
+        # 날짜별로 그룹화하여 모든 날짜가 포함되었는지 확인 (디버그 로그 전용)
+        if logger.isEnabledFor(logging.DEBUG):
+            dates_found = {result.metadata.get("date") for result in final_results} - {None, ""}
+            logger.debug("최종 검색 결과: %d개 청크, %d개 날짜 발견", len(final_results), len(dates_found))
         return final_results
@@ -2,15 +2,38 @@
 Intent Router
 
 LLM을 사용하여 사용자 질의의 의도를 분석하고 라우팅합니다.
+UnifiedSearchService 전용이며, 현재 API 요청 경로에서는 생성되지 않습니다.
 
 Author: AI Assistant
 Created: 2025-11-18
 """
-from typing import Literal, Optional
+from typing import Literal, Optional, List, Tuple
+from collections import OrderedDict
 from pydantic import BaseModel, Field
-import openai
+from threading import Lock
+import numpy as np
 import json
+import logging
 import os
+import re
+import time
+
+from app.llm.client import get_openai_client
+from ingestion.embed import get_embedding_service
+
+logger = logging.getLogger(__name__)
+
+# 숫자·날짜 표현이 있는 질의는 의미 캐시를 쓰지 않음
+# ("11월 둘째 주 고객 미팅" / "11월 셋째 주 고객 미팅"처럼 임베딩은 거의 같아도 기간 필터가 달라야 함)
+_DATE_HINT_RE = re.compile(
+    r"\d|어제|오늘|내일|그제|그저께|모레|지난|이번|다음|작년|올해|내년|금년|전년"
+    r"|첫째|둘째|셋째|넷째|다섯째|마지막|주차|분기|상반기|하반기|[월화수목금토일]요일"
+)
+
+
+def _has_date_hint(normalized: str) -> bool:
+    """질의에 숫자나 날짜 표현이 있는지 여부"""
+    return _DATE_HINT_RE.search(normalized) is not None
 
 
 class QueryIntent(BaseModel):
@@ -26,6 +49,13 @@ class QueryIntent(BaseModel):
 class IntentRouter:
     """LLM 기반 Intent Router"""
     
+    # 캐시 설정
+    CACHE_MAX_SIZE = 1024
+    CACHE_TTL_SECONDS = 3600
+    SEMANTIC_THRESHOLD = 0.95
+    # 의미 캐시는 캐시 미스마다 임베딩 호출이 하나 더 붙으므로 기본 비활성 (INTENT_SEMANTIC_CACHE=true로 사용)
+    SEMANTIC_CACHE_ENABLED = os.getenv("INTENT_SEMANTIC_CACHE", "false").lower() == "true"
+    
     SYSTEM_PROMPT = """당신은 사용자의 질의를 분석하여 적절한 문서 타입으로 라우팅하는 AI 어시스턴트입니다.
 
 사용자의 질문을 분석하여 다음 중 하나의 의도(intent)로 분류하세요:
@@ -66,6 +96,10 @@ class IntentRouter:
 }
 """
     
+    # 시스템 메시지는 호출마다 바이트 단위로 동일해야 OpenAI 자동 prefix 캐시가 적중함
+    # (동적인 값은 모두 user 메시지에만 넣을 것)
+    SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+    
     def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4o-mini"):
         """
         초기화
@@ -76,73 +110,141 @@ class IntentRouter:
         """
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         self.model = model
-        self.client = openai.OpenAI(api_key=self.api_key)
+        self.client = get_openai_client(self.api_key)
+        
+        # 2단계 캐시: 정규화된 질의 문자열 → (저장 시각, 의도)
+        self._exact_cache: "OrderedDict[str, Tuple[float, QueryIntent]]" = OrderedDict()
+        # 의미 캐시: (저장 시각, 정규화된 질의 임베딩, 의도)
+        self._embed_cache: List[Tuple[float, np.ndarray, QueryIntent]] = []
+        # route()는 asyncio.to_thread로 여러 스레드에서 동시에 호출되므로 캐시 변경은 잠금 안에서만
+        self._cache_lock = Lock()
     
     def route(self, query: str) -> QueryIntent:
         """
         질의 의도 분석 및 라우팅
         
+        정확히 같은 질의(정규화 기준)는 캐시된 결과를 반환하고 LLM 호출을 생략합니다.
+        의미 캐시가 켜져 있으면 숫자·날짜 표현이 없는 질의에 한해, 의미적으로 거의 같은
+        질의의 의도(intent)만 재사용합니다 (filters는 다른 질의의 것이므로 재사용하지 않음).
+        
         Args:
             query: 사용자 질의
             
         Returns:
             QueryIntent 객체
         """
+        normalized = query.strip().lower()
+        now = time.monotonic()
+        
+        # 1. 정확 일치 캐시
+        with self._cache_lock:
+            self._evict_expired(now)
+            cached = self._exact_cache.get(normalized)
+            if cached is not None:
+                if now - cached[0] < self.CACHE_TTL_SECONDS:
+                    self._exact_cache.move_to_end(normalized)
+                    return cached[1]
+                del self._exact_cache[normalized]
+        
+        # 2. 의미 캐시 (임베딩 코사인 유사도, 날짜 표현이 있는 질의는 제외)
+        query_vec = None
+        if self.SEMANTIC_CACHE_ENABLED and not _has_date_hint(normalized):
+            query_vec = self._embed_query(normalized)
+        if query_vec is not None:
+            with self._cache_lock:
+                best_intent = None
+                if self._embed_cache:
+                    matrix = np.stack([vec for _, vec, _ in self._embed_cache])
+                    scores = matrix @ query_vec
+                    best = int(np.argmax(scores))
+                    if scores[best] >= self.SEMANTIC_THRESHOLD:
+                        best_intent = self._embed_cache[best][2]
+            if best_intent is not None:
+                return QueryIntent(
+                    intent=best_intent.intent,
+                    reason=f"유사 질의 캐시 재사용: {best_intent.reason}",
+                    filters={}
+                )
+        
+        # 3. LLM 호출
+        intent = self._route_with_llm(query)
+        
+        # 오류/미분류 결과는 캐시하지 않음
+        if intent.intent != "unknown":
+            with self._cache_lock:
+                self._store_exact(normalized, intent, now)
+                if query_vec is not None:
+                    self._embed_cache.append((now, query_vec, intent))
+                    if len(self._embed_cache) > self.CACHE_MAX_SIZE:
+                        self._embed_cache.pop(0)
+        
+        return intent
+    
+    def _evict_expired(self, now: float) -> None:
+        """TTL이 지난 의미 캐시 항목 제거 (정확 일치 캐시는 조회 시 만료 확인, _cache_lock을 잡은 상태에서 호출)"""
+        expire_before = now - self.CACHE_TTL_SECONDS
+        if self._embed_cache and self._embed_cache[0][0] < expire_before:
+            self._embed_cache = [entry for entry in self._embed_cache if entry[0] >= expire_before]
+    
+    def _store_exact(self, normalized: str, intent: QueryIntent, now: float) -> None:
+        """정확 일치 캐시에 저장 (LRU, _cache_lock을 잡은 상태에서 호출)"""
+        self._exact_cache[normalized] = (now, intent)
+        self._exact_cache.move_to_end(normalized)
+        if len(self._exact_cache) > self.CACHE_MAX_SIZE:
+            self._exact_cache.popitem(last=False)
+    
+    def _embed_query(self, normalized: str) -> Optional[np.ndarray]:
+        """질의 임베딩 생성 (정규화된 벡터, 실패 시 None)"""
         try:
-            # LLM 호출
+            vec = np.asarray(get_embedding_service().embed_text(normalized), dtype=np.float32)
+        except Exception as e:
+            logger.warning("Intent 캐시 임베딩 실패: %s", e)
+            return None
+        norm = np.linalg.norm(vec)
+        if norm == 0:
+            return None
+        return vec / norm
+    
+    def _route_with_llm(self, query: str) -> QueryIntent:
+        """
+        LLM을 호출하여 질의 의도 분석
+        
+        Args:
+            query: 사용자 질의
+            
+        Returns:
+            QueryIntent 객체
+        """
+        try:
+            # LLM 호출 (JSON 모드: 항상 유효한 JSON 객체만 생성하므로 코드블록 제거/텍스트 fallback 불필요)
             response = self.client.chat.completions.create(
                 model=self.model,
                 messages=[
-                    {"role": "system", "content": self.SYSTEM_PROMPT},
+                    self.SYSTEM_MESSAGE,
                     {"role": "user", "content": f"질문: {query}"}
                 ],
                 temperature=0.1,
-                max_tokens=300
+                max_tokens=150,
+                response_format={"type": "json_object"}
             )
             
-            # 응답 파싱
-            content = response.choices[0].message.content.strip()
-            
-            # JSON 파싱 시도
-            try:
-                # JSON 블록 추출 (```json ... ``` 형식 처리)
-                if "```json" in content:
-                    content = content.split("```json")[1].split("```")[0].strip()
-                elif "```" in content:
-                    content = content.split("```")[1].split("```")[0].strip()
-                
-                result_dict = json.loads(content)
-                
-                return QueryIntent(
-                    intent=result_dict.get("intent", "unknown"),
-                    reason=result_dict.get("reason", ""),
-                    filters=result_dict.get("filters", {})
+            # prefix 캐시 적중 여부 확인용
+            usage = getattr(response, "usage", None)
+            details = getattr(usage, "prompt_tokens_details", None)
+            if details is not None:
+                logger.debug(
+                    "Intent 라우팅 prompt 토큰: %s (캐시 적중: %s)",
+                    usage.prompt_tokens, getattr(details, "cached_tokens", 0)
                 )
             
-            except json.JSONDecodeError:
-                # JSON 파싱 실패 시 텍스트에서 intent 추출 시도
-                content_lower = content.lower()
-                
-                if "daily" in content_lower:
-                    intent = "daily"
-                elif "weekly" in content_lower:
-                    intent = "weekly"
-                elif "monthly" in content_lower:
-                    intent = "monthly"
-                elif "kpi" in content_lower:
-                    intent = "kpi"
-                elif "template" in content_lower:
-                    intent = "template"
-                elif "mixed" in content_lower:
-                    intent = "mixed"
-                else:
-                    intent = "unknown"
-                
-                return QueryIntent(
-                    intent=intent,
-                    reason=content,
-                    filters={}
-                )
+            # 응답 파싱 (누락된 필드는 기본값, intent 값이 허용 범위를 벗어나면 예외 → unknown 처리)
+            result_dict = json.loads(response.choices[0].message.content)
+            
+            return QueryIntent(
+                intent=result_dict.get("intent", "unknown"),
+                reason=result_dict.get("reason", ""),
+                filters=result_dict.get("filters") or {}
+            )
         
         except Exception as e:
             print(f"❌ Intent 분석 오류: {e}")
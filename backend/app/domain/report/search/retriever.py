@@ -6,29 +6,367 @@ reports 컬렉션에서 doc_type별로 검색을 수행합니다.
 Author: AI Assistant
 Created: 2025-11-18
 """
-from typing import List, Optional, Dict, Any
-from datetime import date
-from pydantic import BaseModel, Field
+from typing import List, Optional, Dict, Any, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from functools import lru_cache
+from threading import Lock
 from chromadb import Collection
+import numpy as np
+import asyncio
+import hashlib
+import json
+import logging
 import os
+import time
+import weakref
 
+from app.core.config import settings
+from app.infrastructure.vector_store_report import get_report_vector_store
 from ingestion.embed import get_embedding_service
 
+logger = logging.getLogger(__name__)
 
-class UnifiedSearchResult(BaseModel):
-    """통합 검색 결과"""
-    chunk_id: str = Field(..., description="청크 ID")
-    doc_id: str = Field(..., description="문서 ID")
-    doc_type: str = Field(..., description="문서 타입")
-    chunk_type: str = Field(..., description="청크 타입")
-    text: str = Field(..., description="청크 텍스트")
-    score: float = Field(..., description="유사도 점수")
-    metadata: Dict[str, Any] = Field(default_factory=dict, description="전체 메타데이터")
+@lru_cache(maxsize=256)
+def build_date_list(period_start: str, period_end: str) -> Tuple[str, ...]:
+    """
+    기간 내 모든 날짜 문자열 목록 생성 (YYYY-MM-DD, 양 끝 포함)
+    
+    Args:
+        period_start: 시작 날짜 (YYYY-MM-DD)
+        period_end: 종료 날짜 (YYYY-MM-DD)
+        
+    Returns:
+        날짜 문자열 튜플 (주/월 범위가 반복되므로 캐시됨)
+    """
+    start = date.fromisoformat(period_start)
+    end = date.fromisoformat(period_end)
+    return tuple((start + timedelta(days=i)).isoformat() for i in range((end - start).days + 1))
+
+
+# 모든 일일보고서 청크 검색에 공통으로 적용되는 기본 조건 (요청마다 새로 만들지 않도록 공유)
+REPORT_TYPE_CONDITION: Dict[str, Any] = {"report_type": {"$in": ["daily", "weekly", "monthly"]}}
+DAILY_LEVEL_CONDITION: Dict[str, Any] = {"level": "daily"}
+
+# 어떤 청크와도 일치하지 않는 필터 (같은 필드 조건의 교집합이 비었을 때 사용)
+# Chroma는 빈 $in 목록을 거부하므로 항상 거짓인 조건(level = daily AND level != daily)으로 표현
+NO_MATCH_CONDITION: Dict[str, Any] = {"$and": [DAILY_LEVEL_CONDITION, {"level": {"$ne": "daily"}}]}
+
+# query()에서 받을 필드 (결과 변환에 쓰는 것만, 임베딩 벡터는 받지 않음)
+QUERY_INCLUDE: List[str] = ["documents", "metadatas", "distances"]
+
+
+def combine_where_conditions(conditions: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    단일 필드 조건 목록을 최소한의 Chroma where 필터로 결합
+    
+    Chroma where는 최상위에 키를 하나만 허용하므로 여러 필드를 평평한 dict로 합칠 수는 없음.
+    대신 같은 필드의 조건(등호/$in)은 하나의 조건으로 합쳐 술어 수를 줄이고,
+    조건이 하나뿐이면 $and 없이 그대로 반환함.
+    $in 목록이 비어 있거나 같은 필드 조건의 교집합이 비면 어떤 청크와도 일치할 수 없으므로
+    NO_MATCH_CONDITION을 반환함.
+    
+    Args:
+        conditions: {"필드": 값} 또는 {"필드": {"$in": [...]}} 형태의 조건 목록
+        
+    Returns:
+        Chroma where 필터 (조건이 없으면 None)
+    """
+    merged: Dict[str, Any] = {}
+    passthrough: List[Dict[str, Any]] = []
+    
+    for condition in conditions:
+        (key, value), = condition.items()
+        if key.startswith("$") or (isinstance(value, dict) and set(value) != {"$in"}):
+            # 논리 연산자나 $in 이외의 연산자는 합치지 않고 그대로 유지
+            passthrough.append(condition)
+            continue
+        
+        values = value["$in"] if isinstance(value, dict) else [value]
+        if key in merged:
+            # 같은 필드의 조건은 $and 의미이므로 교집합
+            allowed = set(values)
+            values = [v for v in merged[key] if v in allowed]
+        if not values:
+            # 빈 $in(처음 나온 조건 포함)이나 빈 교집합은 어떤 값과도 일치하지 않음
+            return NO_MATCH_CONDITION
+        merged[key] = values
+    
+    combined = [
+        {key: values[0]} if len(values) == 1 else {key: {"$in": values}}
+        for key, values in merged.items()
+    ] + passthrough
+    
+    if not combined:
+        return None
+    if len(combined) == 1:
+        return combined[0]
+    return {"$and": combined}
+
+
+def is_no_match_filter(where_filter: Optional[Dict[str, Any]]) -> bool:
+    """where 필터가 NO_MATCH_CONDITION인지 (Chroma 조회 없이 빈 결과를 반환해도 되는지)"""
+    return where_filter == NO_MATCH_CONDITION
+
+
+# 컬렉션별 일일보고서 청크 메타데이터 확인 결과 (프로세스당 한 번만 확인)
+# key: (컬렉션 이름, 확인 항목)
+_daily_schema_probes: Dict[Tuple[str, str], bool] = {}
+_daily_schema_probes_lock = Lock()
+
+
+def _all_daily_chunks_match(collection: Collection, probe: str, condition: Dict[str, Any]) -> bool:
+    """
+    컬렉션의 모든 일일보고서(level=daily) 청크가 condition을 만족하는지 확인
+    
+    결과는 (컬렉션, 확인 항목)별로 한 번만 조회해 캐시하며, 확인에 실패하면
+    기존 필터를 유지하는 쪽이 안전하므로 False를 반환합니다.
+    
+    Args:
+        collection: reports Collection 객체
+        probe: 확인 항목 이름 (캐시 키/로그용)
+        condition: 모든 일일보고서 청크가 만족해야 하는 where 조건
+        
+    Returns:
+        모든 일일보고서 청크가 조건을 만족하는지 여부
+    """
+    key = (collection.name, probe)
+    matched = _daily_schema_probes.get(key)
+    if matched is not None:
+        return matched
+    
+    with _daily_schema_probes_lock:
+        matched = _daily_schema_probes.get(key)
+        if matched is None:
+            try:
+                daily_ids = collection.get(where=DAILY_LEVEL_CONDITION, include=[])["ids"]
+                matched_ids = collection.get(
+                    where={"$and": [DAILY_LEVEL_CONDITION, condition]},
+                    include=[]
+                )["ids"]
+                matched = len(matched_ids) == len(daily_ids)
+            except Exception as e:
+                logger.warning("컬렉션 '%s' %s 확인 실패, 기존 필터 사용: %s", collection.name, probe, e)
+                matched = False
+            logger.info("컬렉션 '%s' 일일보고서 청크 %s 확인: %s", collection.name, probe, matched)
+            _daily_schema_probes[key] = matched
+    return matched
+
+
+def supports_numeric_date_range(collection: Collection) -> bool:
+    """
+    컬렉션의 모든 일일보고서 청크에 date_num(YYYYMMDD 정수) 메타데이터가 있는지 확인
+    
+    Chroma는 문자열 메타데이터에 $gte/$lte를 지원하지 않으므로 기간 검색은 날짜 목록 $in으로 했지만,
+    date_num이 모두 적재되어 있으면 정수 범위 조건 두 개로 대체할 수 있습니다.
+    date_num 도입 이전에 적재된 청크가 남아 있으면 누락을 막기 위해 False를 반환합니다.
+    
+    Args:
+        collection: reports Collection 객체
+        
+    Returns:
+        정수 범위 필터 사용 가능 여부
+    """
+    return _all_daily_chunks_match(collection, "date_num", {"date_num": {"$gte": 0}})
+
+
+def daily_chunks_have_report_type(collection: Collection) -> bool:
+    """
+    컬렉션의 모든 일일보고서 청크에 report_type 메타데이터가 있는지 확인
+    
+    REPORT_TYPE_CONDITION은 report_type이 없는 이전 구조 청크를 걸러내기 위한 조건이므로,
+    그런 청크가 남아 있지 않으면 level 조건만으로 같은 결과가 나와 후보마다 술어 하나를 줄일 수 있습니다.
+    
+    Args:
+        collection: reports Collection 객체
+        
+    Returns:
+        report_type 조건 생략 가능 여부
+    """
+    return _all_daily_chunks_match(collection, "report_type", REPORT_TYPE_CONDITION)
+
+
+def daily_base_conditions(report_type_implied: bool) -> Tuple[Dict[str, Any], ...]:
+    """
+    모든 일일보고서 청크 검색에 공통으로 적용되는 기본 조건
+    
+    Args:
+        report_type_implied: daily_chunks_have_report_type() 결과 (True면 report_type 조건 생략)
+        
+    Returns:
+        where 조건 튜플
+    """
+    if report_type_implied:
+        return (DAILY_LEVEL_CONDITION,)
+    return (REPORT_TYPE_CONDITION, DAILY_LEVEL_CONDITION)
+
+
+@lru_cache(maxsize=256)
+def date_range_conditions(
+    period_start: str,
+    period_end: str,
+    numeric_date_range: bool
+) -> Tuple[Dict[str, Any], ...]:
+    """
+    기간 검색용 where 조건 목록 생성
+    
+    기본 1년 범위처럼 같은 기간이 반복되므로 결과를 캐시합니다 (365개짜리 $in 목록을 매번 만들지 않음).
+    반환된 조건 dict는 여러 필터가 공유하므로 수정하지 않아야 합니다.
+    
+    Args:
+        period_start: 시작 날짜 (YYYY-MM-DD)
+        period_end: 종료 날짜 (YYYY-MM-DD)
+        numeric_date_range: True면 date_num 정수 범위, False면 date 문자열 목록 $in
+        
+    Returns:
+        where 조건 튜플 ($and로 결합할 단일 필드 조건들)
+    """
+    if numeric_date_range:
+        return (
+            {"date_num": {"$gte": int(period_start.replace("-", ""))}},
+            {"date_num": {"$lte": int(period_end.replace("-", ""))}}
+        )
+    
+    # ChromaDB는 날짜 문자열에 대해 $gte/$lte를 지원하지 않으므로 $in 사용
+    date_list = list(build_date_list(period_start, period_end))
+    if not date_list:
+        return ()
+    return ({"date": {"$in": date_list}},)
+
+
+def distances_to_scores(distances: List[float]) -> List[float]:
+    """
+    Chroma 거리 목록을 유사도 점수로 변환 (낮을수록 유사 → 높을수록 유사)
+    
+    Args:
+        distances: Chroma query 결과의 거리 목록
+        
+    Returns:
+        1 / (1 + distance) 점수 목록 (NumPy로 한 번에 계산)
+    """
+    return (1.0 / (1.0 + np.asarray(distances, dtype=np.float64))).tolist()
+
+
+# 쿼리 임베딩 캐시 (retriever가 요청마다 새로 생성되므로 모듈 레벨에서 공유)
+# key: (임베딩 모델 타입, 정규화된 쿼리의 blake2b 해시) -> (저장 시각, float32 임베딩)
+# 3072차원 임베딩을 파이썬 float 리스트로 들고 있으면 항목당 ~100KB이므로 float32 배열(12KB)로 저장
+QUERY_EMBEDDING_CACHE_MAX_SIZE = 4096
+QUERY_EMBEDDING_CACHE_TTL_SECONDS = 3600
+_query_embedding_cache: "OrderedDict[Tuple[str, bytes], Tuple[float, np.ndarray]]" = OrderedDict()
+_query_embedding_cache_lock = Lock()
+_query_embedding_cache_stats = {"hits": 0, "misses": 0}
+
+
+def _embedding_cache_key(model_type: str, query: str) -> Tuple[str, bytes]:
+    """
+    쿼리 임베딩 캐시 키 생성
+    
+    쿼리를 정규화(앞뒤 공백 제거, 연속 공백 축약, 소문자화)한 뒤 해시하므로
+    긴 쿼리도 고정 크기 키로 저장됩니다.
+    """
+    normalized = " ".join(query.split()).lower()
+    return (model_type, hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).digest())
+
+
+def _get_cached_embedding(key: Tuple[str, bytes]) -> Optional[List[float]]:
+    """캐시된 쿼리 임베딩 조회 (만료된 항목은 제거)"""
+    with _query_embedding_cache_lock:
+        entry = _query_embedding_cache.get(key)
+        if entry is None or time.monotonic() - entry[0] > QUERY_EMBEDDING_CACHE_TTL_SECONDS:
+            if entry is not None:
+                del _query_embedding_cache[key]
+            _query_embedding_cache_stats["misses"] += 1
+            return None
+        _query_embedding_cache.move_to_end(key)
+        _query_embedding_cache_stats["hits"] += 1
+        embedding = entry[1]
+    return embedding.tolist()
+
+
+def _store_cached_embedding(key: Tuple[str, bytes], embedding: List[float]) -> None:
+    """쿼리 임베딩 캐시 저장 (최대 크기 초과 시 가장 오래 사용되지 않은 항목 제거)"""
+    stored = np.asarray(embedding, dtype=np.float32)
+    with _query_embedding_cache_lock:
+        _query_embedding_cache[key] = (time.monotonic(), stored)
+        _query_embedding_cache.move_to_end(key)
+        while len(_query_embedding_cache) > QUERY_EMBEDDING_CACHE_MAX_SIZE:
+            _query_embedding_cache.popitem(last=False)
+
+
+@dataclass(slots=True)
+class UnifiedSearchResult:
+    """
+    통합 검색 결과
+    
+    Chroma에서 온 신뢰된 데이터를 담는 내부 객체이므로 검증 없는 slots dataclass로 정의
+    (청크마다 생성되므로 Pydantic 검증 비용을 피함)
+    """
+    chunk_id: str  # 청크 ID
+    doc_id: str  # 문서 ID
+    doc_type: str  # 문서 타입
+    chunk_type: str  # 청크 타입
+    text: str  # 청크 텍스트
+    score: float  # 유사도 점수
+    metadata: Dict[str, Any] = field(default_factory=dict)  # 전체 메타데이터
+
+
+def build_search_results(
+    ids: List[str],
+    documents: List[str],
+    metadatas: List[Dict[str, Any]],
+    scores: List[float]
+) -> List[UnifiedSearchResult]:
+    """
+    Chroma 결과 열(ids/documents/metadatas)과 점수 목록을 UnifiedSearchResult 리스트로 변환
+    
+    결과마다 메타데이터 dict를 세 번씩 조회하지 않도록 doc_id/doc_type/chunk_type 열을
+    먼저 뽑아낸 뒤 zip으로 한 번에 조립합니다.
+    
+    Args:
+        ids: 청크 ID 목록
+        documents: 청크 텍스트 목록
+        metadatas: 청크 메타데이터 목록
+        scores: 유사도 점수 목록
+        
+    Returns:
+        검색 결과 리스트
+    """
+    doc_ids = [m.get("doc_id", "") for m in metadatas]
+    doc_types = [m.get("doc_type", "") for m in metadatas]
+    chunk_types = [m.get("chunk_type", "") for m in metadatas]
+    
+    return [
+        UnifiedSearchResult(
+            chunk_id=chunk_id,
+            doc_id=doc_id,
+            doc_type=doc_type,
+            chunk_type=chunk_type,
+            text=document,
+            score=score,
+            metadata=metadata
+        )
+        for chunk_id, doc_id, doc_type, chunk_type, document, score, metadata in zip(
+            ids, doc_ids, doc_types, chunk_types, documents, scores, metadatas
+        )
+    ]
+
+
+# 비동기 배치 대기 중인 검색 요청: (query, where_filter, n_results, future)
+_PendingSearch = Tuple[str, Optional[Dict[str, Any]], int, asyncio.Future]
 
 
 class UnifiedRetriever:
     """Unified Documents Retriever"""
     
+    # 비동기 검색 요청을 모아서 한 번에 처리하는 대기 시간 (초)
+    BATCH_WINDOW_SECONDS = 0.01
+    # 디버그 로그용 컬렉션 문서 수 캐시 유효 시간 (초)
+    COUNT_CACHE_TTL_SECONDS = 30
+    # search_daily_multi에서 동시에 실행할 ChromaDB 검색 수
+    MULTI_SEARCH_MAX_WORKERS = 8
+    
     def __init__(
         self, 
         collection: Collection,
@@ -48,6 +386,15 @@ class UnifiedRetriever:
             api_key=openai_api_key,
             model_type=embedding_model_type
         )
+        
+        # 비동기 배치 대기열 (이벤트 루프별): loop -> (대기 요청 리스트, flush 태스크)
+        # 공유 인스턴스가 여러 이벤트 루프에서 쓰여도 다른 루프의 future/태스크가 섞이지 않도록 루프에 묶음
+        self._batches: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Tuple[List[_PendingSearch], asyncio.Task]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        
+        # 디버그 로그용 컬렉션 문서 수 캐시: (조회 시각, 문서 수)
+        self._count_cache: Optional[Tuple[float, int]] = None
     
     def search_daily(
         self,
@@ -57,6 +404,7 @@ class UnifiedRetriever:
         period_start: Optional[str] = None,
         period_end: Optional[str] = None,
         week: Optional[str] = None,
+        month: Optional[str] = None,
         n_results: int = 5,
         chunk_types: Optional[List[str]] = None,
         doc_ids: Optional[List[str]] = None
@@ -74,6 +422,7 @@ class UnifiedRetriever:
             period_start: 시작 날짜
             period_end: 종료 날짜
             week: ISO week 필터 (예: "2025-W01")
+            month: 월 필터 (예: "2025-11")
             n_results: 결과 개수
             chunk_types: 청크 타입 필터 (예: ["summary", "detail", "pending", "plan_note"])
                 - summary: 금일 진행 업무 요약
@@ -85,22 +434,114 @@ class UnifiedRetriever:
         Returns:
             검색 결과 리스트
         """
+        where_filter = self._build_daily_filter(
+            owner=owner,
+            single_date=single_date,
+            period_start=period_start,
+            period_end=period_end,
+            week=week,
+            month=month,
+            chunk_types=chunk_types,
+            doc_ids=doc_ids
+        )
+        
+        return self._execute_search(query, where_filter, n_results)
+    
+    async def asearch_daily(
+        self,
+        query: str,
+        owner: Optional[str] = None,
+        single_date: Optional[str] = None,
+        period_start: Optional[str] = None,
+        period_end: Optional[str] = None,
+        week: Optional[str] = None,
+        month: Optional[str] = None,
+        n_results: int = 5,
+        chunk_types: Optional[List[str]] = None,
+        doc_ids: Optional[List[str]] = None
+    ) -> List[UnifiedSearchResult]:
+        """
+        일일보고서 청크 검색 (비동기 버전)
+        
+        동시에 들어온 검색 요청은 임베딩/ChromaDB 질의를 묶어서 처리합니다.
+        인자는 search_daily와 동일합니다.
+        """
+        where_filter = self._build_daily_filter(
+            owner=owner,
+            single_date=single_date,
+            period_start=period_start,
+            period_end=period_end,
+            week=week,
+            month=month,
+            chunk_types=chunk_types,
+            doc_ids=doc_ids
+        )
+        
+        return await self._aexecute_search(query, where_filter, n_results)
+    
+    def _build_daily_filter(
+        self,
+        owner: Optional[str] = None,
+        single_date: Optional[str] = None,
+        period_start: Optional[str] = None,
+        period_end: Optional[str] = None,
+        week: Optional[str] = None,
+        month: Optional[str] = None,
+        chunk_types: Optional[List[str]] = None,
+        doc_ids: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        일일보고서 검색용 Chroma where 필터 구성 (인자는 search_daily와 동일)
+        
+        주간/월간 생성처럼 같은 인자 조합이 반복되므로 결과 필터를 캐시합니다.
+        반환된 필터는 여러 호출이 공유하므로 수정하지 않아야 합니다.
+        
+        Returns:
+            Chroma where 필터
+        """
+        return UnifiedRetriever._build_daily_filter_cached(
+            owner,
+            single_date,
+            period_start,
+            period_end,
+            week,
+            month,
+            tuple(chunk_types) if chunk_types else None,
+            tuple(doc_ids) if doc_ids else None,
+            supports_numeric_date_range(self.collection),
+            daily_chunks_have_report_type(self.collection)
+        )
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _build_daily_filter_cached(
+        owner: Optional[str],
+        single_date: Optional[str],
+        period_start: Optional[str],
+        period_end: Optional[str],
+        week: Optional[str],
+        month: Optional[str],
+        chunk_types: Optional[Tuple[str, ...]],
+        doc_ids: Optional[Tuple[str, ...]],
+        numeric_date_range: bool = False,
+        report_type_implied: bool = False
+    ) -> Dict[str, Any]:
+        """_build_daily_filter의 캐시 대상 구현 (리스트 인자는 튜플로 받음)"""
         # Chroma 필터는 $and를 사용해 복잡한 조건 구성
         conditions = []
         
-        # report_type 조건 (새로운 구조만 사용)
-        conditions.append({
-            "report_type": {"$in": ["daily", "weekly", "monthly"]}
-        })
+        # report_type 조건 (새로운 구조만 사용, 이전 구조 청크가 없으면 생략)
+        if not report_type_implied:
+            conditions.append(REPORT_TYPE_CONDITION)
         
         # doc_ids 필터 (날짜 범위 사전 필터링)
         if doc_ids:
-            conditions.append({"doc_id": {"$in": doc_ids}})
+            conditions.append({"doc_id": {"$in": list(doc_ids)}})
         
         # chunk_type 필터 (새로운 4청크 구조: summary, detail, pending, plan_note)
         if chunk_types:
             conditions.append({
-                "chunk_type": {"$in": chunk_types}
+                "chunk_type": {"$in": list(chunk_types)}
             })
         
         # owner 필터
@@ -111,10 +552,14 @@ class UnifiedRetriever:
         if week:
             conditions.append({"week": week})
         
+        # month 필터 (월 단위 조회는 날짜 목록 대신 등호 조건 하나로 처리)
+        if month:
+            conditions.append({"month": month})
+        
         # level 필터 (새로운 4청크 구조용)
         # 현재 일일보고서 검색만 지원 (level="daily")
         # 주간/월간 보고서 생성 시에도 일일보고서 청크만 사용하므로 이 필터로 충분
-        conditions.append({"level": "daily"})
+        conditions.append(DAILY_LEVEL_CONDITION)
         
         # 날짜 필터 (새로운 구조: date 필드만 사용)
         # doc_ids가 제공되면 날짜 필터는 생략 (이미 doc_ids로 필터링됨)
@@ -122,26 +567,79 @@ class UnifiedRetriever:
             if single_date:
                 conditions.append({"date": single_date})
             elif period_start and period_end:
-                # 일일보고서는 date 필드를 사용하므로, 기간 내 모든 날짜를 $in으로 검색
-                # ChromaDB는 날짜 문자열에 대해 $gte/$lte를 지원하지 않으므로 $in 사용
-                from datetime import datetime, timedelta
-                start = datetime.strptime(period_start, "%Y-%m-%d")
-                end = datetime.strptime(period_end, "%Y-%m-%d")
-                date_list = []
-                current = start
-                while current <= end:
-                    date_list.append(current.strftime("%Y-%m-%d"))
-                    current += timedelta(days=1)
-                # date 필드만 검색 (새로운 구조)
-                conditions.append({"date": {"$in": date_list}})
-        
-        # 조건이 하나만 있으면 그대로, 여러개면 $and로 묶기
-        if len(conditions) == 1:
-            where_filter = conditions[0]
-        else:
-            where_filter = {"$and": conditions}
+                # date_num이 모두 적재되어 있으면 정수 범위, 아니면 기간 내 모든 날짜를 $in으로 검색
+                conditions.extend(date_range_conditions(period_start, period_end, numeric_date_range))
         
-        return self._execute_search(query, where_filter, n_results)
+        # 같은 필드 조건은 합치고, 조건이 하나만 있으면 그대로, 여러개면 $and로 묶기
+        return combine_where_conditions(conditions)
+    
+    def fetch_daily(
+        self,
+        owner: Optional[str] = None,
+        single_date: Optional[str] = None,
+        period_start: Optional[str] = None,
+        period_end: Optional[str] = None,
+        week: Optional[str] = None,
+        month: Optional[str] = None,
+        limit: Optional[int] = None,
+        chunk_types: Optional[List[str]] = None,
+        doc_ids: Optional[List[str]] = None
+    ) -> List[UnifiedSearchResult]:
+        """
+        일일보고서 청크 필터 조회 (의미 검색 없음)
+        
+        search_daily와 같은 필터를 사용하되 쿼리 임베딩 없이 조건에 맞는 청크를 그대로 반환합니다.
+        인자는 search_daily와 동일하며, n_results 대신 limit을 받습니다.
+        """
+        where_filter = self._build_daily_filter(
+            owner=owner,
+            single_date=single_date,
+            period_start=period_start,
+            period_end=period_end,
+            week=week,
+            month=month,
+            chunk_types=chunk_types,
+            doc_ids=doc_ids
+        )
+        
+        return self.fetch_by_filter(where_filter, limit=limit)
+    
+    def fetch_by_filter(
+        self,
+        where_filter: Dict[str, Any],
+        limit: Optional[int] = None
+    ) -> List[UnifiedSearchResult]:
+        """
+        의미 검색 없이 where 필터에 맞는 청크를 그대로 조회
+        
+        주간 보고서처럼 필터(작성자 + 주차)에 맞는 청크 전체가 필요하고 순위가 의미 없는 경우,
+        쿼리 임베딩과 HNSW 탐색 없이 collection.get()만 수행합니다.
+        
+        Args:
+            where_filter: Chroma where 필터
+            limit: 최대 개수 (None이면 전체)
+            
+        Returns:
+            검색 결과 리스트 (score는 모두 1.0)
+        """
+        if is_no_match_filter(where_filter):
+            return []
+        
+        try:
+            results = self.collection.get(
+                where=where_filter or None,
+                limit=limit,
+                include=["documents", "metadatas"]
+            )
+        except Exception as e:
+            logger.error("Fetch error: %s", e)
+            return []
+        
+        ids = results.get("ids") or []
+        documents = results.get("documents") or []
+        metadatas = results.get("metadatas") or []
+        
+        return build_search_results(ids, documents, metadatas, [1.0] * len(ids))
     
     def search_kpi(
         self,
@@ -169,6 +667,19 @@ class UnifiedRetriever:
         
         return self._execute_search(query, where_filter, n_results)
     
+    async def asearch_kpi(
+        self,
+        query: str,
+        category: Optional[str] = None,
+        n_results: int = 5
+    ) -> List[UnifiedSearchResult]:
+        """
+        KPI 문서 검색 (비동기 버전, 인자는 search_kpi와 동일)
+        """
+        where_filter = self._build_doc_type_filter("kpi", {"kpi_category": category})
+        
+        return await self._aexecute_search(query, where_filter, n_results)
+    
     def search_template(
         self,
         query: str,
@@ -190,6 +701,16 @@ class UnifiedRetriever:
         
         return self._execute_search(query, where_filter, n_results)
     
+    async def asearch_template(
+        self,
+        query: str,
+        n_results: int = 3
+    ) -> List[UnifiedSearchResult]:
+        """
+        템플릿 문서 검색 (비동기 버전, 인자는 search_template과 동일)
+        """
+        return await self._aexecute_search(query, {"doc_type": "template"}, n_results)
+    
     def search_all(
         self,
         query: str,
@@ -207,6 +728,16 @@ class UnifiedRetriever:
         """
         return self._execute_search(query, {}, n_results)
     
+    async def asearch_all(
+        self,
+        query: str,
+        n_results: int = 10
+    ) -> List[UnifiedSearchResult]:
+        """
+        전체 문서 검색 (비동기 버전, 인자는 search_all과 동일)
+        """
+        return await self._aexecute_search(query, {}, n_results)
+    
     def search_by_doc_type(
         self,
         query: str,
@@ -226,14 +757,44 @@ class UnifiedRetriever:
         Returns:
             검색 결과 리스트
         """
-        where_filter = {"doc_type": doc_type}
+        where_filter = self._build_doc_type_filter(doc_type, filters)
+        
+        return self._execute_search(query, where_filter, n_results)
+    
+    async def asearch_by_doc_type(
+        self,
+        query: str,
+        doc_type: str,
+        n_results: int = 5,
+        **filters
+    ) -> List[UnifiedSearchResult]:
+        """
+        doc_type 지정 검색 (비동기 버전, 인자는 search_by_doc_type과 동일)
+        """
+        where_filter = self._build_doc_type_filter(doc_type, filters)
+        
+        return await self._aexecute_search(query, where_filter, n_results)
+    
+    @staticmethod
+    def _build_doc_type_filter(doc_type: str, filters: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        doc_type 지정 검색용 Chroma where 필터 구성
+        
+        Args:
+            doc_type: 문서 타입
+            filters: 추가 필터 (None 값은 무시)
+            
+        Returns:
+            Chroma where 필터 (여러 조건이면 $and로 묶음)
+        """
+        conditions = [{"doc_type": doc_type}]
         
         # None이 아닌 필터만 추가
         for key, value in filters.items():
             if value is not None:
-                where_filter[key] = value
+                conditions.append({key: value})
         
-        return self._execute_search(query, where_filter, n_results)
+        return combine_where_conditions(conditions)
     
     def _get_query_embedding(self, query: str) -> List[float]:
         """
@@ -245,11 +806,167 @@ class UnifiedRetriever:
         Returns:
             임베딩 벡터
         """
+        key = _embedding_cache_key(self.embedding_service.model_type, query)
+        cached = _get_cached_embedding(key)
+        if cached is not None:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "쿼리 임베딩 캐시 히트 (hits=%d, misses=%d, size=%d)",
+                    _query_embedding_cache_stats["hits"],
+                    _query_embedding_cache_stats["misses"],
+                    len(_query_embedding_cache),
+                )
+            return cached
+        
         try:
-            return self.embedding_service.embed_text(query)
+            embedding = self.embedding_service.embed_text(query)
         except Exception as e:
-            print(f"[ERROR] Embedding error: {e}")
+            logger.error("Embedding error: %s", e)
             raise
+        
+        _store_cached_embedding(key, embedding)
+        return embedding
+    
+    def _collection_count(self) -> int:
+        """
+        컬렉션 문서 수 (디버그 로그용, COUNT_CACHE_TTL_SECONDS 동안 캐시)
+        
+        persisted 컬렉션의 count()는 메타데이터 저장소를 조회하므로 검색마다 호출하지 않습니다.
+        """
+        now = time.monotonic()
+        if self._count_cache is None or now - self._count_cache[0] > self.COUNT_CACHE_TTL_SECONDS:
+            self._count_cache = (now, self.collection.count())
+        return self._count_cache[1]
+    
+    def _get_query_embeddings_batch(self, queries: List[str]) -> List[List[float]]:
+        """
+        여러 쿼리를 한 번의 임베딩 호출로 변환 (캐시 적용)
+        
+        캐시에 없는 쿼리만 모아 embed_texts 한 번(OpenAI는 input 리스트 1회 요청)으로 처리하고,
+        같은 쿼리가 여러 번 들어오면 한 번만 임베딩합니다.
+        
+        Args:
+            queries: 검색 쿼리 리스트
+            
+        Returns:
+            쿼리 순서대로의 임베딩 벡터 리스트
+        """
+        model_type = self.embedding_service.model_type
+        keys = [_embedding_cache_key(model_type, query) for query in queries]
+        embeddings: List[Optional[List[float]]] = [_get_cached_embedding(key) for key in keys]
+        
+        missing: Dict[Tuple[str, bytes], List[int]] = {}
+        for idx, emb in enumerate(embeddings):
+            if emb is None:
+                missing.setdefault(keys[idx], []).append(idx)
+        if missing:
+            try:
+                fresh = self.embedding_service.embed_texts(
+                    [queries[indices[0]] for indices in missing.values()]
+                )
+            except Exception as e:
+                logger.error("Embedding error: %s", e)
+                raise
+            for (key, indices), emb in zip(missing.items(), fresh):
+                _store_cached_embedding(key, emb)
+                for idx in indices:
+                    embeddings[idx] = emb
+        
+        return embeddings
+    
+    def search_many(
+        self,
+        queries: List[str],
+        where_filter: Optional[Dict[str, Any]] = None,
+        n_results: int = 5
+    ) -> List[List[UnifiedSearchResult]]:
+        """
+        여러 쿼리를 같은 필터로 한 번에 검색
+        
+        임베딩은 한 번의 배치 호출로, ChromaDB 검색은 여러 임베딩을 담은 한 번의 query()로 처리합니다.
+        
+        Args:
+            queries: 검색 쿼리 리스트
+            where_filter: Chroma where 필터 (None이면 전체)
+            n_results: 쿼리별 결과 개수
+            
+        Returns:
+            쿼리 순서대로의 검색 결과 리스트
+        """
+        if not queries:
+            return []
+        if is_no_match_filter(where_filter):
+            return [[] for _ in queries]
+        
+        try:
+            embeddings = self._get_query_embeddings_batch(queries)
+            results = self.collection.query(
+                query_embeddings=embeddings,
+                n_results=n_results,
+                where=where_filter or None,
+                include=QUERY_INCLUDE
+            )
+        except Exception as e:
+            logger.error("Search error: %s", e)
+            return [[] for _ in queries]
+        
+        return [self._to_search_results(results, row) for row in range(len(queries))]
+    
+    def search_daily_multi(
+        self,
+        searches: List[Dict[str, Any]],
+        n_results: int = 5
+    ) -> List[List[UnifiedSearchResult]]:
+        """
+        필터가 서로 다른 여러 일일보고서 검색을 동시에 수행
+        
+        날짜별 완료 여부 확인처럼 쿼리마다 필터가 다른 경우, 임베딩은 한 번의 배치 호출로 만들고
+        ChromaDB 검색은 스레드 풀에서 동시에 실행합니다
+        (Chroma 클라이언트는 네이티브 검색 중 GIL을 놓으므로 스레드로 병렬화됨).
+        모든 검색의 필터가 같으면 search_many로 넘겨 한 번의 query()로 처리합니다.
+        
+        Args:
+            searches: 검색별 search_daily 키워드 인자 (query 필수, 나머지는 필터 인자)
+            n_results: 검색별 결과 개수
+            
+        Returns:
+            searches 순서대로의 검색 결과 리스트
+        """
+        if not searches:
+            return []
+        
+        queries = [search["query"] for search in searches]
+        where_filters = [
+            self._build_daily_filter(**{k: v for k, v in search.items() if k != "query"})
+            for search in searches
+        ]
+        if all(where_filter == where_filters[0] for where_filter in where_filters[1:]):
+            return self.search_many(queries, where_filters[0], n_results)
+        
+        try:
+            embeddings = self._get_query_embeddings_batch(queries)
+        except Exception as e:
+            logger.error("Search error: %s", e)
+            return [[] for _ in searches]
+        
+        def query_one(embedding: List[float], where_filter: Dict[str, Any]) -> List[UnifiedSearchResult]:
+            if is_no_match_filter(where_filter):
+                return []
+            try:
+                results = self.collection.query(
+                    query_embeddings=[embedding],
+                    n_results=n_results,
+                    where=where_filter or None,
+                    include=QUERY_INCLUDE
+                )
+            except Exception as e:
+                logger.error("Search error: %s", e)
+                return []
+            return self._to_search_results(results, 0)
+        
+        max_workers = min(self.MULTI_SEARCH_MAX_WORKERS, len(searches))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(query_one, embeddings, where_filters))
     
     def _execute_search(
         self,
@@ -268,11 +985,15 @@ class UnifiedRetriever:
         Returns:
             검색 결과 리스트
         """
+        if is_no_match_filter(where_filter):
+            return []
+        
         try:
-            # 디버깅: 필터 조건 출력
-            print(f"[DEBUG] 검색 쿼리: {query}")
-            print(f"[DEBUG] 필터 조건: {where_filter}")
-            print(f"[DEBUG] 컬렉션 총 문서 수: {self.collection.count()}")
+            # 디버깅: 필터 조건 출력 (count()는 DB 조회이므로 DEBUG일 때만)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("검색 쿼리: %s", query)
+                logger.debug("필터 조건: %s", where_filter)
+                logger.debug("컬렉션 총 문서 수: %d", self._collection_count())
             
             # OpenAI로 쿼리 임베딩 생성
             query_embedding = self._get_query_embedding(query)
@@ -286,64 +1007,193 @@ class UnifiedRetriever:
                 results = self.collection.query(
                     query_embeddings=[query_embedding],
                     n_results=n_results,
-                    where=where_param
+                    where=where_param,
+                    include=QUERY_INCLUDE
                 )
             except Exception as query_error:
                 # ChromaDB 버전 호환성 문제 - 에러 상세 출력
                 error_type = type(query_error).__name__
                 error_msg = str(query_error)
-                print(f"[ERROR] ChromaDB query 실패: {error_type}: {error_msg}")
+                logger.error("ChromaDB query 실패: %s: %s", error_type, error_msg, exc_info=True)
                 
                 # dimensionality 에러인 경우 컬렉션 재생성 필요
                 if 'dimensionality' in error_msg.lower():
-                    print(f"[ERROR] ⚠️  ChromaDB 컬렉션 구조 문제 감지!")
-                    print(f"[ERROR] 컬렉션을 재생성해야 합니다:")
-                    print(f"[ERROR]   python debug/fix_chromadb_collection.py")
-                    print(f"[ERROR]   python -m backend.ingestion.ingest_mock_reports")
-                    print(f"[ERROR] 의미 검색을 위해 컬렉션 재생성이 필요합니다.")
-                
-                import traceback
-                traceback.print_exc()
+                    logger.error(
+                        "⚠️  ChromaDB 컬렉션 구조 문제 감지! 의미 검색을 위해 컬렉션을 재생성해야 합니다:\n"
+                        "  python debug/fix_chromadb_collection.py\n"
+                        "  python -m backend.ingestion.ingest_mock_reports"
+                    )
+
                 # 의미 검색이 필수이므로 빈 결과 반환 (fallback 없음)
                 return []
             
             # 디버깅: 검색 결과 수 출력
-            if results and results['ids']:
-                print(f"[DEBUG] 검색 결과: {len(results['ids'][0])}개 발견")
-                # 첫 번째 결과의 메타데이터 출력
-                if len(results['metadatas'][0]) > 0:
-                    print(f"[DEBUG] 첫 번째 결과 메타데이터: {results['metadatas'][0][0]}")
-            else:
-                print(f"[DEBUG] 검색 결과 없음")
+            if logger.isEnabledFor(logging.DEBUG):
+                if results and results['ids']:
+                    logger.debug("검색 결과: %d개 발견", len(results['ids'][0]))
+                    # 첫 번째 결과의 메타데이터 출력
+                    if len(results['metadatas'][0]) > 0:
+                        logger.debug("첫 번째 결과 메타데이터: %s", results['metadatas'][0][0])
+                else:
+                    logger.debug("검색 결과 없음")
             
             # 결과 변환
-            search_results = []
-            
-            if results and results['ids'] and len(results['ids']) > 0:
-                ids = results['ids'][0]
-                documents = results['documents'][0]
-                metadatas = results['metadatas'][0]
-                distances = results['distances'][0]
-                
-                for i in range(len(ids)):
-                    # 거리를 유사도 점수로 변환 (낮을수록 유사 → 높을수록 유사)
-                    score = 1.0 / (1.0 + distances[i])
-                    
-                    search_results.append(
-                        UnifiedSearchResult(
-                            chunk_id=ids[i],
-                            doc_id=metadatas[i].get("doc_id", ""),
-                            doc_type=metadatas[i].get("doc_type", ""),
-                            chunk_type=metadatas[i].get("chunk_type", ""),
-                            text=documents[i],
-                            score=score,
-                            metadata=metadatas[i]
-                        )
-                    )
-            
-            return search_results
+            return self._to_search_results(results, 0)
         
         except Exception as e:
-            print(f"[ERROR] Search error: {e}")
+            logger.error("Search error: %s", e)
+            return []
+    
+    def _to_search_results(
+        self,
+        results: Optional[Dict[str, Any]],
+        row: int
+    ) -> List[UnifiedSearchResult]:
+        """
+        Chroma query 결과의 row번째 질의 결과를 UnifiedSearchResult 리스트로 변환
+        
+        Args:
+            results: collection.query() 결과
+            row: 질의 임베딩 인덱스
+            
+        Returns:
+            검색 결과 리스트
+        """
+        if not (results and results['ids'] and len(results['ids']) > row):
+            return []
+        
+        ids = results['ids'][row]
+        documents = results['documents'][row]
+        metadatas = results['metadatas'][row]
+        
+        # 거리를 유사도 점수로 변환 (낮을수록 유사 → 높을수록 유사), 한 번에 벡터 연산
+        scores = distances_to_scores(results['distances'][row])
+        
+        return build_search_results(ids, documents, metadatas, scores)
+    
+    async def _aexecute_search(
+        self,
+        query: str,
+        where_filter: Dict[str, Any],
+        n_results: int
+    ) -> List[UnifiedSearchResult]:
+        """
+        비동기 검색 수행 (요청 배칭)
+        
+        BATCH_WINDOW_SECONDS 동안 들어온 요청을 모아 임베딩은 한 번의 배치 호출로,
+        같은 필터/결과 개수의 질의는 한 번의 collection.query()로 처리합니다.
+        
+        Args:
+            query: 검색 쿼리
+            where_filter: Chroma where 필터
+            n_results: 결과 개수
+            
+        Returns:
+            검색 결과 리스트
+        """
+        if is_no_match_filter(where_filter):
             return []
+        
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        
+        batch = self._batches.get(loop)
+        if batch is None:
+            batch = ([], loop.create_task(self._flush_pending(loop)))
+            self._batches[loop] = batch
+        batch[0].append((query, where_filter or None, n_results, future))
+        
+        return await future
+    
+    async def _flush_pending(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        대기 시간 후 모인 검색 요청을 한 번에 실행하고 각 future에 결과 전달
+        
+        Args:
+            loop: 대기열이 묶인 이벤트 루프 (현재 실행 중인 루프)
+        """
+        pending: List[_PendingSearch] = []
+        try:
+            try:
+                await asyncio.sleep(self.BATCH_WINDOW_SECONDS)
+            finally:
+                # 취소되더라도 다음 요청이 새 flush 태스크를 만들 수 있도록 항상 대기열을 떼어냄
+                batch = self._batches.pop(loop, None)
+                if batch is not None:
+                    pending = batch[0]
+            
+            try:
+                batch_results = await asyncio.to_thread(
+                    self._run_batch,
+                    [(query, where, n_results) for query, where, n_results, _ in pending]
+                )
+            except Exception as e:
+                logger.error("Batch search error: %s", e)
+                batch_results = [[] for _ in pending]
+            
+            for (_, _, _, future), results in zip(pending, batch_results):
+                if not future.done():
+                    future.set_result(results)
+        finally:
+            # 대기/배치 실행 중 취소되어 결과를 받지 못한 요청은 함께 취소 (영원히 대기하지 않도록)
+            for _, _, _, future in pending:
+                if not future.done():
+                    future.cancel()
+    
+    def _run_batch(
+        self,
+        requests: List[Tuple[str, Optional[Dict[str, Any]], int]]
+    ) -> List[List[UnifiedSearchResult]]:
+        """
+        여러 검색 요청을 배치로 실행
+        
+        Args:
+            requests: (query, where_filter, n_results) 리스트
+            
+        Returns:
+            요청 순서대로의 검색 결과 리스트
+        """
+        embeddings = self._get_query_embeddings_batch([query for query, _, _ in requests])
+        
+        # 같은 where 필터/결과 개수끼리 묶어서 한 번의 query로 처리
+        groups: Dict[Tuple[str, int], List[int]] = {}
+        for idx, (_, where, n_results) in enumerate(requests):
+            key = (json.dumps(where, sort_keys=True, ensure_ascii=False), n_results)
+            groups.setdefault(key, []).append(idx)
+        
+        batch_results: List[List[UnifiedSearchResult]] = [[] for _ in requests]
+        for (_, n_results), indices in groups.items():
+            # 한 필터 그룹이 실패해도 다른 그룹의 결과는 전달 (실패한 그룹만 빈 결과)
+            try:
+                results = self.collection.query(
+                    query_embeddings=[embeddings[idx] for idx in indices],
+                    n_results=n_results,
+                    where=requests[indices[0]][1],
+                    include=QUERY_INCLUDE
+                )
+            except Exception as e:
+                logger.error("Batch search error (where=%s): %s", requests[indices[0]][1], e)
+                continue
+            for row, idx in enumerate(indices):
+                batch_results[idx] = self._to_search_results(results, row)
+        
+        return batch_results
+
 
+@lru_cache(maxsize=1)
+def get_report_retriever() -> UnifiedRetriever:
+    """
+    reports 컬렉션용 UnifiedRetriever (프로세스 내 공유)
+    
+    벡터DB 컬렉션 조회와 임베딩 서비스 초기화를 요청/보고서마다 반복하지 않도록 한 번만 생성합니다.
+    공유 인스턴스이므로 같은 이벤트 루프의 동시 비동기 검색은 같은 배치 대기열로 모입니다 (대기열은 루프별).
+    
+    Returns:
+        UnifiedRetriever 인스턴스
+    """
+    collection = get_report_vector_store().get_collection()
+    return UnifiedRetriever(
+        collection=collection,
+        openai_api_key=settings.OPENAI_API_KEY,
+        embedding_model_type=os.getenv("REPORT_EMBEDDING_MODEL_TYPE", "hf")
+    )
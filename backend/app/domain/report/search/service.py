@@ -2,11 +2,15 @@
 Unified Search Service
 
 Intent Router와 Retriever를 결합하여 통합 검색 서비스를 제공합니다.
+현재 API 요청 경로에서는 생성되지 않습니다 (일일/주간/월간 생성 경로는 get_report_retriever를 직접 사용).
 
 Author: AI Assistant
 Created: 2025-11-18
 """
 from typing import List, Optional, Dict, Any
+from operator import attrgetter
+import asyncio
+
 from .retriever import UnifiedRetriever, UnifiedSearchResult
 from .intent_router import IntentRouter, QueryIntent
 
@@ -49,15 +53,16 @@ class UnifiedSearchService:
                 "count": int
             }
         """
-        # 1. Intent 분석
-        intent_result: QueryIntent = self.router.route(query)
+        # 1. Intent 분석 (LLM 호출은 동기 API이므로 스레드에서 실행)
+        intent_result: QueryIntent = await asyncio.to_thread(self.router.route, query)
         
         # 2. Intent에 따라 검색 수행
         results: List[UnifiedSearchResult] = []
         
+        # (비동기 검색 API를 사용해 임베딩/ChromaDB 호출 동안 이벤트 루프를 막지 않음)
         if intent_result.intent == "daily":
             # 일일 보고서 검색
-            results = self.retriever.search_daily(
+            results = await self.retriever.asearch_daily(
                 query=query,
                 owner=user,
                 n_results=n_results
@@ -65,7 +70,7 @@ class UnifiedSearchService:
         
         elif intent_result.intent == "weekly":
             # 주간 보고서 검색 (doc_type으로 필터링)
-            results = self.retriever.search_by_doc_type(
+            results = await self.retriever.asearch_by_doc_type(
                 query=query,
                 doc_type="weekly",
                 owner=user,
@@ -74,7 +79,7 @@ class UnifiedSearchService:
         
         elif intent_result.intent == "monthly":
             # 월간 보고서 검색
-            results = self.retriever.search_by_doc_type(
+            results = await self.retriever.asearch_by_doc_type(
                 query=query,
                 doc_type="monthly",
                 owner=user,
@@ -84,21 +89,22 @@ class UnifiedSearchService:
         
         elif intent_result.intent == "template":
             # 템플릿 검색
-            results = self.retriever.search_template(
+            results = await self.retriever.asearch_template(
                 query=query,
                 n_results=min(n_results, 3)  # 템플릿은 적게 반환
             )
         
         elif intent_result.intent == "mixed":
-            # 혼합 검색 - 전체 검색
-            results = self.retriever.search_all(
+            # 혼합 검색 - 타입별 검색을 동시에 수행 후 병합 (더 많은 결과 반환)
+            results = await self._search_mixed(
                 query=query,
-                n_results=n_results * 2  # 더 많은 결과 반환
+                user=user,
+                n_results=n_results * 2
             )
         
         else:
             # unknown - fallback to 전체 검색
-            results = self.retriever.search_all(
+            results = await self.retriever.asearch_all(
                 query=query,
                 n_results=n_results
             )
@@ -113,6 +119,41 @@ class UnifiedSearchService:
             "count": len(results)
         }
     
+    async def _search_mixed(
+        self,
+        query: str,
+        user: Optional[str],
+        n_results: int
+    ) -> List[UnifiedSearchResult]:
+        """
+        혼합 intent 검색: 일일/주간/월간/템플릿 검색을 동시에 수행하고 병합
+        
+        동시에 들어간 요청은 retriever에서 배치로 묶이므로 쿼리 임베딩은 한 번만 계산됩니다.
+        
+        Args:
+            query: 검색 쿼리
+            user: 사용자/작성자 (선택)
+            n_results: 최종 결과 개수
+            
+        Returns:
+            chunk_id 기준 중복 제거 후 유사도 순으로 정렬된 결과 리스트
+        """
+        results_by_type = await asyncio.gather(
+            self.retriever.asearch_daily(query=query, owner=user, n_results=n_results),
+            self.retriever.asearch_by_doc_type(query=query, doc_type="weekly", owner=user, n_results=n_results),
+            self.retriever.asearch_by_doc_type(query=query, doc_type="monthly", owner=user, n_results=n_results),
+            self.retriever.asearch_template(query=query, n_results=min(n_results, 3))
+        )
+        
+        merged: Dict[str, UnifiedSearchResult] = {}
+        for results in results_by_type:
+            for result in results:
+                existing = merged.get(result.chunk_id)
+                if existing is None or result.score > existing.score:
+                    merged[result.chunk_id] = result
+        
+        return sorted(merged.values(), key=attrgetter("score"), reverse=True)[:n_results]
+    
     def search_sync(
         self,
         query: str,
@@ -2,19 +2,69 @@
 주간 보고서 생성 체인
 새로운 4청크 구조 기반 RAG 프롬프트 사용
 """
+from collections import OrderedDict
 from datetime import date, timedelta
-from typing import List, Dict, Any
+from functools import lru_cache
+from pathlib import Path
+from threading import Lock
+from typing import List, Dict, Any, Optional, Tuple, Union
 from sqlalchemy.orm import Session
+import asyncio
+import hashlib
+import logging
+import re
+import sqlite3
+import time
 import uuid
-import json
+import os
 
 from app.domain.report.core.canonical_models import CanonicalReport, CanonicalWeekly
-from app.infrastructure.vector_store_report import get_report_vector_store
-from app.domain.report.search.retriever import UnifiedRetriever
+from app.domain.report.search.retriever import UnifiedSearchResult, get_report_retriever
 from app.llm.client import get_llm
-from app.core.config import settings
 from app.domain.report.core.rag_prompts import WEEKLY_REPORT_RAG_PROMPT
 
+logger = logging.getLogger(__name__)
+
+BASE_DIR = Path(__file__).resolve().parents[4]  # backend 루트
+
+# 주간 서술 필드 생성에 사용하는 LLM 모델
+WEEKLY_LLM_MODEL = "gpt-4o-mini"
+
+
+# 생성된 주간 보고서 캐시: (작성자, ISO week, 청크 내용 해시) -> (저장 시각, 보고서 JSON)
+# 같은 주의 청크가 바뀌지 않았으면 재생성(LLM 호출) 없이 이전 결과를 반환
+REPORT_CACHE_MAX_SIZE = 256
+REPORT_CACHE_TTL_SECONDS = 24 * 3600
+_report_cache: "OrderedDict[Tuple[str, str, str], Tuple[float, str]]" = OrderedDict()
+_report_cache_lock = Lock()
+
+# 프로세스 재시작 후에도 재사용할 수 있도록 보고서 캐시를 SQLite 파일에도 저장 (메모리 캐시의 2차 저장소)
+# 기본은 사용하지 않으며, 경로를 설정하면 활성화 (상대 경로는 BASE_DIR 기준)
+REPORT_DISK_CACHE_PATH = os.getenv("WEEKLY_REPORT_CACHE_PATH", "")
+REPORT_DISK_CACHE_TTL_SECONDS = 7 * 24 * 3600
+_report_disk_cache_lock = Lock()
+
+# detail 청크 업무 줄의 시간 접두어("[09:00-10:00] ")와 비고 접미어(" (비고: ...)")
+_TIME_PREFIX_RE = re.compile(r"^\[\d{1,2}:\d{2}(?:-\d{1,2}:\d{2})?\]\s*")
+_NOTE_SUFFIX_RE = re.compile(r"\s*\(비고: .*\)$")
+
+# 디스크 캐시 스키마 버전 (CanonicalReport 구조나 캐시 저장 방식이 바뀌면 올림)
+REPORT_CACHE_SCHEMA_VERSION = 1
+
+# 주간보고서에 싣는 요일별 대표 업무 수 (PDF 요일 칸에 들어가는 줄 수와 동일)
+WEEKDAY_TASKS_PER_DAY = 3
+
+# 프롬프트 내 JSON 예시의 중괄호는 이스케이프되어 있으므로 .format()으로 한 번만 풀어둠
+_WEEKLY_SYSTEM_PROMPT = WEEKLY_REPORT_RAG_PROMPT.format()
+
+# 디스크 캐시 키에 넣는 생성 설정 버전 (스키마 버전 + 모델 + 시스템 프롬프트 해시)
+# 프롬프트나 모델이 바뀌면 키가 달라지므로, 이전 설정으로 만든 보고서를 재배포 후 재사용하지 않음
+_REPORT_CACHE_VERSION = "v{}-{}-{}".format(
+    REPORT_CACHE_SCHEMA_VERSION,
+    WEEKLY_LLM_MODEL,
+    hashlib.blake2b(_WEEKLY_SYSTEM_PROMPT.encode("utf-8"), digest_size=4).hexdigest(),
+)
+
 
 def get_week_range(target_date: date) -> tuple[date, date]:
     """해당 주의 월요일~금요일 날짜 범위 계산"""
@@ -24,107 +74,297 @@ def get_week_range(target_date: date) -> tuple[date, date]:
     return (monday, friday)
 
 
-def generate_weekly_report(
-    db: Session,
-    owner: str,
-    target_date: date
-) -> CanonicalReport:
+def _get_week_info(target_date: date) -> Tuple[date, date, str]:
+    """기준 날짜로부터 (월요일, 금요일, ISO week 문자열) 계산"""
+    monday, friday = get_week_range(target_date)
+    
+    # ISO week number 계산
+    iso_calendar = monday.isocalendar()
+    week_str = f"{iso_calendar[0]}-W{iso_calendar[1]:02d}"
+    return monday, friday, week_str
+
+
+def _search_weekly_chunks(owner: str, week_str: str) -> List[UnifiedSearchResult]:
     """
-    주간 보고서 자동 생성 (새로운 4청크 구조 기반)
+    벡터DB에서 해당 주의 일일보고서 청크 검색 (새로운 4청크 구조)
     
     Args:
-        db: 데이터베이스 세션
         owner: 작성자
-        target_date: 기준 날짜 (해당 주의 아무 날짜)
+        week_str: ISO week 문자열 (예: "2025-W01")
         
     Returns:
-        CanonicalReport (weekly)
+        검색된 청크 리스트
     """
-    # 1. 해당 주의 월~금 날짜 계산
-    monday, friday = get_week_range(target_date)
+    retriever = get_report_retriever()
     
-    # ISO week number 계산
-    iso_calendar = monday.isocalendar()
-    week_str = f"{iso_calendar[0]}-W{iso_calendar[1]:02d}"
+    logger.debug("주간 보고서 데이터 검색: owner=%s, week=%s", owner, week_str)
     
-    # 2. 벡터DB에서 주간 데이터 검색 (새로운 4청크 구조)
-    import os
-    vector_store = get_report_vector_store()
-    collection = vector_store.get_collection()
-    embedding_model_type = os.getenv("REPORT_EMBEDDING_MODEL_TYPE", "hf")
-    retriever = UnifiedRetriever(
-        collection=collection,
-        openai_api_key=settings.OPENAI_API_KEY,
-        embedding_model_type=embedding_model_type
-    )
-    
-    print(f"[DEBUG] 주간 보고서 데이터 검색: owner={owner}, week={week_str}")
-    
-    # week 필터로 모든 일일보고서 청크 검색 (5일 × 4청크 = 20개)
-    all_chunks = retriever.search_daily(
-        query=f"{owner} 주간 업무",
+    # week 필터로 모든 일일보고서 청크 조회 (5일 × 4청크 = 20개)
+    # 필터에 맞는 청크 전체가 필요하고 순위는 의미 없으므로 임베딩/의미 검색 없이 get()으로 조회
+    all_chunks = retriever.fetch_daily(
         owner=owner,
         week=week_str,
-        n_results=20,  # 정확히 20개
-        chunk_types=None  # 모든 청크 타입
+        limit=20  # 정확히 20개
     )
     
-    print(f"[INFO] 벡터DB 검색 완료: {len(all_chunks)}개 청크 발견")
+    logger.info("벡터DB 검색 완료: %d개 청크 발견", len(all_chunks))
     
     if len(all_chunks) == 0:
         raise ValueError(f"해당 주({week_str})에 일일보고서 데이터를 찾을 수 없습니다.")
     
-    # 3. 검색 결과를 프롬프트 형식으로 변환
-    search_results = []
-    for chunk in all_chunks:
-        search_results.append({
-            "text": chunk.text,
-            "metadata": chunk.metadata
-        })
-    
-    # 4. LLM 프롬프트 구성
-    llm_client = get_llm()
-    
-    user_prompt = f"""다음은 ChromaDB에서 검색된 일일보고서 청크 데이터입니다:
+    return all_chunks
 
-{json.dumps(search_results, ensure_ascii=False, indent=2)}
 
-위 데이터를 기반으로 주간보고서를 생성해주세요.
+def _chunks_cache_key(owner: str, week_str: str, all_chunks: List[UnifiedSearchResult]) -> Tuple[str, str, str]:
+    """
+    주간 보고서 캐시 키 생성
+    
+    청크 ID뿐 아니라 텍스트도 해시에 포함하므로, 일일보고서가 수정되어 재적재되면 키가 바뀌어
+    별도의 무효화 없이 재생성됩니다.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for chunk in sorted(all_chunks, key=lambda c: c.chunk_id):
+        digest.update(chunk.chunk_id.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(chunk.text.encode("utf-8"))
+        digest.update(b"\0")
+    return (owner, week_str, digest.hexdigest())
 
-**중요**: 
-- week = "{week_str}"인 모든 청크를 분석하여 주간보고서를 작성하세요.
-- 해당 주의 날짜 범위: {monday.isoformat()} (월요일) ~ {friday.isoformat()} (금요일)
-- weekday_tasks 필드는 반드시 다음 5개 날짜를 모두 포함해야 합니다:
-  * "{monday.isoformat()}" (월요일)
-  * "{(monday + timedelta(days=1)).isoformat()}" (화요일)
-  * "{(monday + timedelta(days=2)).isoformat()}" (수요일)
-  * "{(monday + timedelta(days=3)).isoformat()}" (목요일)
-  * "{friday.isoformat()}" (금요일)
-- 각 날짜별로 chunk_type="detail" 청크에서 업무를 추출하여 배열로 작성하세요.
-- 업무가 없더라도 빈 배열([])로라도 해당 날짜는 반드시 포함하세요."""
+
+@lru_cache(maxsize=1)
+def _get_report_disk_cache() -> Optional[sqlite3.Connection]:
+    """
+    주간 보고서 디스크 캐시(SQLite) 연결 (프로세스 내 공유, 사용 불가 시 None)
     
-    # 5. LLM 호출
+    연결은 여러 스레드(asyncio.to_thread 포함)에서 쓰이므로 check_same_thread=False로 열고
+    _report_disk_cache_lock으로 직렬화합니다.
+    """
+    if not REPORT_DISK_CACHE_PATH:
+        return None
+    cache_path = Path(REPORT_DISK_CACHE_PATH)
+    if not cache_path.is_absolute():
+        cache_path = BASE_DIR / cache_path
     try:
-        # 프롬프트 내 JSON 예시의 중괄호는 이스케이프되어 있으므로 .format() 사용 가능
-        system_prompt = WEEKLY_REPORT_RAG_PROMPT.format(week_number=week_str)
-        response = llm_client.complete_json(
-            system_prompt=system_prompt,
-            user_prompt=user_prompt,
-            temperature=0.7
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(cache_path), check_same_thread=False)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS weekly_report_cache ("
+            "cache_key TEXT PRIMARY KEY, created_at REAL NOT NULL, report_json TEXT NOT NULL)"
         )
+        # 만료된 항목은 연결 시 한 번 정리
+        conn.execute(
+            "DELETE FROM weekly_report_cache WHERE created_at < ?",
+            (time.time() - REPORT_DISK_CACHE_TTL_SECONDS,)
+        )
+        conn.commit()
+        return conn
+    except sqlite3.Error as e:
+        logger.warning("주간 보고서 디스크 캐시 사용 불가: %s", e)
+        return None
+
+
+def _disk_cache_key(key: Tuple[str, str, str]) -> str:
+    """
+    디스크 캐시 키 문자열 (weekly:설정 버전:작성자:주차:청크 해시)
+    
+    디스크 캐시는 재배포 후에도 남으므로 프롬프트/모델/스키마 버전을 키에 포함합니다.
+    """
+    return f"weekly:{_REPORT_CACHE_VERSION}:" + ":".join(key)
+
+
+def _get_disk_cached_report(key: Tuple[str, str, str]) -> Optional[str]:
+    """디스크 캐시에서 보고서 JSON 조회 (만료되었거나 없으면 None)"""
+    conn = _get_report_disk_cache()
+    if conn is None:
+        return None
+    try:
+        with _report_disk_cache_lock:
+            row = conn.execute(
+                "SELECT created_at, report_json FROM weekly_report_cache WHERE cache_key = ?",
+                (_disk_cache_key(key),)
+            ).fetchone()
+    except sqlite3.Error as e:
+        logger.warning("주간 보고서 디스크 캐시 조회 실패: %s", e)
+        return None
+    if row is None or time.time() - row[0] > REPORT_DISK_CACHE_TTL_SECONDS:
+        return None
+    return row[1]
+
+
+def _store_disk_cached_report(key: Tuple[str, str, str], report_json: str) -> None:
+    """디스크 캐시에 보고서 JSON 저장 (실패해도 보고서 생성에는 영향 없음)"""
+    conn = _get_report_disk_cache()
+    if conn is None:
+        return
+    try:
+        with _report_disk_cache_lock:
+            conn.execute(
+                "INSERT OR REPLACE INTO weekly_report_cache (cache_key, created_at, report_json) VALUES (?, ?, ?)",
+                (_disk_cache_key(key), time.time(), report_json)
+            )
+            conn.commit()
+    except sqlite3.Error as e:
+        logger.warning("주간 보고서 디스크 캐시 저장 실패: %s", e)
+
+
+def _remember_report(key: Tuple[str, str, str], report_json: str) -> None:
+    """메모리 캐시에 보고서 JSON 저장 (최대 크기 초과 시 가장 오래 사용되지 않은 항목 제거)"""
+    with _report_cache_lock:
+        _report_cache[key] = (time.monotonic(), report_json)
+        _report_cache.move_to_end(key)
+        while len(_report_cache) > REPORT_CACHE_MAX_SIZE:
+            _report_cache.popitem(last=False)
+
+
+def _get_cached_report(key: Tuple[str, str, str]) -> Optional[CanonicalReport]:
+    """
+    캐시된 주간 보고서 조회 (메모리 → 디스크 순, 만료된 항목은 제거)
+    
+    디스크 캐시에서 찾은 항목은 메모리 캐시에도 올려 다음 조회를 빠르게 합니다.
+    캐시는 보고서 내용을 재사용하기 위한 것이므로, 반환할 때마다 새 report_id를 부여합니다.
+    """
+    with _report_cache_lock:
+        entry = _report_cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] > REPORT_CACHE_TTL_SECONDS:
+            del _report_cache[key]
+            entry = None
+        if entry is not None:
+            _report_cache.move_to_end(key)
+        report_json = entry[1] if entry is not None else None
+    
+    if report_json is None:
+        report_json = _get_disk_cached_report(key)
+        if report_json is None:
+            return None
+        _remember_report(key, report_json)
+    
+    logger.info("주간 보고서 캐시 적중: owner=%s, week=%s", key[0], key[1])
+    report = CanonicalReport.model_validate_json(report_json)
+    return report.model_copy(update={"report_id": str(uuid.uuid4())})
+
+
+def _store_cached_report(key: Tuple[str, str, str], report: CanonicalReport) -> None:
+    """주간 보고서 캐시 저장 (메모리 + 디스크)"""
+    report_json = report.model_dump_json()
+    _remember_report(key, report_json)
+    _store_disk_cached_report(key, report_json)
+
+
+def _chunk_body(chunk: UnifiedSearchResult) -> str:
+    """청크 텍스트에서 첫 줄 헤더("[일일_DETAIL] 2025-11-24")를 제거한 본문"""
+    body = chunk.text
+    if body.startswith("[일일_"):
+        body = body.partition("\n")[2]
+    return body
+
+
+def _select_representative_tasks(tasks: List[str], limit: int = WEEKDAY_TASKS_PER_DAY) -> List[str]:
+    """
+    하루 업무 목록에서 대표 업무를 결정적으로 선택
+
+    같은 업무가 여러 시간대에 반복되면 하나로 합치고, 자주 등장한 업무 → 내용이 긴(구체적인) 업무
+    → 먼저 등장한 업무 순으로 골라 원래 시간 순서대로 반환합니다.
+
+    Args:
+        tasks: 시간 순서의 업무 목록 (시간 정보/비고 제거 후)
+        limit: 최대 선택 개수
+
+    Returns:
+        대표 업무 리스트 (최대 limit개, 시간 순서 유지)
+    """
+    first_index: Dict[str, int] = {}
+    counts: Dict[str, int] = {}
+    for index, task in enumerate(tasks):
+        first_index.setdefault(task, index)
+        counts[task] = counts.get(task, 0) + 1
+
+    ranked = sorted(first_index, key=lambda task: (-counts[task], -len(task), first_index[task]))
+    return sorted(ranked[:limit], key=first_index.__getitem__)
+
+
+def _extract_weekday_tasks(all_chunks: List[UnifiedSearchResult]) -> Dict[str, List[str]]:
+    """
+    detail 청크에서 날짜별 대표 업무 목록을 직접 구성 (LLM 재추출 불필요)
+    
+    detail 청크는 일일보고서의 detail_tasks를 한 줄씩 적은 것이므로,
+    시간 정보와 비고를 제거한 뒤 날짜별로 대표 업무 WEEKDAY_TASKS_PER_DAY개를 고릅니다.
+    
+    Args:
+        all_chunks: 해당 주의 일일보고서 청크 리스트
         
-        weekly_data = response if isinstance(response, dict) else json.loads(response)
-        
-        # 디버그: LLM 응답 확인
-        print(f"[DEBUG] LLM 응답 weekday_tasks 키: {list(weekly_data.get('weekday_tasks', {}).keys())}")
+    Returns:
+        {날짜(YYYY-MM-DD): [업무, ...]}
+    """
+    weekday_tasks: Dict[str, List[str]] = {}
+    for chunk in all_chunks:
+        date_str = chunk.metadata.get("date", "")
+        if chunk.chunk_type != "detail" or not date_str:
+            continue
         
-    except Exception as e:
-        print(f"[ERROR] 주간보고서 생성 실패: {e}")
-        import traceback
-        traceback.print_exc()
-        raise
+        tasks = weekday_tasks.setdefault(date_str, [])
+        for line in _chunk_body(chunk).splitlines():
+            task = _NOTE_SUFFIX_RE.sub("", _TIME_PREFIX_RE.sub("", line.strip()))
+            if task:
+                tasks.append(task)
+    
+    return {
+        date_str: _select_representative_tasks(tasks)
+        for date_str, tasks in weekday_tasks.items()
+    }
+
+
+def _has_narrative_chunks(all_chunks: List[UnifiedSearchResult]) -> bool:
+    """weekly_goals/weekly_highlights/notes를 만들 근거 청크(summary/pending/plan_note)가 있는지"""
+    return any(chunk.chunk_type != "detail" for chunk in all_chunks)
+
+
+def _build_weekly_prompts(
+    all_chunks: List[UnifiedSearchResult],
+    monday: date,
+    friday: date,
+    week_str: str
+) -> Tuple[str, str]:
+    """
+    검색된 청크로 주간보고서 서술 필드(weekly_goals/weekly_highlights/notes) 생성용
+    (system_prompt, user_prompt) 구성
+    
+    weekday_tasks는 _extract_weekday_tasks로 직접 구성하므로 detail 청크는 프롬프트에서 제외합니다.
+    """
+    # 검색 결과를 "[날짜|chunk_type]" 헤더 + 본문 형식으로 변환 (JSON 직렬화 대비 입력 토큰 절감)
+    # (청크 첫 줄 헤더는 "[날짜|chunk_type]" 헤더와 중복이므로 제거)
+    chunk_blocks = [
+        f"[{chunk.metadata.get('date', '')}|{chunk.chunk_type}]\n{_chunk_body(chunk)}"
+        for chunk in all_chunks
+        if chunk.chunk_type != "detail"
+    ]
+    
+    # 고정 지시사항은 시스템 프롬프트에 있으므로 주차별로 달라지는 정보만 전달
+    user_prompt = (
+        f"week = \"{week_str}\" ({monday.isoformat()} 월요일 ~ {friday.isoformat()} 금요일)\n\n"
+        "일일보고서 청크:\n\n"
+        + "\n\n".join(chunk_blocks)
+    )
     
-    # 6. CanonicalWeekly 생성
+    # 시스템 프롬프트는 주차와 무관하게 항상 동일 (OpenAI 자동 prefix 캐시 적중)
+    system_prompt = _WEEKLY_SYSTEM_PROMPT
+    return system_prompt, user_prompt
+
+
+def _build_weekly_report(
+    owner: str,
+    monday: date,
+    friday: date,
+    weekly_data: Dict[str, Any]
+) -> CanonicalReport:
+    """
+    LLM 응답(JSON)으로 CanonicalReport (weekly) 구성
+    """
+    # 디버그: LLM 응답 확인 (키 목록 생성 비용이 있으므로 DEBUG일 때만)
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    if debug_enabled:
+        logger.debug("LLM 응답 weekday_tasks 키: %s", list(weekly_data.get("weekday_tasks", {}).keys()))
+    
+    # CanonicalWeekly 생성
     header = {
         "작성일자": f"{monday.isoformat()} ~ {friday.isoformat()}",
         "성명": owner
@@ -146,15 +386,16 @@ def generate_weekly_report(
         # 날짜 키로 업무 찾기
         if date_str in weekday_tasks_raw:
             weekday_tasks_converted[weekday_name] = weekday_tasks_raw[date_str]
-            print(f"[DEBUG] {weekday_name} ({date_str}) 업무 {len(weekday_tasks_raw[date_str])}개 변환 완료")
+            logger.debug("%s (%s) 업무 %d개 변환 완료", weekday_name, date_str, len(weekday_tasks_raw[date_str]))
         else:
             # 날짜 키가 없으면 빈 리스트
             weekday_tasks_converted[weekday_name] = []
-            print(f"[WARNING] {weekday_name} ({date_str}) 업무 데이터 없음")
+            logger.warning("%s (%s) 업무 데이터 없음", weekday_name, date_str)
         
         current_date += timedelta(days=1)
     
-    print(f"[DEBUG] 최종 weekday_tasks_converted: {list(weekday_tasks_converted.keys())}")
+    if debug_enabled:
+        logger.debug("최종 weekday_tasks_converted: %s", list(weekday_tasks_converted.keys()))
     
     canonical_weekly = CanonicalWeekly(
         header=header,
@@ -164,7 +405,7 @@ def generate_weekly_report(
         notes=weekly_data.get("notes", "")
     )
     
-    # 7. CanonicalReport 생성
+    # CanonicalReport 생성
     report = CanonicalReport(
         report_id=str(uuid.uuid4()),
         report_type="weekly",
@@ -175,3 +416,155 @@ def generate_weekly_report(
     )
     
     return report
+
+
+def _prepare_weekly_generation(
+    all_chunks: List[UnifiedSearchResult],
+    monday: date,
+    friday: date,
+    week_str: str
+) -> Tuple[Dict[str, List[str]], Optional[Tuple[str, str]]]:
+    """
+    LLM 호출 전 단계 (동기/비동기 생성 공통)
+    
+    Returns:
+        (요일별 세부 업무, (system_prompt, user_prompt)) - 서술 필드 근거 청크가 없으면 프롬프트는 None
+    """
+    # 요일별 세부 업무는 detail 청크에서 직접 구성
+    weekday_tasks = _extract_weekday_tasks(all_chunks)
+    
+    # 서술 필드(목표/중요 업무/특이사항)만 LLM으로 생성 (근거 청크가 없으면 생략)
+    if not _has_narrative_chunks(all_chunks):
+        logger.info("summary/pending/plan_note 청크 없음: LLM 호출 생략")
+        return weekday_tasks, None
+    return weekday_tasks, _build_weekly_prompts(all_chunks, monday, friday, week_str)
+
+
+def _finish_weekly_report(
+    owner: str,
+    monday: date,
+    friday: date,
+    weekly_data: Dict[str, Any],
+    weekday_tasks: Dict[str, List[str]]
+) -> CanonicalReport:
+    """LLM 호출 후 단계 (동기/비동기 생성 공통): 요일별 업무를 합쳐 CanonicalReport 구성"""
+    weekly_data["weekday_tasks"] = weekday_tasks
+    return _build_weekly_report(owner, monday, friday, weekly_data)
+
+
+def generate_weekly_report(
+    db: Session,
+    owner: str,
+    target_date: date
+) -> CanonicalReport:
+    """
+    주간 보고서 자동 생성 (새로운 4청크 구조 기반)
+    
+    Args:
+        db: 데이터베이스 세션
+        owner: 작성자
+        target_date: 기준 날짜 (해당 주의 아무 날짜)
+        
+    Returns:
+        CanonicalReport (weekly)
+    """
+    # 1. 해당 주의 월~금 날짜 계산
+    monday, friday, week_str = _get_week_info(target_date)
+    
+    # 2. 벡터DB에서 주간 데이터 검색
+    all_chunks = _search_weekly_chunks(owner, week_str)
+    
+    # 청크가 바뀌지 않았으면 이전에 생성한 보고서 재사용 (LLM 호출 생략)
+    cache_key = _chunks_cache_key(owner, week_str, all_chunks)
+    cached_report = _get_cached_report(cache_key)
+    if cached_report is not None:
+        return cached_report
+    
+    # 3. 요일별 세부 업무 구성 + 서술 필드 프롬프트 준비
+    weekday_tasks, prompts = _prepare_weekly_generation(all_chunks, monday, friday, week_str)
+    
+    # 4. 서술 필드 LLM 생성
+    weekly_data: Dict[str, Any] = {}
+    if prompts is not None:
+        system_prompt, user_prompt = prompts
+        try:
+            weekly_data = get_llm(model=WEEKLY_LLM_MODEL).complete_json(
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                temperature=0.7
+            )
+        except Exception as e:
+            logger.exception("주간보고서 생성 실패: %s", e)
+            raise
+    
+    # 5. CanonicalReport 생성
+    report = _finish_weekly_report(owner, monday, friday, weekly_data, weekday_tasks)
+    _store_cached_report(cache_key, report)
+    return report
+
+
+async def generate_weekly_report_async(
+    db: Session,
+    owner: str,
+    target_date: date
+) -> CanonicalReport:
+    """
+    주간 보고서 자동 생성 (비동기 버전)
+    
+    벡터DB 검색과 캐시 조회/저장(SQLite 파일 I/O)은 스레드에서, LLM 호출은 acomplete_json으로 수행하여
+    이벤트 루프를 막지 않습니다. 인자와 반환값은 generate_weekly_report와 동일합니다.
+    """
+    monday, friday, week_str = _get_week_info(target_date)
+    
+    all_chunks = await asyncio.to_thread(_search_weekly_chunks, owner, week_str)
+    
+    cache_key = _chunks_cache_key(owner, week_str, all_chunks)
+    cached_report = await asyncio.to_thread(_get_cached_report, cache_key)
+    if cached_report is not None:
+        return cached_report
+    
+    weekday_tasks, prompts = _prepare_weekly_generation(all_chunks, monday, friday, week_str)
+    
+    weekly_data: Dict[str, Any] = {}
+    if prompts is not None:
+        system_prompt, user_prompt = prompts
+        try:
+            weekly_data = await get_llm(model=WEEKLY_LLM_MODEL).acomplete_json(
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                temperature=0.7
+            )
+        except Exception as e:
+            logger.exception("주간보고서 생성 실패: %s", e)
+            raise
+    
+    report = _finish_weekly_report(owner, monday, friday, weekly_data, weekday_tasks)
+    await asyncio.to_thread(_store_cached_report, cache_key, report)
+    return report
+
+
+async def generate_weekly_reports(
+    db: Session,
+    owners: List[str],
+    target_date: date,
+    max_concurrency: int = 8
+) -> List[Union[CanonicalReport, Exception]]:
+    """
+    여러 작성자의 주간 보고서를 동시에 생성 (OpenAI 대기 시간을 겹쳐서 처리)
+    
+    Args:
+        db: 데이터베이스 세션
+        owners: 작성자 목록
+        target_date: 기준 날짜 (해당 주의 아무 날짜)
+        max_concurrency: 동시에 생성할 최대 보고서 수
+        
+    Returns:
+        owners 순서대로의 CanonicalReport 또는 생성 실패 시 해당 예외
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def _generate(owner: str) -> CanonicalReport:
+        async with semaphore:
+            return await generate_weekly_report_async(db, owner, target_date)
+    
+    return await asyncio.gather(*(_generate(owner) for owner in owners), return_exceptions=True)
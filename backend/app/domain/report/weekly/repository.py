@@ -4,7 +4,7 @@ Weekly Report Repository (CRUD)
 주간보고서 데이터베이스 CRUD 연산
 """
 from datetime import date
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 from sqlalchemy.orm import Session
 
 from app.domain.report.weekly.models import WeeklyReport
@@ -107,6 +107,37 @@ class WeeklyReportRepository:
             WeeklyReport.period_start.asc()
         ).all()
     
+    @staticmethod
+    def list_weekly_sections_by_owner_and_period_range(
+        db: Session,
+        owner: str,
+        period_start: date,
+        period_end: date
+    ) -> List[Dict[str, Any]]:
+        """
+        작성자와 기간 범위로 주간보고서의 weekly 섹션만 조회
+        
+        월간 보고서처럼 report_json의 weekly 부분만 필요한 경우, 행 전체와 JSONB 전체를 가져와
+        파이썬에서 꺼내는 대신 DB에서 report_json -> 'weekly'만 선택해 전송/역직렬화량을 줄입니다.
+        
+        Args:
+            db: 데이터베이스 세션
+            owner: 작성자
+            period_start: 시작일
+            period_end: 종료일
+            
+        Returns:
+            weekly 섹션 딕셔너리 리스트 (기간순 정렬, 섹션이 없으면 빈 딕셔너리)
+        """
+        rows = db.query(WeeklyReport.report_json["weekly"]).filter(
+            WeeklyReport.owner == owner,
+            WeeklyReport.period_start >= period_start,
+            WeeklyReport.period_end <= period_end
+        ).order_by(
+            WeeklyReport.period_start.asc()
+        ).all()
+        return [row[0] or {} for row in rows]
+    
     @staticmethod
     def create(
         db: Session,
@@ -1,11 +1,6 @@
 from app.infrastructure.database.session import Base, engine, get_db, SessionLocal
-from app.infrastructure.database.base import *
 
-# 모델 import (테이블 생성을 위해)
-from app.domain.user.models import User
-try:
-    from app.domain.user.token_models import UserToken
-except ImportError:
-    pass
+# 모델은 여기서 import하지 않음 (DB를 쓰지 않는 경로의 import 비용 절감)
+# 테이블 등록이 필요하면 app.infrastructure.database.all_models를 import
 
 __all__ = ["Base", "engine", "get_db", "SessionLocal"]
@@ -0,0 +1,21 @@
+"""
+모든 SQLAlchemy 모델을 import하는 파일
+Alembic 자동 마이그레이션 생성 및 create_all 시 전체 테이블이 Base.metadata에 등록되도록 함
+
+런타임 패키지(__init__.py)에서는 import하지 않으며,
+마이그레이션(alembic/env.py)과 테이블 생성 시점에만 명시적으로 import한다.
+"""
+
+from app.infrastructure.database.session import Base
+
+# 여기에 모든 모델을 import
+from app.domain.user.models import User
+from app.domain.report.daily.models import DailyReport
+from app.domain.report.weekly.models import WeeklyReport
+from app.domain.report.monthly.models import MonthlyReport
+try:
+    from app.domain.user.token_models import UserToken
+except ImportError:
+    UserToken = None
+
+__all__ = ["Base", "User", "DailyReport", "WeeklyReport", "MonthlyReport", "UserToken"]
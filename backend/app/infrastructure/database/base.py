@@ -1,12 +1,10 @@
 """
-모든 SQLAlchemy 모델을 import하는 파일
-Alembic이 자동으로 마이그레이션을 생성할 수 있도록 함
+SQLAlchemy Base 재노출
+
+모델 import는 하지 않음 (런타임 import 비용 절감).
+Alembic/테이블 생성용 전체 모델 등록은 all_models.py 사용.
 """
 
 from app.infrastructure.database.session import Base
 
-# 여기에 모든 모델을 import
-from app.domain.user.models import User
-from app.domain.report.daily.models import DailyReport
-
-__all__ = ["Base", "User", "DailyReport"]
+__all__ = ["Base"]
@@ -7,8 +7,10 @@ engine = create_engine(
     settings.DATABASE_URL,
     echo=False,           # 🔥 SQL 쿼리 로깅 비활성화 (너무 번잡함)
     pool_pre_ping=True,   # 연결 유효성 체크
-    pool_size=10,         # 커넥션 풀 크기
-    max_overflow=20       # 최대 추가 연결 수
+    pool_size=settings.DB_POOL_SIZE,            # 커넥션 풀 크기
+    max_overflow=settings.DB_MAX_OVERFLOW,      # 최대 추가 연결 수
+    pool_timeout=settings.DB_POOL_TIMEOUT,      # 풀 대기 타임아웃
+    pool_recycle=settings.DB_POOL_RECYCLE       # 오래된 연결 재생성
 )
 
 # 세션 팩토리
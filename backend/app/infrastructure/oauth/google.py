@@ -1,10 +1,10 @@
 from typing import Optional
 from authlib.integrations.httpx_client import AsyncOAuth2Client
-import httpx
 import secrets
 
 from app.core.config import settings
 from app.domain.auth.schemas import OAuthUserInfo
+from app.infrastructure.oauth.http_client import get_oauth_http_client
 
 
 class GoogleOAuthClient:
@@ -57,19 +57,19 @@ class GoogleOAuthClient:
         Returns:
             토큰 정보 dict
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.TOKEN_URL,
-                data={
-                    "code": code,
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
-                    "redirect_uri": self.redirect_uri,
-                    "grant_type": "authorization_code"
-                }
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_oauth_http_client()
+        response = await client.post(
+            self.TOKEN_URL,
+            data={
+                "code": code,
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "redirect_uri": self.redirect_uri,
+                "grant_type": "authorization_code"
+            }
+        )
+        response.raise_for_status()
+        return response.json()
     
     async def get_user_info(self, access_token: str) -> OAuthUserInfo:
         """
@@ -81,21 +81,21 @@ class GoogleOAuthClient:
         Returns:
             OAuthUserInfo 객체
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                self.USER_INFO_URL,
-                headers={"Authorization": f"Bearer {access_token}"}
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            return OAuthUserInfo(
-                email=data["email"],
-                name=data.get("name"),
-                profile_image=data.get("picture"),
-                oauth_id=data["id"],
-                oauth_provider="google"
-            )
+        client = get_oauth_http_client()
+        response = await client.get(
+            self.USER_INFO_URL,
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+        response.raise_for_status()
+        data = response.json()
+        
+        return OAuthUserInfo(
+            email=data["email"],
+            name=data.get("name"),
+            profile_image=data.get("picture"),
+            oauth_id=data["id"],
+            oauth_provider="google"
+        )
 
 
 # 싱글톤 인스턴스
@@ -0,0 +1,38 @@
+"""
+OAuth 공용 HTTP 클라이언트
+
+Google/Kakao/Naver 토큰·사용자 정보 요청이 같은 httpx.AsyncClient를 공유하여
+로그인 콜백마다 TCP/TLS 핸드셰이크를 새로 하지 않고 keep-alive 커넥션을 재사용합니다.
+"""
+from typing import Optional
+import httpx
+
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_oauth_http_client() -> httpx.AsyncClient:
+    """
+    공유 AsyncClient 반환 (첫 호출 시 생성)
+    
+    httpx.AsyncClient는 실제 요청 시점에 커넥션을 만들므로 import 시점이 아닌
+    첫 요청 시점에 생성합니다. await 없이 생성하므로 이벤트 루프 안에서 경쟁이 없습니다.
+    
+    Returns:
+        공유 httpx.AsyncClient
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(10.0),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40)
+        )
+    return _client
+
+
+async def close_oauth_http_client() -> None:
+    """공유 AsyncClient 종료 (애플리케이션 종료 시 호출)"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -1,8 +1,8 @@
 from typing import Optional
-import httpx
 
 from app.core.config import settings
 from app.domain.auth.schemas import OAuthUserInfo
+from app.infrastructure.oauth.http_client import get_oauth_http_client
 
 
 class KakaoOAuthClient:
@@ -47,20 +47,20 @@ class KakaoOAuthClient:
         Returns:
             토큰 정보 dict
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.TOKEN_URL,
-                data={
-                    "grant_type": "authorization_code",
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
-                    "redirect_uri": self.redirect_uri,
-                    "code": code
-                },
-                headers={"Content-Type": "application/x-www-form-urlencoded"}
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_oauth_http_client()
+        response = await client.post(
+            self.TOKEN_URL,
+            data={
+                "grant_type": "authorization_code",
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "redirect_uri": self.redirect_uri,
+                "code": code
+            },
+            headers={"Content-Type": "application/x-www-form-urlencoded"}
+        )
+        response.raise_for_status()
+        return response.json()
     
     async def get_user_info(self, access_token: str) -> OAuthUserInfo:
         """
@@ -72,24 +72,24 @@ class KakaoOAuthClient:
         Returns:
             OAuthUserInfo 객체
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                self.USER_INFO_URL,
-                headers={"Authorization": f"Bearer {access_token}"}
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            kakao_account = data.get("kakao_account", {})
-            profile = kakao_account.get("profile", {})
-            
-            return OAuthUserInfo(
-                email=kakao_account.get("email"),
-                name=profile.get("nickname"),
-                profile_image=profile.get("profile_image_url"),
-                oauth_id=str(data["id"]),
-                oauth_provider="kakao"
-            )
+        client = get_oauth_http_client()
+        response = await client.get(
+            self.USER_INFO_URL,
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+        response.raise_for_status()
+        data = response.json()
+        
+        kakao_account = data.get("kakao_account", {})
+        profile = kakao_account.get("profile", {})
+        
+        return OAuthUserInfo(
+            email=kakao_account.get("email"),
+            name=profile.get("nickname"),
+            profile_image=profile.get("profile_image_url"),
+            oauth_id=str(data["id"]),
+            oauth_provider="kakao"
+        )
 
 
 # 싱글톤 인스턴스
@@ -1,8 +1,8 @@
 from typing import Optional
-import httpx
 
 from app.core.config import settings
 from app.domain.auth.schemas import OAuthUserInfo
+from app.infrastructure.oauth.http_client import get_oauth_http_client
 
 
 class NaverOAuthClient:
@@ -45,19 +45,19 @@ class NaverOAuthClient:
         Returns:
             토큰 정보 dict
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.TOKEN_URL,
-                params={
-                    "grant_type": "authorization_code",
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
-                    "code": code,
-                    "state": state
-                }
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_oauth_http_client()
+        response = await client.post(
+            self.TOKEN_URL,
+            params={
+                "grant_type": "authorization_code",
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "code": code,
+                "state": state
+            }
+        )
+        response.raise_for_status()
+        return response.json()
     
     async def get_user_info(self, access_token: str) -> OAuthUserInfo:
         """
@@ -69,23 +69,23 @@ class NaverOAuthClient:
         Returns:
             OAuthUserInfo 객체
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                self.USER_INFO_URL,
-                headers={"Authorization": f"Bearer {access_token}"}
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            response_data = data.get("response", {})
-            
-            return OAuthUserInfo(
-                email=response_data.get("email"),
-                name=response_data.get("name") or response_data.get("nickname"),
-                profile_image=response_data.get("profile_image"),
-                oauth_id=response_data.get("id"),
-                oauth_provider="naver"
-            )
+        client = get_oauth_http_client()
+        response = await client.get(
+            self.USER_INFO_URL,
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+        response.raise_for_status()
+        data = response.json()
+        
+        response_data = data.get("response", {})
+        
+        return OAuthUserInfo(
+            email=response_data.get("email"),
+            name=response_data.get("name") or response_data.get("nickname"),
+            profile_image=response_data.get("profile_image"),
+            oauth_id=response_data.get("id"),
+            oauth_provider="naver"
+        )
 
 
 # 싱글톤 인스턴스
@@ -3,8 +3,14 @@
 backend/Data/ChromaDB/report 경로에 저장
 """
 import os
+import json
+import time
+import hashlib
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from threading import Lock
+from typing import List, Dict, Any, Optional, Tuple
+import numpy as np
 import chromadb
 from chromadb import Collection
 
@@ -14,31 +20,124 @@ CHROMA_PERSIST_DIR = BASE_DIR / "Data" / "ChromaDB" / "report"
 COLLECTION_NAME = "reports"
 SIMILARITY_THRESHOLD = float(os.getenv("SIMILARITY_THRESHOLD", "0.78"))
 
+# Chroma 서버 주소 (설정하면 in-process PersistentClient 대신 별도 Chroma 서버에 HttpClient로 연결)
+# 인덱스 검색·쓰기가 API 프로세스의 CPU/GIL을 점유하지 않고, 여러 워커 프로세스가 같은 컬렉션을 공유할 수 있음
+CHROMA_HOST = os.getenv("REPORT_CHROMA_HOST", "")
+CHROMA_PORT = int(os.getenv("REPORT_CHROMA_PORT", "8000"))
+
+# HNSW 인덱스 파라미터 (컬렉션 생성 시에만 적용, 기존 컬렉션은 재생성해야 반영됨)
+# - M / construction_ef: 그래프 연결 수·구축 탐색 폭을 기본값(16/100)보다 높여 recall 향상
+# - search_ef: 주간 보고서처럼 n_results=20 + 좁은 메타데이터 필터 조합에서 후보 부족을 막기 위해 기본값(10)보다 높게
+# 거리 함수(hnsw:space)는 점수 계산·SIMILARITY_THRESHOLD가 기존 l2 기준이므로 변경하지 않음
+HNSW_M = int(os.getenv("REPORT_HNSW_M", "24"))
+HNSW_CONSTRUCTION_EF = int(os.getenv("REPORT_HNSW_CONSTRUCTION_EF", "128"))
+HNSW_SEARCH_EF = int(os.getenv("REPORT_HNSW_SEARCH_EF", "100"))
+
+# upsert 한 번에 보낼 청크 수 (전체를 한 번에 보내면 max_batch_size 초과·메모리 급증 위험, 청크 단위로 보내면 호출 오버헤드가 큼)
+UPSERT_BATCH_SIZE = int(os.getenv("REPORT_UPSERT_BATCH_SIZE", "250"))
+
+# search() 결과 캐시: 같은 쿼리 임베딩 + 필터 + 결과 개수 + 임계값이면 collection.query()를 생략
+# insert_chunks()가 호출되면 비우고, 다른 프로세스(ingestion 스크립트)의 쓰기는 TTL로 반영
+SEARCH_CACHE_MAX_SIZE = 1024
+SEARCH_CACHE_TTL_SECONDS = 300
+
+
+# 이 프로세스에서 insert_chunks가 호출된 횟수 (청크 데이터 파생 캐시의 무효화 판단용)
+_write_generation = 0
+
+
+def get_write_generation() -> int:
+    """
+    보고서 컬렉션 쓰기 세대 번호 반환
+    
+    청크 데이터로 만든 캐시는 이 값이 바뀌면 비워야 합니다.
+    
+    Returns:
+        insert_chunks 호출 횟수
+    """
+    return _write_generation
+
+
+def upsert_in_batches(
+    collection: Collection,
+    chunks: List[Dict[str, Any]],
+    embeddings: List[List[float]],
+    batch_size: int = UPSERT_BATCH_SIZE
+) -> None:
+    """
+    청크를 batch_size개씩 나누어 upsert
+    
+    id/텍스트/메타데이터 리스트는 배치마다 만들어 전체 길이의 리스트를 한꺼번에 들고 있지 않습니다.
+    
+    Args:
+        collection: 대상 컬렉션
+        chunks: 청크 리스트 ({"id", "text", "metadata"})
+        embeddings: 청크 순서와 같은 임베딩 리스트
+        batch_size: 배치 크기
+    """
+    for start in range(0, len(chunks), batch_size):
+        end = start + batch_size
+        batch = chunks[start:end]
+        collection.upsert(
+            ids=[chunk["id"] for chunk in batch],
+            embeddings=embeddings[start:end],
+            documents=[chunk["text"] for chunk in batch],
+            metadatas=[chunk["metadata"] for chunk in batch]
+        )
+
 
 class ReportVectorStore:
     """보고서 전용 Vector Store"""
     
     def __init__(self):
-        """초기화 - ChromaDB PersistentClient 사용"""
-        CHROMA_PERSIST_DIR.mkdir(parents=True, exist_ok=True)
-        self.client = chromadb.PersistentClient(path=str(CHROMA_PERSIST_DIR))
-        self._collection: Optional[Collection] = None
-        print(f"📁 ChromaDB 저장 경로: {CHROMA_PERSIST_DIR}")
+        """초기화 - REPORT_CHROMA_HOST가 있으면 Chroma 서버(HttpClient), 없으면 로컬 PersistentClient 사용"""
+        if CHROMA_HOST:
+            self.client = chromadb.HttpClient(host=CHROMA_HOST, port=CHROMA_PORT)
+            print(f"🔗 ChromaDB 서버 연결: {CHROMA_HOST}:{CHROMA_PORT}")
+        else:
+            CHROMA_PERSIST_DIR.mkdir(parents=True, exist_ok=True)
+            self.client = chromadb.PersistentClient(path=str(CHROMA_PERSIST_DIR))
+            print(f"📁 ChromaDB 저장 경로: {CHROMA_PERSIST_DIR}")
+        # 컬렉션은 생성 시 한 번만 조회/생성 (get_or_create_collection: 단일 호출, 예외 분기 없음)
+        self._collection: Collection = self.client.get_or_create_collection(
+            name=COLLECTION_NAME,
+            metadata={
+                "description": "All reports collection (daily, weekly, monthly)",
+                "hnsw:M": HNSW_M,
+                "hnsw:construction_ef": HNSW_CONSTRUCTION_EF,
+                "hnsw:search_ef": HNSW_SEARCH_EF
+            }
+        )
+        print(f"✅ 컬렉션 준비 완료: {COLLECTION_NAME}")
+        self._search_cache: "OrderedDict[Tuple[bytes, str, int, float], Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._search_cache_lock = Lock()
     
     def get_collection(self) -> Collection:
-        """컬렉션 가져오기 또는 생성"""
-        if self._collection is None:
-            try:
-                self._collection = self.client.get_collection(name=COLLECTION_NAME)
-                print(f"✅ 기존 컬렉션 사용: {COLLECTION_NAME}")
-            except:
-                self._collection = self.client.create_collection(
-                    name=COLLECTION_NAME,
-                    metadata={"description": "All reports collection (daily, weekly, monthly)"}
-                )
-                print(f"✅ 새 컬렉션 생성: {COLLECTION_NAME}")
+        """컬렉션 반환 (__init__에서 이미 조회/생성됨)"""
         return self._collection
     
+    def warmup(self):
+        """
+        HNSW 인덱스를 미리 로드 (앱 시작 시 호출, 첫 사용자 검색이 디스크 로드 비용을 떠안지 않도록)
+        
+        저장된 임베딩 하나로 차원을 확인한 뒤 같은 차원의 0 벡터로 더미 검색을 1회 실행합니다.
+        컬렉션이 비어 있으면 로드할 인덱스가 없으므로 건너뜁니다.
+        """
+        collection = self.get_collection()
+        try:
+            sample = collection.get(limit=1, include=["embeddings"])
+            embeddings = sample.get("embeddings")
+            if embeddings is None or len(embeddings) == 0:
+                return
+            collection.query(
+                query_embeddings=[[0.0] * len(embeddings[0])],
+                n_results=1,
+                include=["distances"]
+            )
+            print(f"🔥 벡터 인덱스 워밍업 완료: {COLLECTION_NAME}")
+        except Exception as e:
+            print(f"⚠️  벡터 인덱스 워밍업 실패 (계속 진행): {e}")
+    
     def insert_chunks(
         self,
         chunks: List[Dict[str, Any]],
@@ -46,16 +145,28 @@ class ReportVectorStore:
     ):
         """청크와 임베딩을 VectorDB에 저장"""
         collection = self.get_collection()
+        upsert_in_batches(collection, chunks, embeddings)
         
-        ids = [chunk["id"] for chunk in chunks]
-        texts = [chunk["text"] for chunk in chunks]
-        metadatas = [chunk["metadata"] for chunk in chunks]
-        
-        collection.upsert(
-            ids=ids,
-            embeddings=embeddings,
-            documents=texts,
-            metadatas=metadatas
+        # 저장된 청크가 바뀌었으므로 이전 검색 결과/파생 캐시는 무효
+        global _write_generation
+        _write_generation += 1
+        with self._search_cache_lock:
+            self._search_cache.clear()
+    
+    @staticmethod
+    def _search_cache_key(
+        query_embedding: List[float],
+        n_results: int,
+        filters: Optional[Dict[str, Any]],
+        threshold: float
+    ) -> Tuple[bytes, str, int, float]:
+        """검색 결과 캐시 키 (임베딩은 float32 바이트의 blake2b 해시로 고정 크기화)"""
+        embedding_bytes = np.asarray(query_embedding, dtype=np.float32).tobytes()
+        return (
+            hashlib.blake2b(embedding_bytes, digest_size=16).digest(),
+            json.dumps(filters or {}, sort_keys=True, ensure_ascii=False),
+            n_results,
+            threshold
         )
     
     def search(
@@ -65,7 +176,19 @@ class ReportVectorStore:
         filters: Optional[Dict[str, Any]] = None,
         threshold: float = SIMILARITY_THRESHOLD
     ) -> List[Dict[str, Any]]:
-        """벡터 검색"""
+        """벡터 검색 (같은 임베딩/필터의 반복 검색은 캐시된 결과 반환)"""
+        cache_key = self._search_cache_key(query_embedding, n_results, filters, threshold)
+        with self._search_cache_lock:
+            entry = self._search_cache.get(cache_key)
+            if entry is not None and time.monotonic() - entry[0] > SEARCH_CACHE_TTL_SECONDS:
+                del self._search_cache[cache_key]
+                entry = None
+            if entry is not None:
+                self._search_cache.move_to_end(cache_key)
+        if entry is not None:
+            # 호출자가 결과를 수정해도 캐시가 오염되지 않도록 복사본 반환
+            return [dict(hit) for hit in entry[1]]
+        
         collection = self.get_collection()
         
         try:
@@ -73,12 +196,14 @@ class ReportVectorStore:
                 results = collection.query(
                     query_embeddings=[query_embedding],
                     n_results=n_results * 2,
-                    where=filters
+                    where=filters,
+                    include=["documents", "metadatas", "distances"]
                 )
             else:
                 results = collection.query(
                     query_embeddings=[query_embedding],
-                    n_results=n_results * 2
+                    n_results=n_results * 2,
+                    include=["documents", "metadatas", "distances"]
                 )
         except Exception as e:
             print(f"검색 오류: {e}")
@@ -87,31 +212,54 @@ class ReportVectorStore:
         if not results['ids'] or not results['ids'][0]:
             return []
         
-        formatted = []
-        for idx in range(len(results['ids'][0])):
-            distance = results['distances'][0][idx]
-            similarity = 1 - distance
-            
-            if similarity < threshold:
-                continue
-            
-            formatted.append({
-                "id": results['ids'][0][idx],
-                "text": results['documents'][0][idx],
-                "metadata": results['metadatas'][0][idx],
-                "similarity": round(similarity, 4)
-            })
+        # 임계값 필터와 상위 n_results 선택을 벡터 연산으로 처리하고, 살아남은 행만 dict로 변환
+        similarities = 1.0 - np.asarray(results['distances'][0], dtype=np.float64)
+        kept = np.flatnonzero(similarities >= threshold)
+        if kept.size > n_results:
+            kept = kept[np.argpartition(-similarities[kept], n_results)[:n_results]]
+        order = kept[np.argsort(-similarities[kept], kind="stable")]
         
-        return sorted(formatted, key=lambda x: x["similarity"], reverse=True)[:n_results]
+        # 유사도 반올림도 배열 단위로 한 번에 처리 (항목마다 float()/round() 호출하지 않음)
+        rounded = np.round(similarities[order], 4).tolist()
+        
+        ids = results['ids'][0]
+        documents = results['documents'][0]
+        metadatas = results['metadatas'][0]
+        top_hits = [
+            {
+                "id": ids[idx],
+                "text": documents[idx],
+                "metadata": metadatas[idx],
+                "similarity": similarity
+            }
+            for idx, similarity in zip(order.tolist(), rounded)
+        ]
+        
+        # 검색 오류(빈 결과 반환)는 캐시하지 않음
+        with self._search_cache_lock:
+            self._search_cache[cache_key] = (time.monotonic(), top_hits)
+            self._search_cache.move_to_end(cache_key)
+            while len(self._search_cache) > SEARCH_CACHE_MAX_SIZE:
+                self._search_cache.popitem(last=False)
+        
+        return [dict(hit) for hit in top_hits]
 
 
 _report_vector_store = None
+_report_vector_store_lock = Lock()
 
 
 def get_report_vector_store() -> ReportVectorStore:
-    """ReportVectorStore 싱글톤 인스턴스"""
+    """
+    ReportVectorStore 싱글톤 인스턴스
+    
+    여러 스레드(요청 처리 스레드풀, ingestion 워커)가 동시에 처음 호출해도
+    Chroma 클라이언트가 두 번 만들어지지 않도록 잠금 후 다시 확인합니다.
+    """
     global _report_vector_store
     if _report_vector_store is None:
-        _report_vector_store = ReportVectorStore()
+        with _report_vector_store_lock:
+            if _report_vector_store is None:
+                _report_vector_store = ReportVectorStore()
     return _report_vector_store
 
@@ -9,12 +9,98 @@ Created: 2025-11-18
 import os
 import json
 import asyncio
-from typing import Optional, Dict, Any
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from threading import Lock
+from typing import Optional, Dict, Any, Tuple
+import httpx
 import openai
+import orjson
 from pydantic import BaseModel
 
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
+
+# 프로세스 전역 OpenAI 클라이언트 (API 키별 1개)
+# 요청마다 클라이언트를 만들면 매번 TCP/TLS 핸드셰이크가 발생하므로 커넥션 풀을 공유
+_openai_clients: Dict[Optional[str], openai.OpenAI] = {}
+_openai_clients_lock = Lock()
+
+# JSON 응답 캐시 (use_cache=True로 호출한 경우만 사용)
+# key: (모델, 온도, 최대 토큰, 프롬프트)의 blake2b 해시 -> (저장 시각, 응답 원문)
+# 원문을 저장하고 적중 시마다 새로 파싱하므로 호출자가 반환된 dict를 수정해도 캐시는 영향받지 않음
+JSON_RESPONSE_CACHE_MAX_SIZE = 256
+JSON_RESPONSE_CACHE_TTL_SECONDS = 24 * 3600
+_json_response_cache: "OrderedDict[bytes, tuple[float, str]]" = OrderedDict()
+_json_response_cache_lock = Lock()
+
+
+def _json_response_cache_key(
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    system_prompt: str,
+    user_prompt: str
+) -> bytes:
+    """JSON 응답 캐시 키 생성 (프롬프트가 같아야 적중하는 정확 일치 캐시)"""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (model, repr(temperature), str(max_tokens), system_prompt, user_prompt):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.digest()
+
+
+def _get_cached_json_response(key: bytes) -> Optional[str]:
+    """캐시된 JSON 응답 원문 조회 (만료된 항목은 제거)"""
+    with _json_response_cache_lock:
+        entry = _json_response_cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] > JSON_RESPONSE_CACHE_TTL_SECONDS:
+            del _json_response_cache[key]
+            return None
+        _json_response_cache.move_to_end(key)
+        return entry[1]
+
+
+def _store_cached_json_response(key: bytes, content: str) -> None:
+    """JSON 응답 원문 저장 (최대 크기 초과 시 가장 오래 사용되지 않은 항목 제거)"""
+    with _json_response_cache_lock:
+        _json_response_cache[key] = (time.monotonic(), content)
+        _json_response_cache.move_to_end(key)
+        while len(_json_response_cache) > JSON_RESPONSE_CACHE_MAX_SIZE:
+            _json_response_cache.popitem(last=False)
+
+
+def get_openai_client(api_key: Optional[str] = None) -> openai.OpenAI:
+    """
+    공유 OpenAI 클라이언트 반환 (keep-alive 커넥션 풀 재사용)
+    
+    Args:
+        api_key: OpenAI API 키 (None이면 설정값 사용)
+        
+    Returns:
+        openai.OpenAI 인스턴스
+    """
+    api_key = api_key or settings.OPENAI_API_KEY
+    client = _openai_clients.get(api_key)
+    if client is None:
+        with _openai_clients_lock:
+            client = _openai_clients.get(api_key)
+            if client is None:
+                http_client = httpx.Client(
+                    timeout=httpx.Timeout(30.0, connect=10.0),
+                    limits=httpx.Limits(max_keepalive_connections=64, max_connections=128)
+                )
+                client = openai.OpenAI(api_key=api_key, http_client=http_client)
+                _openai_clients[api_key] = client
+    return client
+
 
 class LLMClient:
     """OpenAI LLM 클라이언트"""
@@ -39,7 +125,7 @@ class LLMClient:
         self.api_key = api_key or settings.OPENAI_API_KEY
         self.temperature = temperature
         self.max_tokens = max_tokens
-        self.client = openai.OpenAI(api_key=self.api_key)
+        self.client = get_openai_client(self.api_key)
     
     async def acomplete(
         self,
@@ -76,9 +162,7 @@ class LLMClient:
             return response.choices[0].message.content
         
         except Exception as e:
-            print(f"[ERROR] LLM completion error: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("LLM completion error: %s", e)
             raise
     
     async def acomplete_json(
@@ -86,7 +170,8 @@ class LLMClient:
         system_prompt: str,
         user_prompt: str,
         temperature: Optional[float] = None,
-        max_tokens: Optional[int] = None
+        max_tokens: Optional[int] = None,
+        use_cache: bool = False
     ) -> dict:
         """
         비동기 LLM 완성 (JSON 응답)
@@ -96,10 +181,19 @@ class LLMClient:
             user_prompt: 사용자 프롬프트
             temperature: 생성 온도
             max_tokens: 최대 토큰
+            use_cache: True면 같은 프롬프트의 이전 응답을 재사용 (입력이 같으면 결과도 같아도 되는 경우)
             
         Returns:
             파싱된 JSON 딕셔너리
         """
+        temperature = temperature or self.temperature
+        max_tokens = max_tokens or self.max_tokens
+        cache_key = None
+        if use_cache:
+            cache_key, data = self._cached_json_lookup(system_prompt, user_prompt, temperature, max_tokens)
+            if data is not None:
+                return data
+        
         try:
             # 동기 메서드를 비동기로 실행
             response = await asyncio.to_thread(
@@ -109,35 +203,25 @@ class LLMClient:
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_prompt}
                 ],
-                temperature=temperature or self.temperature,
-                max_tokens=max_tokens or self.max_tokens,
+                temperature=temperature,
+                max_tokens=max_tokens,
                 response_format={"type": "json_object"}  # JSON 모드
             )
-            
             content = response.choices[0].message.content
-            
-            # JSON 파싱
-            return json.loads(content)
-        
-        except json.JSONDecodeError as e:
-            print(f"[ERROR] JSON parsing error: {e}")
-            print(f"Raw response: {content}")
-            import traceback
-            traceback.print_exc()
-            raise
         
         except Exception as e:
-            print(f"[ERROR] LLM JSON completion error: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("LLM JSON completion error: %s", e)
             raise
+        
+        return self._store_json(content, cache_key)
     
     def complete_json(
         self,
         system_prompt: str,
         user_prompt: str,
         temperature: Optional[float] = None,
-        max_tokens: Optional[int] = None
+        max_tokens: Optional[int] = None,
+        use_cache: bool = False
     ) -> dict:
         """
         동기 LLM 완성 (JSON 응답)
@@ -147,10 +231,19 @@ class LLMClient:
             user_prompt: 사용자 프롬프트
             temperature: 생성 온도
             max_tokens: 최대 토큰
+            use_cache: True면 같은 프롬프트의 이전 응답을 재사용 (입력이 같으면 결과도 같아도 되는 경우)
             
         Returns:
             파싱된 JSON 딕셔너리
         """
+        temperature = temperature or self.temperature
+        max_tokens = max_tokens or self.max_tokens
+        cache_key = None
+        if use_cache:
+            cache_key, data = self._cached_json_lookup(system_prompt, user_prompt, temperature, max_tokens)
+            if data is not None:
+                return data
+        
         try:
             response = self.client.chat.completions.create(
                 model=self.model,
@@ -158,26 +251,69 @@ class LLMClient:
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_prompt}
                 ],
-                temperature=temperature or self.temperature,
-                max_tokens=max_tokens or self.max_tokens,
+                temperature=temperature,
+                max_tokens=max_tokens,
                 response_format={"type": "json_object"}  # JSON 모드
             )
-            
             content = response.choices[0].message.content
+        
+        except Exception as e:
+            logger.exception("LLM JSON completion error: %s", e)
+            raise
+        
+        return self._store_json(content, cache_key)
+    
+    def _cached_json_lookup(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float,
+        max_tokens: int
+    ) -> Tuple[bytes, Optional[dict]]:
+        """
+        JSON 응답 캐시 조회
+        
+        Args:
+            system_prompt: 시스템 프롬프트
+            user_prompt: 사용자 프롬프트
+            temperature: 생성 온도 (기본값 적용 후)
+            max_tokens: 최대 토큰 (기본값 적용 후)
             
-            # JSON 파싱
-            return json.loads(content)
+        Returns:
+            (캐시 키, 캐시 적중 시 새로 파싱한 JSON 딕셔너리 / 미적중 시 None)
+        """
+        cache_key = _json_response_cache_key(self.model, temperature, max_tokens, system_prompt, user_prompt)
+        content = _get_cached_json_response(cache_key)
+        # 캐시 적중 시 다시 저장하지 않음 (TTL 연장 방지), 저장된 원문은 파싱에 성공한 것만 있음
+        return cache_key, (orjson.loads(content) if content is not None else None)
+    
+    def _store_json(self, content: str, cache_key: Optional[bytes]) -> dict:
+        """
+        LLM 응답 원문을 JSON으로 파싱하고, 성공하면 캐시에 저장
         
+        Args:
+            content: LLM 응답 원문
+            cache_key: 캐시 키 (None이면 저장하지 않음)
+            
+        Returns:
+            파싱된 JSON 딕셔너리
+            
+        Raises:
+            json.JSONDecodeError: 응답이 올바른 JSON이 아닌 경우
+        """
+        # JSON 파싱 (orjson: C 구현 파서, JSONDecodeError는 json.JSONDecodeError의 하위 클래스)
+        try:
+            data = orjson.loads(content)
         except json.JSONDecodeError as e:
-            print(f"[ERROR] JSON parsing error: {e}")
-            print(f"Raw response: {content}")
+            logger.exception("JSON parsing error: %s\nRaw response: %s", e, content)
             raise
         
-        except Exception as e:
-            print(f"[ERROR] LLM JSON completion error: {e}")
-            raise
-
+        # 파싱에 성공한 응답만 캐시
+        if cache_key is not None:
+            _store_cached_json_response(cache_key, content)
+        return data
 
+@lru_cache(maxsize=16)
 def get_llm(
     model: str = "gpt-4o-mini",
     api_key: Optional[str] = None,
@@ -185,7 +321,7 @@ def get_llm(
     max_tokens: int = 2000
 ) -> LLMClient:
     """
-    LLM 클라이언트 팩토리 함수
+    LLM 클라이언트 팩토리 함수 (같은 설정이면 프로세스 내에서 같은 인스턴스 재사용)
     
     Args:
         model: 모델명
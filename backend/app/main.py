@@ -3,6 +3,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 from contextlib import asynccontextmanager
+import asyncio
 from pathlib import Path
 import sys
 import os
@@ -28,6 +29,10 @@ else:
 from app.core.config import settings
 from app.api.v1 import api_router
 from app.infrastructure.database import engine, Base
+from app.infrastructure.oauth.http_client import close_oauth_http_client
+from app.reporting.pdf_generator.process_pool import shutdown_pdf_pool
+from app.infrastructure.vector_store_report import get_report_vector_store
+from ingestion.auto_ingest import shutdown_ingest_executor
 
 # 경로 설정
 BASE_DIR = Path(__file__).resolve().parent.parent.parent  # Virtual-Assistant 루트
@@ -58,13 +63,23 @@ async def lifespan(app: FastAPI):
     
     # 데이터베이스 테이블 생성 (개발용)
     # 프로덕션에서는 Alembic 마이그레이션 사용
+    from app.infrastructure.database import all_models  # noqa: F401  (전체 모델을 Base.metadata에 등록)
     Base.metadata.create_all(bind=engine)
     print("✅ Database tables created")
     
+    # 보고서 벡터 인덱스 미리 로드 (첫 검색 요청의 콜드 스타트 지연 제거, 실패해도 서버는 시작)
+    try:
+        await asyncio.to_thread(lambda: get_report_vector_store().warmup())
+    except Exception as e:
+        print(f"⚠️  벡터 스토어 초기화 실패 (계속 진행): {e}")
+    
     yield
     
     # 종료 시
     print("👋 Shutting down...")
+    await close_oauth_http_client()
+    shutdown_pdf_pool()
+    shutdown_ingest_executor()
 
 
 # FastAPI 앱 생성
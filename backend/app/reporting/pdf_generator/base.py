@@ -1,11 +1,14 @@
 """
 PDF Generator Base Class
 
-ReportLab + PyPDF2를 사용하여 템플릿 PDF 위에 텍스트를 좌표 기반으로 삽입
+ReportLab + pikepdf(qpdf)를 사용하여 템플릿 PDF 위에 텍스트를 좌표 기반으로 삽입
+pikepdf가 없거나 REPORT_PDF_MERGE_BACKEND=pypdf2이면 PyPDF2로 병합
 """
+import os
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 from io import BytesIO
+from functools import lru_cache
 
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import A4
@@ -14,6 +17,45 @@ from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from PyPDF2 import PdfReader, PdfWriter
 
+try:
+    import pikepdf
+except ImportError:
+    pikepdf = None
+
+
+# 템플릿 병합 백엔드 ("pikepdf" 또는 "pypdf2", pikepdf가 설치되지 않았으면 항상 PyPDF2 사용)
+PDF_MERGE_BACKEND = os.getenv("REPORT_PDF_MERGE_BACKEND", "pikepdf").lower()
+
+
+# 한글 폰트 후보 (등록 이름, TTF 경로) - 앞에서부터 시도
+_KOREAN_FONT_CANDIDATES = (
+    ('malgun', 'C:/Windows/Fonts/malgun.ttf'),  # Windows: 맑은 고딕
+    ('NanumGothic', '/usr/share/fonts/truetype/nanum/NanumGothic.ttf'),  # Mac/Linux: NanumGothic
+)
+
+
+@lru_cache(maxsize=1)
+def _register_default_font() -> str:
+    """
+    사용 가능한 한글 폰트를 한 번만 등록하고 폰트 이름 반환
+    
+    Returns:
+        등록된 폰트 이름 (한글 폰트가 없으면 'Helvetica')
+    """
+    registered = set(pdfmetrics.getRegisteredFontNames())
+    for font_name, font_path in _KOREAN_FONT_CANDIDATES:
+        if font_name in registered:
+            return font_name
+        try:
+            pdfmetrics.registerFont(TTFont(font_name, font_path))
+            return font_name
+        except Exception:
+            continue
+    
+    # 기본 폰트 사용 (한글 깨질 수 있음)
+    print("⚠️  한글 폰트를 찾을 수 없어 기본 폰트 사용 (한글 깨질 수 있음)")
+    return 'Helvetica'
+
 
 class BasePDFGenerator:
     """PDF 생성 기본 클래스"""
@@ -28,6 +70,10 @@ class BasePDFGenerator:
     TEMPLATE_DIR = _BASE_DIR / "Data" / "reports"
     OUTPUT_DIR = _BASE_DIR / "output" / "report_result"
     
+    # 템플릿 첫 페이지만 담은 PDF 바이트 캐시 (템플릿은 실행 중 바뀌지 않으므로 생성할 때마다
+    # 디스크에서 전체 파일을 읽고 파싱하지 않음, 병합은 첫 페이지만 사용)
+    _TEMPLATE_PAGE_CACHE: Dict[Path, bytes] = {}
+    
     def __init__(self, template_filename: str):
         """
         Args:
@@ -36,34 +82,55 @@ class BasePDFGenerator:
         self.template_path = self.TEMPLATE_DIR / template_filename
         self.overlay_buffer = BytesIO()
         self.canvas = None
+        self._text_style: Optional[Tuple[str, int, Tuple[float, float, float]]] = None
         
         # 출력 디렉토리 생성
         self.OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
         
-        # 템플릿 파일 존재 확인
-        if not self.template_path.exists():
+        # 템플릿 파일 존재 확인 (이미 캐시된 템플릿은 디스크 확인 생략)
+        if self.template_path not in self._TEMPLATE_PAGE_CACHE and not self.template_path.exists():
             print(f"⚠️  템플릿 파일을 찾을 수 없습니다: {self.template_path}")
             print(f"   템플릿 디렉토리: {self.TEMPLATE_DIR}")
             print(f"   확인해주세요: backend/Data/reports/{template_filename}")
         
+    def reset(self):
+        """
+        이전 생성 결과를 비우고 새 Canvas를 준비
+        
+        overlay 버퍼는 새로 만들지 않고 비워서 재사용하므로,
+        같은 인스턴스로 여러 PDF를 연속 생성해도 이전 overlay가 섞이지 않음
+        """
+        self.overlay_buffer.seek(0)
+        self.overlay_buffer.truncate(0)
+        self.canvas = canvas.Canvas(self.overlay_buffer, pagesize=A4)
+        self._text_style = None
+    
     def _init_canvas(self):
         """ReportLab Canvas 초기화"""
-        self.canvas = canvas.Canvas(self.overlay_buffer, pagesize=A4)
+        self.reset()
         
-        # 한글 폰트 등록 (시스템 폰트 사용)
-        try:
-            # Windows: 맑은 고딕
-            pdfmetrics.registerFont(TTFont('malgun', 'C:/Windows/Fonts/malgun.ttf'))
-            self.default_font = 'malgun'
-        except:
-            try:
-                # Mac/Linux: NanumGothic 또는 기본 폰트
-                pdfmetrics.registerFont(TTFont('NanumGothic', '/usr/share/fonts/truetype/nanum/NanumGothic.ttf'))
-                self.default_font = 'NanumGothic'
-            except:
-                # 기본 폰트 사용 (한글 깨질 수 있음)
-                self.default_font = 'Helvetica'
-                print("⚠️  한글 폰트를 찾을 수 없어 기본 폰트 사용 (한글 깨질 수 있음)")
+        # 한글 폰트는 프로세스에서 한 번만 등록 (TTF 파싱 비용이 크므로 PDF마다 반복하지 않음)
+        self.default_font = _register_default_font()
+    
+    def _apply_text_style(
+        self,
+        font_name: str,
+        font_size: int,
+        color: Tuple[float, float, float]
+    ):
+        """
+        캔버스 폰트/색상 설정 (직전과 같으면 생략하여 content stream에 중복 Tf/rg 연산자를 넣지 않음)
+        
+        Args:
+            font_name: 폰트 이름
+            font_size: 폰트 크기
+            color: RGB 색상 튜플 (0~1)
+        """
+        style = (font_name, font_size, tuple(color))
+        if style != self._text_style:
+            self.canvas.setFont(font_name, font_size)
+            self.canvas.setFillColorRGB(*color)
+            self._text_style = style
     
     def draw_text(
         self, 
@@ -92,11 +159,69 @@ class BasePDFGenerator:
         if not self.canvas:
             raise ValueError("Canvas가 초기화되지 않았습니다. _init_canvas()를 먼저 호출하세요.")
         
-        font = font_name or self.default_font
-        self.canvas.setFont(font, font_size)
-        self.canvas.setFillColorRGB(*color)
+        self._apply_text_style(font_name or self.default_font, font_size, color)
         self.canvas.drawString(x, y, str(text))
     
+    def draw_text_column(
+        self,
+        x: float,
+        rows: Iterable[Tuple[float, str]],
+        font_size: int = 10,
+        font_name: Optional[str] = None,
+        color: Tuple[float, float, float] = (0, 0, 0)
+    ):
+        """
+        같은 x 좌표·폰트의 여러 문자열을 하나의 텍스트 객체(BT/ET 블록)로 그리기
+        
+        행마다 draw_text를 호출하면 문자열마다 텍스트 객체를 새로 만들므로,
+        고정 레이아웃의 열(column)은 이 메서드로 한 번에 그림
+        
+        Args:
+            x: X 좌표
+            rows: (PDF 좌표계 Y, 텍스트) 목록
+            font_size: 폰트 크기
+            font_name: 폰트 이름 (None이면 기본 폰트)
+            color: RGB 색상 튜플 (0~1)
+        """
+        if not self.canvas:
+            raise ValueError("Canvas가 초기화되지 않았습니다.")
+        
+        # 텍스트 객체는 캔버스의 현재 폰트를 이어받으므로 폰트/색상은 캔버스에 한 번만 설정
+        self._apply_text_style(font_name or self.default_font, font_size, color)
+        text_object = self.canvas.beginText()
+        for y, text in rows:
+            text_object.setTextOrigin(x, y)
+            text_object.textOut(str(text))
+        self.canvas.drawText(text_object)
+    
+    def draw_text_batch(self, items: Iterable[Tuple[float, float, str, int, float]]):
+        """
+        여러 위치의 텍스트를 폰트 크기별 텍스트 객체(BT/ET 블록) 하나씩으로 모아 그리기
+        
+        draw_text/draw_multiline_text를 항목마다 호출하는 대신 generate()에서 항목을 모아 두었다가
+        save_overlay() 전에 한 번 호출하면, 폰트 크기마다 폰트 설정과 텍스트 객체가 한 번씩만 생김
+        
+        Args:
+            items: (x, y, 텍스트, 폰트 크기, 줄 간격) 목록
+                   y는 PDF 좌표계의 첫 줄 위치, 텍스트의 \n은 줄 간격만큼 아래로 줄바꿈
+        """
+        if not self.canvas:
+            raise ValueError("Canvas가 초기화되지 않았습니다.")
+        
+        # 폰트 크기별로 묶음 (입력 순서 유지)
+        groups: Dict[int, List[Tuple[float, float, str, float]]] = {}
+        for x, y, text, font_size, line_height in items:
+            groups.setdefault(font_size, []).append((x, y, text, line_height))
+        
+        for font_size, group in groups.items():
+            self._apply_text_style(self.default_font, font_size, (0, 0, 0))
+            text_object = self.canvas.beginText()
+            for x, y, text, line_height in group:
+                for line_idx, line in enumerate(str(text).split('\n')):
+                    text_object.setTextOrigin(x, y - line_idx * line_height)
+                    text_object.textOut(line)
+            self.canvas.drawText(text_object)
+    
     def draw_multiline_text(
         self,
         x: float,
@@ -127,9 +252,7 @@ class BasePDFGenerator:
         if line_height is None:
             line_height = font_size * 1.2
         
-        font = font_name or self.default_font
-        self.canvas.setFont(font, font_size)
-        self.canvas.setFillColorRGB(*color)
+        self._apply_text_style(font_name or self.default_font, font_size, color)
         
         # 줄바꿈 처리
         lines = text.split('\n')
@@ -167,13 +290,16 @@ class BasePDFGenerator:
         if not self.canvas:
             raise ValueError("Canvas가 초기화되지 않았습니다.")
         
+        # 모든 셀이 같은 폰트/색상이므로 한 번만 설정하고 셀마다 drawString만 호출
+        self._apply_text_style(self.default_font, font_size, (0, 0, 0))
+        draw_string = self.canvas.drawString
         current_y = y
         
         for row in rows:
             current_x = x
             for i, cell_text in enumerate(row):
                 col_width = col_widths[i] if i < len(col_widths) else 100
-                self.draw_text(current_x, current_y, str(cell_text), font_size=font_size)
+                draw_string(current_x, current_y, str(cell_text))
                 current_x += col_width
             current_y -= row_height
     
@@ -185,6 +311,39 @@ class BasePDFGenerator:
         self.canvas.save()
         self.overlay_buffer.seek(0)
     
+    def _get_template_page_bytes(self) -> bytes:
+        """
+        템플릿 첫 페이지만 담은 PDF 바이트 (프로세스당 템플릿별 한 번만 파싱·직렬화)
+        
+        Returns:
+            첫 페이지 PDF 바이트
+            
+        Raises:
+            FileNotFoundError: 템플릿 파일이 없는 경우
+        """
+        page_bytes = self._TEMPLATE_PAGE_CACHE.get(self.template_path)
+        if page_bytes is None:
+            if not self.template_path.exists():
+                raise FileNotFoundError(f"템플릿 PDF를 찾을 수 없습니다: {self.template_path}")
+            page_writer = PdfWriter()
+            page_writer.add_page(PdfReader(str(self.template_path)).pages[0])
+            buffer = BytesIO()
+            page_writer.write(buffer)
+            page_bytes = buffer.getvalue()
+            self._TEMPLATE_PAGE_CACHE[self.template_path] = page_bytes
+        return page_bytes
+    
+    def warm_up(self) -> None:
+        """
+        생성 전에 폰트 등록과 템플릿 첫 페이지 캐시를 미리 수행 (프로세스 풀 워커 초기화 등)
+        
+        첫 생성 요청이 폰트 TTF 파싱/템플릿 파싱 비용을 떠안지 않도록 하며,
+        템플릿 파일이 없으면 캐시는 건너뜀 (생성 시점에 FileNotFoundError로 보고됨)
+        """
+        _register_default_font()
+        if self.template_path in self._TEMPLATE_PAGE_CACHE or self.template_path.exists():
+            self._get_template_page_bytes()
+    
     def merge_with_template(self, output_path: Optional[Path] = None) -> bytes:
         """
         템플릿 PDF와 overlay PDF를 병합
@@ -195,11 +354,51 @@ class BasePDFGenerator:
         Returns:
             PDF 바이트 스트림
         """
-        # 템플릿 PDF 로드
-        if not self.template_path.exists():
-            raise FileNotFoundError(f"템플릿 PDF를 찾을 수 없습니다: {self.template_path}")
+        # 템플릿 PDF 로드 (캐시에 없을 때만 디스크에서 읽음, 파일이 없으면 FileNotFoundError)
+        template_bytes = self._get_template_page_bytes()
+        if pikepdf is not None and PDF_MERGE_BACKEND != "pypdf2":
+            output_buffer = self._merge_with_pikepdf(template_bytes)
+        else:
+            output_buffer = self._merge_with_pypdf2(template_bytes)
+        
+        # 파일로 저장 (옵션)
+        if output_path:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(output_path, 'wb') as f:
+                f.write(output_buffer.getbuffer())
+            print(f"✅ PDF 저장 완료: {output_path}")
+        
+        return output_buffer.getvalue()
+    
+    def _merge_with_pikepdf(self, template_bytes: bytes) -> BytesIO:
+        """
+        pikepdf(qpdf C++ 파서)로 템플릿 첫 페이지 위에 overlay 병합
+        
+        Args:
+            template_bytes: 템플릿 첫 페이지 PDF 바이트
+            
+        Returns:
+            병합된 PDF가 담긴 버퍼
+        """
+        output_buffer = BytesIO()
+        with pikepdf.open(BytesIO(template_bytes)) as template_pdf, \
+                pikepdf.open(self.overlay_buffer) as overlay_pdf:
+            template_pdf.pages[0].add_overlay(overlay_pdf.pages[0])
+            template_pdf.save(output_buffer)
+        return output_buffer
+    
+    def _merge_with_pypdf2(self, template_bytes: bytes) -> BytesIO:
+        """
+        PyPDF2로 템플릿 첫 페이지 위에 overlay 병합 (pikepdf 미설치 시 대체 경로)
         
-        template_pdf = PdfReader(str(self.template_path))
+        Args:
+            template_bytes: 템플릿 첫 페이지 PDF 바이트
+            
+        Returns:
+            병합된 PDF가 담긴 버퍼
+        """
+        # 캐시된 첫 페이지로 매번 새 PageObject를 만들어, merge_page 변경이 다른 호출에 섞이지 않게 함
+        template_pdf = PdfReader(BytesIO(template_bytes))
         overlay_pdf = PdfReader(self.overlay_buffer)
         
         # 새 PDF 작성기
@@ -213,20 +412,9 @@ class BasePDFGenerator:
         template_page.merge_page(overlay_page)
         writer.add_page(template_page)
         
-        # 출력
         output_buffer = BytesIO()
         writer.write(output_buffer)
-        output_buffer.seek(0)
-        pdf_bytes = output_buffer.read()
-        
-        # 파일로 저장 (옵션)
-        if output_path:
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'wb') as f:
-                f.write(pdf_bytes)
-            print(f"✅ PDF 저장 완료: {output_path}")
-        
-        return pdf_bytes
+        return output_buffer
     
     def generate(self, output_filename: Optional[str] = None) -> bytes:
         """
@@ -5,15 +5,44 @@ Daily Report PDF Generator
 템플릿: backend/Data/reports/일일 업무 보고서.pdf
 """
 from datetime import date
+from threading import Lock
 from typing import Optional
 from pathlib import Path
 
 from app.reporting.pdf_generator.base import BasePDFGenerator
-from app.reporting.pdf_generator.utils import format_korean_date, truncate_text
+from app.reporting.pdf_generator.utils import format_bullet_list, format_korean_date, truncate_text
 from app.domain.report.core.schemas import CanonicalReport
 import re
 
 
+# clean_task_description 치환 규칙 (호출마다 re 모듈 캐시 조회를 하지 않도록 모듈 로드 시 컴파일)
+# 순서대로 적용되며, 앞 단계 결과에 다음 단계가 적용되므로 순서를 바꾸지 말 것
+_TASK_DESCRIPTION_SUBS = (
+    # 1. 종결어미 제거 (합니다, 입니다, 습니다, 함, 임)
+    (re.compile(r'(합니다|입니다|습니다)\.?$'), ''),
+    (re.compile(r'(함|임)\.?$'), ''),
+    # 2. "~하고 ... 합니다/진행함" 패턴 → "~하고 ... 진행"
+    (re.compile(r'하고\s+(\S+)\s+(진행|수행|실시)합니다?'), r'하고 \1 \2'),
+    (re.compile(r'하고\s+(\S+)\s+(진행|수행|실시)함'), r'하고 \1 \2'),
+    # 3. "~를/을 [동사]합니다" → "[동사]"
+    (re.compile(r'(을|를)\s+(\S+)합니다\.?$'), r'\2'),
+    (re.compile(r'(을|를)\s+(\S+)함\.?$'), r'\2'),
+    # 4. "~하는" 형태 제거
+    (re.compile(r'하는$'), ''),
+    (re.compile(r'하는\s+(작업|업무)'), ''),
+    (re.compile(r'(을|를)\s+(\S+)하는'), r'\2'),
+    (re.compile(r'(\S+)하는'), r'\1'),
+    # 5. "~니다" 종결 제거
+    (re.compile(r'니다\.?$'), ''),
+    # 6. "작업", "업무" 제거
+    (re.compile(r'\s*(작업|업무)\.?$'), ''),
+    # 7. 마침표, 쉼표 제거
+    (re.compile(r'[.,;]+$'), ''),
+)
+_WHITESPACE_RE = re.compile(r'\s+')
+_CATEGORY_PREFIX_RE = re.compile(r'^카테고리:\s*')
+
+
 def clean_task_description(text: str) -> str:
     """
     업무 설명을 간결하게 정리
@@ -25,36 +54,11 @@ def clean_task_description(text: str) -> str:
         return text
     
     result = text
-    
-    # 1. 종결어미 제거 (합니다, 입니다, 습니다, 함, 임)
-    result = re.sub(r'(합니다|입니다|습니다)\.?$', '', result)
-    result = re.sub(r'(함|임)\.?$', '', result)
-    
-    # 2. "~하고 ... 합니다/진행함" 패턴 → "~하고 ... 진행"
-    result = re.sub(r'하고\s+(\S+)\s+(진행|수행|실시)합니다?', r'하고 \1 \2', result)
-    result = re.sub(r'하고\s+(\S+)\s+(진행|수행|실시)함', r'하고 \1 \2', result)
-    
-    # 3. "~를/을 [동사]합니다" → "[동사]"
-    result = re.sub(r'(을|를)\s+(\S+)합니다\.?$', r'\2', result)
-    result = re.sub(r'(을|를)\s+(\S+)함\.?$', r'\2', result)
-    
-    # 4. "~하는" 형태 제거
-    result = re.sub(r'하는$', '', result)
-    result = re.sub(r'하는\s+(작업|업무)', '', result)
-    result = re.sub(r'(을|를)\s+(\S+)하는', r'\2', result)
-    result = re.sub(r'(\S+)하는', r'\1', result)
-    
-    # 5. "~니다" 종결 제거
-    result = re.sub(r'니다\.?$', '', result)
-    
-    # 6. "작업", "업무" 제거
-    result = re.sub(r'\s*(작업|업무)\.?$', '', result)
-    
-    # 7. 마침표, 쉼표 제거
-    result = re.sub(r'[.,;]+$', '', result)
+    for pattern, replacement in _TASK_DESCRIPTION_SUBS:
+        result = pattern.sub(replacement, result)
     
     # 8. 연속된 공백 제거 및 앞뒤 공백 제거
-    result = re.sub(r'\s+', ' ', result).strip()
+    result = _WHITESPACE_RE.sub(' ', result).strip()
     
     return result
 
@@ -62,6 +66,22 @@ def clean_task_description(text: str) -> str:
 class DailyReportPDFGenerator(BasePDFGenerator):
     """일일보고서 PDF 생성기"""
     
+    # 세부업무 표 시간대별 Y 좌표 (상단 기준, 보정된 좌표 +25px)
+    # 시간은 출력하지 않음 (템플릿에 이미 인쇄됨)
+    _DETAIL_ROW_Y = (
+        265,  # 09:00
+        295,  # 10:00
+        325,  # 11:00
+        350,  # 12:00
+        380,  # 13:00
+        410,  # 14:00
+        440,  # 15:00
+        465,  # 16:00
+        495   # 17:00
+    )
+    # 레이아웃이 고정이므로 PDF 좌표계 변환도 클래스 로드 시 한 번만 계산
+    _DETAIL_ROW_PDF_Y = tuple(BasePDFGenerator.PAGE_HEIGHT - y for y in _DETAIL_ROW_Y)
+    
     def __init__(self):
         # 템플릿 파일명 (실제 파일명에 맞게 수정 필요)
         super().__init__("일일 업무 보고서.pdf")
@@ -131,59 +151,36 @@ class DailyReportPDFGenerator(BasePDFGenerator):
         # 시간은 출력하지 않음 (템플릿에 이미 인쇄됨)
         # 업무내용 x=260, 비고 x=620
         # ========================================
-        # 시간대별 Y 좌표 맵핑 (보정된 좌표 +25px)
-        time_slot_y_positions = [
-            265,  # 09:00
-            295,  # 10:00
-            325,  # 11:00
-            350,  # 12:00
-            380,  # 13:00
-            410,  # 14:00
-            440,  # 15:00
-            465,  # 16:00
-            495   # 17:00
-        ]
+        # 최대 9개 업무 표시 (시간대 좌표가 있는 업무만, zip이 짧은 쪽에서 멈춤)
+        task_rows = list(zip(daily.detail_tasks[:9], self._DETAIL_ROW_PDF_Y))
         
-        # 최대 9개 업무 표시
-        detail_tasks = daily.detail_tasks[:9] if len(daily.detail_tasks) > 9 else daily.detail_tasks
-        
-        for idx, task in enumerate(detail_tasks):
-            if idx >= len(time_slot_y_positions):
-                break
-            
-            y_pos = time_slot_y_positions[idx]
-            
-            # 업무내용 (좌측 정렬)
-            업무내용 = task.text
-            업무내용 = clean_task_description(업무내용)  # 간결하게 정리
-            업무내용 = truncate_text(업무내용, max_length=32)
-            
-            self.draw_text(
-                x=195,
-                y=self._to_pdf_y(y_pos),
-                text=업무내용,
-                font_size=10
-            )
-            
-            # 비고 (좌측 정렬)
-            비고 = task.note or ""
-            if 비고:
-                # "카테고리: " 제거
-                비고 = re.sub(r'^카테고리:\s*', '', 비고)
-                비고 = truncate_text(비고, max_length=20)
-                self.draw_text(
-                    x=460,
-                    y=self._to_pdf_y(y_pos),
-                    text=비고,
-                    font_size=9
-                )
+        # 업무내용(10pt) 열과 비고(9pt) 열을 각각 하나의 텍스트 객체로 그림
+        self.draw_text_column(
+            x=195,
+            rows=[
+                # 업무내용 (좌측 정렬, 간결하게 정리)
+                (pdf_y, truncate_text(clean_task_description(task.text), max_length=32))
+                for task, pdf_y in task_rows
+            ],
+            font_size=10
+        )
+        self.draw_text_column(
+            x=460,
+            rows=[
+                # 비고 (좌측 정렬, "카테고리: " 제거)
+                (pdf_y, truncate_text(_CATEGORY_PREFIX_RE.sub('', task.note), max_length=20))
+                for task, pdf_y in task_rows
+                if task.note
+            ],
+            font_size=9
+        )
         
         # ========================================
         # 미종결 업무사항 (font 10pt)
         # x=150, y=835
         # ========================================
         if daily.pending:
-            미종결_업무 = "\n".join([f"• {issue}" for issue in daily.pending])
+            미종결_업무 = format_bullet_list(daily.pending)
             self.draw_multiline_text(
                 x=195,
                 y=self._to_pdf_y(535),
@@ -197,7 +194,7 @@ class DailyReportPDFGenerator(BasePDFGenerator):
         # x=150, y=920
         # ========================================
         if daily.plans:
-            익일_업무계획 = "\n".join([f"• {plan}" for plan in daily.plans])
+            익일_업무계획 = format_bullet_list(daily.plans)
             self.draw_multiline_text(
                 x=195,
                 y=self._to_pdf_y(630),
@@ -224,7 +221,7 @@ class DailyReportPDFGenerator(BasePDFGenerator):
         
         # 템플릿과 병합
         if output_filename is None:
-            output_filename = f"일일보고서_{report.owner}_{format_korean_date(report.period_start)}.pdf"
+            output_filename = f"일일보고서_{report.owner}_{작성일자}.pdf"
         
         # 일일 보고서 전용 디렉토리에 저장
         daily_dir = self.OUTPUT_DIR / "daily"
@@ -241,6 +238,24 @@ class DailyReportPDFGenerator(BasePDFGenerator):
         return pdf_bytes
 
 
+# generate_daily_pdf_from_json에서 재사용하는 생성기 (요청마다 인스턴스/버퍼를 새로 만들지 않음)
+_daily_generator: Optional[DailyReportPDFGenerator] = None
+_daily_generator_lock = Lock()
+
+
+def _get_daily_generator() -> DailyReportPDFGenerator:
+    """
+    공유 일일보고서 PDF 생성기 반환 (_daily_generator_lock을 잡은 상태에서 호출)
+    
+    Returns:
+        DailyReportPDFGenerator 인스턴스
+    """
+    global _daily_generator
+    if _daily_generator is None:
+        _daily_generator = DailyReportPDFGenerator()
+    return _daily_generator
+
+
 def generate_daily_pdf_from_json(report_json: dict, output_filename: Optional[str] = None) -> bytes:
     """
     JSON에서 직접 PDF 생성 (편의 함수)
@@ -253,6 +268,7 @@ def generate_daily_pdf_from_json(report_json: dict, output_filename: Optional[st
         PDF 바이트 스트림
     """
     report = CanonicalReport(**report_json)
-    generator = DailyReportPDFGenerator()
-    return generator.generate(report, output_filename)
+    # 생성기는 overlay 버퍼/Canvas를 가진 상태 객체이므로 공유 인스턴스는 잠금 안에서만 사용
+    with _daily_generator_lock:
+        return _get_daily_generator().generate(report, output_filename)
 
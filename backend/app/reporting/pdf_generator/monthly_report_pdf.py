@@ -5,17 +5,24 @@ Monthly Report PDF Generator
 템플릿: backend/Data/reports/월간 업무 보고서.pdf
 """
 from datetime import date
-from typing import Optional
+from typing import List, Optional, Tuple
 from pathlib import Path
 
 from app.reporting.pdf_generator.base import BasePDFGenerator
-from app.reporting.pdf_generator.utils import format_korean_date, truncate_text
+from app.reporting.pdf_generator.utils import format_bullet_list, format_korean_date
 from app.domain.report.core.schemas import CanonicalReport
 
 
 class MonthlyReportPDFGenerator(BasePDFGenerator):
     """월간보고서 PDF 생성기"""
     
+    # 주차별 세부 업무 표 (보통 4주차까지 출력, 행 Y 좌표는 클래스 로드 시 PDF 좌표로 한 번만 변환)
+    _WEEKS = ('1주차', '2주차', '3주차', '4주차')
+    _TABLE_START_Y = 391  # TODO: 좌표 조정
+    _ROW_HEIGHT = 60  # TODO: 주차별 행 높이 조정
+    _WEEK_ROW_Y = tuple(range(_TABLE_START_Y, _TABLE_START_Y + len(_WEEKS) * _ROW_HEIGHT, _ROW_HEIGHT))
+    _WEEK_ROW_PDF_Y = tuple(BasePDFGenerator.PAGE_HEIGHT - y for y in _WEEK_ROW_Y)
+    
     def __init__(self):
         super().__init__("월간 업무 보고서.pdf")
     
@@ -36,6 +43,9 @@ class MonthlyReportPDFGenerator(BasePDFGenerator):
         """
         self._init_canvas()
         
+        # 그릴 텍스트를 (x, y, 텍스트, 폰트 크기, 줄 간격)으로 모았다가 save_overlay 전에 한 번에 그림
+        text_items: List[Tuple[float, float, str, int, float]] = []
+        
         # ========================================
         # 헤더: 월, 작성일자, 성명
         # ========================================
@@ -43,9 +53,9 @@ class MonthlyReportPDFGenerator(BasePDFGenerator):
         작성일자 = format_korean_date(report.period_end)
         성명 = report.owner
         
-        self.draw_text(50, self._to_pdf_y(106), 월, font_size=13)  # TODO: 좌표 조정
-        self.draw_text(170, self._to_pdf_y(106), 작성일자, font_size=11)  # TODO: 좌표 조정
-        self.draw_text(340, self._to_pdf_y(106), 성명, font_size=11)  # TODO: 좌표 조정
+        text_items.append((50, self._to_pdf_y(106), 월, 13, 0))  # TODO: 좌표 조정
+        text_items.append((170, self._to_pdf_y(106), 작성일자, 11, 0))  # TODO: 좌표 조정
+        text_items.append((340, self._to_pdf_y(106), 성명, 11, 0))  # TODO: 좌표 조정
         
         if not report.monthly:
             raise ValueError("CanonicalReport must have monthly data for monthly report PDF generation")
@@ -61,28 +71,15 @@ class MonthlyReportPDFGenerator(BasePDFGenerator):
         # ========================================
         # 주차별 세부 업무 (1주차 ~ 4/5주차)
         # ========================================
-        weeks = ['1주차', '2주차', '3주차', '4주차', '5주차']
-        table_start_y = 391  # TODO: 좌표 조정
-        row_height = 60  # TODO: 주차별 행 높이 조정
-        
-        for week_idx, week in enumerate(weeks[:4]):  # 보통 4주차까지
-            current_y = self._to_pdf_y(table_start_y + (week_idx * row_height))
-            
+        for week, current_y in zip(self._WEEKS, self._WEEK_ROW_PDF_Y):
             # 해당 주차의 업무들
             week_tasks = monthly.weekly_summaries.get(week, [])
             
             if week_tasks:
                 print(f"   {week}: {len(week_tasks)}개 업무")
-                task_texts = [f"• {truncate_text(task, 30)}" for task in week_tasks[:3]]
-                task_summary = "\n".join(task_texts)
+                task_summary = format_bullet_list(week_tasks[:3], max_length=30)
                 
-                self.draw_multiline_text(
-                    x=200,  # TODO: 좌표 조정
-                    y=current_y,
-                    text=task_summary,
-                    font_size=9,
-                    line_height=12
-                )
+                text_items.append((200, current_y, task_summary, 9, 12))  # TODO: 좌표 조정
             else:
                 print(f"   {week}: 데이터 없음")
         
@@ -91,15 +88,9 @@ class MonthlyReportPDFGenerator(BasePDFGenerator):
         # ========================================
         if monthly.next_month_plan:
             익월_계획 = monthly.next_month_plan
-            self.draw_multiline_text(
-                x=130,  # TODO: 좌표 조정
-                y=self._to_pdf_y(720),
-                text=익월_계획,
-                font_size=10,
-                line_height=14
-            )
-        
+            text_items.append((130, self._to_pdf_y(720), 익월_계획, 10, 14))  # TODO: 좌표 조정
         
+        self.draw_text_batch(text_items)
         self.save_overlay()
         
         if output_filename is None:
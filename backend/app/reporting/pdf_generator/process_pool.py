@@ -0,0 +1,110 @@
+"""
+PDF Generation Process Pool
+
+ReportLab 드로잉과 PyPDF2 병합은 순수 파이썬 CPU 작업이라 스레드로는 GIL에 막히므로,
+별도 프로세스 풀에서 실행하여 이벤트 루프를 막지 않고 여러 PDF를 병렬로 생성
+"""
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from threading import Lock
+from typing import Optional
+
+from app.reporting.pdf_generator.daily_report_pdf import (
+    DailyReportPDFGenerator,
+    generate_daily_pdf_from_json,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# 워커 프로세스 수 (기본: CPU 코어 수)
+PDF_POOL_WORKERS = int(os.getenv("REPORT_PDF_WORKERS", str(os.cpu_count() or 1)))
+
+# 워커 시작 방식: 부모(API 서버)는 스레드·이벤트 루프·DB/Chroma 연결을 가진 상태이므로
+# fork로 그 상태를 복제하지 않고 깨끗한 인터프리터에서 시작 (spawn)
+PDF_POOL_START_METHOD = os.getenv("REPORT_PDF_START_METHOD", "spawn")
+
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+_pdf_pool_lock = Lock()
+
+
+def _warm_up_pdf_worker():
+    """워커 프로세스 초기화 (폰트 등록 + 템플릿 첫 페이지 캐시)"""
+    DailyReportPDFGenerator().warm_up()
+
+
+def _generate_daily_pdf(report_json: dict, output_filename: Optional[str]) -> bytes:
+    """워커 프로세스에서 실행되는 일일보고서 PDF 생성 (pickle 가능하도록 모듈 최상위 함수)"""
+    return generate_daily_pdf_from_json(report_json, output_filename)
+
+
+def get_pdf_pool() -> ProcessPoolExecutor:
+    """
+    PDF 생성용 프로세스 풀 반환 (처음 사용할 때 생성)
+
+    Returns:
+        ProcessPoolExecutor 인스턴스
+    """
+    global _pdf_pool
+    if _pdf_pool is None:
+        with _pdf_pool_lock:
+            if _pdf_pool is None:
+                _pdf_pool = ProcessPoolExecutor(
+                    max_workers=PDF_POOL_WORKERS,
+                    mp_context=multiprocessing.get_context(PDF_POOL_START_METHOD),
+                    initializer=_warm_up_pdf_worker
+                )
+    return _pdf_pool
+
+
+def _discard_broken_pdf_pool(pool: ProcessPoolExecutor):
+    """
+    워커가 비정상 종료되어 깨진 풀을 버림 (다음 get_pdf_pool 호출 시 새로 생성)
+
+    여러 요청이 동시에 같은 깨진 풀을 만나도, 이미 새로 만든 풀은 버리지 않도록 인스턴스를 비교
+    """
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is pool:
+            _pdf_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_pdf_pool():
+    """PDF 프로세스 풀 종료 (애플리케이션 종료 시 호출)"""
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is not None:
+            _pdf_pool.shutdown(wait=False, cancel_futures=True)
+            _pdf_pool = None
+
+
+async def generate_daily_pdf_async(report_json: dict, output_filename: Optional[str] = None) -> bytes:
+    """
+    일일보고서 PDF를 프로세스 풀에서 생성 (비동기)
+
+    워커가 비정상 종료(OOM 등)되어 풀이 깨지면 풀을 새로 만들어 한 번 재시도합니다.
+
+    Args:
+        report_json: CanonicalReport JSON dict (model_dump(mode='json') 결과처럼 pickle 가능한 값만 포함)
+        output_filename: 출력 파일명 (None이면 "일일보고서_{작성자}_{작성일자}.pdf"로 자동 생성, None이어도 항상 output/report_result/daily에 저장)
+
+    Returns:
+        PDF 바이트 스트림
+
+    Raises:
+        BrokenProcessPool: 새로 만든 풀에서도 워커가 비정상 종료된 경우
+    """
+    loop = asyncio.get_running_loop()
+    pool = get_pdf_pool()
+    try:
+        return await loop.run_in_executor(pool, _generate_daily_pdf, report_json, output_filename)
+    except BrokenProcessPool:
+        logger.warning("PDF 프로세스 풀이 손상되어 새로 생성 후 재시도합니다")
+        _discard_broken_pdf_pool(pool)
+
+    return await loop.run_in_executor(get_pdf_pool(), _generate_daily_pdf, report_json, output_filename)
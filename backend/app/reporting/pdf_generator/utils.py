@@ -4,9 +4,27 @@ PDF Generator Utility Functions
 좌표 변환, 텍스트 포맷팅 등 공통 유틸리티
 """
 from datetime import date, datetime
-from typing import Optional
-
-
+from functools import lru_cache
+from typing import List, Optional
+
+
+# 우선순위/상태 한글 매핑 (호출마다 dict를 새로 만들지 않도록 모듈 상수로 둠)
+_PRIORITY_TEXT = {
+    "high": "높음",
+    "medium": "보통",
+    "low": "낮음"
+}
+_STATUS_TEXT = {
+    "completed": "완료",
+    "in_progress": "진행중",
+    "pending": "대기",
+    "완료": "완료",
+    "진행중": "진행중"
+}
+
+
+# 같은 날짜가 보고서마다 반복 포맷되므로 결과를 캐시 (date/str/None 모두 hashable)
+@lru_cache(maxsize=1024)
 def format_date(d: Optional[date], format_str: str = "%Y-%m-%d") -> str:
     """
     날짜를 문자열로 포맷
@@ -28,6 +46,7 @@ def format_date(d: Optional[date], format_str: str = "%Y-%m-%d") -> str:
     return d.strftime(format_str)
 
 
+@lru_cache(maxsize=1024)
 def format_korean_date(d: Optional[date]) -> str:
     """
     날짜를 한글 형식으로 포맷
@@ -69,6 +88,32 @@ def truncate_text(text: str, max_length: int = 50, suffix: str = "...") -> str:
     return text[:max_length - len(suffix)] + suffix
 
 
+# 글머리 기호 (목록 항목 앞에 붙임)
+BULLET = "• "
+_BULLET_SEPARATOR = "\n" + BULLET
+
+
+def format_bullet_list(items: List[str], max_length: Optional[int] = None) -> str:
+    """
+    항목들을 글머리 기호 목록 문자열로 변환
+    
+    Args:
+        items: 항목 문자열 리스트
+        max_length: 항목별 최대 길이 (None이면 자르지 않음)
+        
+    Returns:
+        "• 항목1\n• 항목2" 형식 문자열 (항목이 없으면 빈 문자열)
+    """
+    if not items:
+        return ""
+    
+    if max_length is not None:
+        # 대부분 짧은 항목이므로 길이 확인만 하고, 긴 항목만 truncate_text 호출
+        items = [item if len(item) <= max_length else truncate_text(item, max_length) for item in items]
+    
+    return BULLET + _BULLET_SEPARATOR.join(items)
+
+
 def wrap_text(text: str, max_width: int = 40) -> list:
     """
     텍스트를 최대 너비로 줄바꿈
@@ -83,20 +128,8 @@ def wrap_text(text: str, max_width: int = 40) -> list:
     if len(text) <= max_width:
         return [text]
     
-    lines = []
-    current_line = ""
-    
-    for char in text:
-        if len(current_line) >= max_width:
-            lines.append(current_line)
-            current_line = char
-        else:
-            current_line += char
-    
-    if current_line:
-        lines.append(current_line)
-    
-    return lines
+    # max_width 글자씩 슬라이스 (문자 단위로 이어 붙이지 않음)
+    return [text[i:i + max_width] for i in range(0, len(text), max_width)]
 
 
 def get_priority_text(priority: str) -> str:
@@ -109,12 +142,7 @@ def get_priority_text(priority: str) -> str:
     Returns:
         "높음", "보통", "낮음"
     """
-    mapping = {
-        "high": "높음",
-        "medium": "보통",
-        "low": "낮음"
-    }
-    return mapping.get(priority, "보통")
+    return _PRIORITY_TEXT.get(priority, "보통")
 
 
 def get_status_text(status: str) -> str:
@@ -127,14 +155,7 @@ def get_status_text(status: str) -> str:
     Returns:
         한글 상태
     """
-    mapping = {
-        "completed": "완료",
-        "in_progress": "진행중",
-        "pending": "대기",
-        "완료": "완료",
-        "진행중": "진행중"
-    }
-    return mapping.get(status, status)
+    return _STATUS_TEXT.get(status, status)
 
 
 # PDF 좌표 상수 (A4 기준, points)
@@ -5,17 +5,28 @@ Weekly Report PDF Generator
 템플릿: backend/Data/reports/주간 업무 보고서.pdf
 """
 from datetime import date
-from typing import Optional
+from typing import List, Optional, Tuple
 from pathlib import Path
 
 from app.reporting.pdf_generator.base import BasePDFGenerator
-from app.reporting.pdf_generator.utils import format_korean_date, truncate_text
+from app.reporting.pdf_generator.utils import format_bullet_list, format_korean_date, truncate_text
 from app.domain.report.core.schemas import CanonicalReport
 
 
 class WeeklyReportPDFGenerator(BasePDFGenerator):
     """주간보고서 PDF 생성기"""
     
+    # 요일별 세부 업무 표 (행 Y 좌표는 고정 레이아웃이므로 클래스 로드 시 PDF 좌표로 한 번만 변환)
+    _WEEKDAYS = ('월요일', '화요일', '수요일', '목요일', '금요일')
+    _TABLE_START_Y = 391  # TODO: 좌표 조정
+    _ROW_HEIGHT = 49  # TODO: 요일별 행 높이 조정
+    _WEEKDAY_ROW_Y = tuple(range(_TABLE_START_Y, _TABLE_START_Y + len(_WEEKDAYS) * _ROW_HEIGHT, _ROW_HEIGHT))
+    _WEEKDAY_ROW_PDF_Y = tuple(BasePDFGenerator.PAGE_HEIGHT - y for y in _WEEKDAY_ROW_Y)
+    
+    # 주간 업무 목표 행 Y 좌표 (최대 3개, 30pt 간격)
+    _GOAL_ROW_Y = (213, 243, 273)  # TODO: 좌표 조정
+    _GOAL_ROW_PDF_Y = tuple(BasePDFGenerator.PAGE_HEIGHT - y for y in _GOAL_ROW_Y)
+    
     def __init__(self):
         super().__init__("주간 업무 보고서.pdf")
     
@@ -36,6 +47,9 @@ class WeeklyReportPDFGenerator(BasePDFGenerator):
         """
         self._init_canvas()
         
+        # 그릴 텍스트를 (x, y, 텍스트, 폰트 크기, 줄 간격)으로 모았다가 save_overlay 전에 한 번에 그림
+        text_items: List[Tuple[float, float, str, int, float]] = []
+        
         # ========================================
         # 헤더: 작성일자(금요일), 성명
         # 기간(월~금)은 데이터 저장용으로만 사용, PDF에는 출력하지 않음
@@ -43,8 +57,8 @@ class WeeklyReportPDFGenerator(BasePDFGenerator):
         작성일자 = format_korean_date(report.period_end)  # 금요일 날짜
         성명 = report.owner
         
-        self.draw_text(175, self._to_pdf_y(107), 작성일자, font_size=11)  # TODO: 좌표 조정
-        self.draw_text(340, self._to_pdf_y(107), 성명, font_size=11)  # TODO: 좌표 조정
+        text_items.append((175, self._to_pdf_y(107), 작성일자, 11, 0))  # TODO: 좌표 조정
+        text_items.append((340, self._to_pdf_y(107), 성명, 11, 0))  # TODO: 좌표 조정
         
         if not report.weekly:
             raise ValueError("CanonicalReport must have weekly data for weekly report PDF generation")
@@ -57,73 +71,42 @@ class WeeklyReportPDFGenerator(BasePDFGenerator):
         주간_목표 = weekly.weekly_goals or []
         
         if 주간_목표:
-            y_offset = 213  # TODO: 좌표 조정
-            for idx, goal in enumerate(주간_목표[:3]):  # 최대 3개
+            for goal, goal_y in zip(주간_목표, self._GOAL_ROW_PDF_Y):  # 최대 3개
                 goal_text = goal if isinstance(goal, str) else str(goal)
                 plan_text = f"{truncate_text(goal_text, 50)}"
-                self.draw_text(
-                    x=180,  # TODO: 좌표 조정
-                    y=self._to_pdf_y(y_offset + (idx * 30)),
-                    text=plan_text,
-                    font_size=10
-                )
+                text_items.append((180, goal_y, plan_text, 10, 0))  # TODO: 좌표 조정
         
         # ========================================
         # 요일별 세부 업무 (월~금)
         # ========================================
-        weekdays = ['월요일', '화요일', '수요일', '목요일', '금요일']
-        
         # weekday_tasks에서 요일별 업무 가져오기
         weekday_tasks = weekly.weekday_tasks or {}
         
-        table_start_y = 391  # TODO: 좌표 조정
-        row_height = 49  # TODO: 요일별 행 높이 조정
-        
-        for day_idx, weekday in enumerate(weekdays):
-            current_y = self._to_pdf_y(table_start_y + (day_idx * row_height))
-            
+        for weekday, current_y in zip(self._WEEKDAYS, self._WEEKDAY_ROW_PDF_Y):
             # 해당 요일의 업무 목록
             day_tasks = weekday_tasks.get(weekday, [])
             
             if day_tasks:
                 # 업무 목록을 그대로 출력 (최대 3개)
-                task_texts = [f"• {truncate_text(task, 50)}" for task in day_tasks[:3]]
-                task_summary = "\n".join(task_texts)
+                task_summary = format_bullet_list(day_tasks[:3], max_length=50)
                 
-                self.draw_multiline_text(
-                    x=200,  # TODO: 좌표 조정
-                    y=current_y,
-                    text=task_summary,
-                    font_size=9,
-                    line_height=12
-                )
+                text_items.append((200, current_y, task_summary, 9, 12))  # TODO: 좌표 조정
         
         # ========================================
         # 주간 중요 업무
         # ========================================
         중요_업무_리스트 = weekly.weekly_highlights or []
         if 중요_업무_리스트:
-            중요_업무_텍스트 = "\n".join([f"• {task}" for task in 중요_업무_리스트[:3]])
-            self.draw_multiline_text(
-                x=130,  # TODO: 좌표 조정
-                y=self._to_pdf_y(660),
-                text=중요_업무_텍스트,
-                font_size=10,
-                line_height=14
-            )
+            중요_업무_텍스트 = format_bullet_list(중요_업무_리스트[:3])
+            text_items.append((130, self._to_pdf_y(660), 중요_업무_텍스트, 10, 14))  # TODO: 좌표 조정
         
         # ========================================
         # 특이사항
         # ========================================
         if weekly.notes:
-            self.draw_multiline_text(
-                x=130,  # TODO: 좌표 조정
-                y=self._to_pdf_y(745),
-                text=weekly.notes,
-                font_size=10,
-                line_height=14
-            )
+            text_items.append((130, self._to_pdf_y(745), weekly.notes, 10, 14))  # TODO: 좌표 조정
         
+        self.draw_text_batch(text_items)
         self.save_overlay()
         
         if output_filename is None:
@@ -16,6 +16,7 @@ from app.domain.report.core.schemas import CanonicalReport
 from app.reporting.pdf_generator.daily_report_pdf import DailyReportPDFGenerator
 from app.reporting.pdf_generator.weekly_report_pdf import WeeklyReportPDFGenerator
 from app.reporting.pdf_generator.monthly_report_pdf import MonthlyReportPDFGenerator
+from app.reporting.pdf_generator.process_pool import generate_daily_pdf_async
 
 
 class ReportExportService:
@@ -59,6 +60,37 @@ class ReportExportService:
         
         return pdf_bytes
     
+    @staticmethod
+    async def export_daily_pdf_async(
+        db: Session,
+        owner: str,
+        report_date: date,
+        output_filename: Optional[str] = None
+    ) -> bytes:
+        """
+        일일보고서 PDF 생성 (비동기, PDF 생성은 프로세스 풀에서 실행)
+        
+        Args:
+            db: 데이터베이스 세션
+            owner: 작성자
+            report_date: 보고서 날짜
+            output_filename: 출력 파일명 (None이면 자동 생성)
+            
+        Returns:
+            PDF 바이트 스트림
+            
+        Raises:
+            ValueError: 보고서를 찾을 수 없는 경우
+        """
+        # DB에서 일일보고서 조회
+        daily_report = DailyReportRepository.get_by_owner_and_date(db, owner, report_date)
+        
+        if not daily_report:
+            raise ValueError(f"일일보고서를 찾을 수 없습니다: {owner} - {report_date}")
+        
+        # PDF 생성 (report_json은 JSONB에서 읽은 dict라 그대로 워커 프로세스로 전달 가능)
+        return await generate_daily_pdf_async(daily_report.report_json, output_filename)
+    
     @staticmethod
     def export_weekly_pdf(
         db: Session,
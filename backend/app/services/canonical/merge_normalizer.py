@@ -11,10 +11,11 @@ Author: AI Assistant
 Created: 2025-11-18
 """
 import hashlib
+import io
 from typing import Dict, Any
 from datetime import date
 
-from app.domain.report.core.schemas import CanonicalReport, TaskItem
+from app.domain.report.core.schemas import CanonicalReport
 from app.domain.common.canonical_schema import (
     UnifiedCanonical,
     DocumentSections,
@@ -38,11 +39,15 @@ def generate_doc_id(*parts: str) -> str:
         *parts: ID 생성에 사용할 문자열들
         
     Returns:
-        SHA256 해시 기반 ID (32자)
+        BLAKE2b(16바이트) 해시 기반 ID (32자)
     """
-    combined = "|".join(str(p) for p in parts)
-    hash_obj = hashlib.sha256(combined.encode('utf-8'))
-    return hash_obj.hexdigest()[:32]
+    # 조합 문자열을 만들지 않고 "|" 구분자와 함께 파트를 순서대로 해시에 입력
+    hash_obj = hashlib.blake2b(digest_size=16)
+    for idx, part in enumerate(parts):
+        if idx:
+            hash_obj.update(b"|")
+        hash_obj.update(str(part).encode('utf-8'))
+    return hash_obj.hexdigest()
 
 
 # ========================================
@@ -154,39 +159,60 @@ def _generate_report_summary(canonical: CanonicalReport) -> str:
 
 def _generate_report_raw_text(canonical: CanonicalReport) -> str:
     """보고서 전체 텍스트 생성 (검색용)"""
-    parts = []
+    # 줄마다 문자열을 만들어 이어 붙이지 않고 버퍼에 조각 단위로 기록
+    buf = io.StringIO()
+    write = buf.write
+    # 줄 구분자는 두 번째 줄부터 기록 (첫 줄 앞에는 붙이지 않음)
+    sep = ""
     
     # 작성자 및 날짜
     if canonical.owner:
-        parts.append(f"작성자: {canonical.owner}")
+        write("작성자: ")
+        write(str(canonical.owner))
+        sep = "\n"
     
     if canonical.period_start:
-        parts.append(f"날짜: {canonical.period_start.isoformat()}")
+        write(sep)
+        write("날짜: ")
+        write(canonical.period_start.isoformat())
+        sep = "\n"
     
     # Tasks
     if canonical.tasks:
-        parts.append("\n=== 작업 목록 ===")
+        write(sep)
+        write("\n=== 작업 목록 ===")
         for task in canonical.tasks:
-            task_text = f"- {task.title}"
+            write("\n- ")
+            write(str(task.title))
             if task.description:
-                task_text += f": {task.description}"
+                write(": ")
+                write(str(task.description))
             if task.time_start and task.time_end:
-                task_text += f" ({task.time_start}~{task.time_end})"
-            parts.append(task_text)
+                write(" (")
+                write(str(task.time_start))
+                write("~")
+                write(str(task.time_end))
+                write(")")
+        sep = "\n"
     
     # Issues
     if canonical.issues:
-        parts.append("\n=== 이슈 ===")
+        write(sep)
+        write("\n=== 이슈 ===")
         for issue in canonical.issues:
-            parts.append(f"- {issue}")
+            write("\n- ")
+            write(str(issue))
+        sep = "\n"
     
     # Plans
     if canonical.plans:
-        parts.append("\n=== 계획 ===")
+        write(sep)
+        write("\n=== 계획 ===")
         for plan in canonical.plans:
-            parts.append(f"- {plan}")
+            write("\n- ")
+            write(str(plan))
     
-    return "\n".join(parts)
+    return buf.getvalue()
 
 
 # ========================================
@@ -3,7 +3,9 @@
 
 일일보고서 완료 시 자동으로 벡터DB에 저장하는 함수들
 """
+import logging
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any
 from datetime import date
@@ -19,9 +21,15 @@ from app.domain.report.core.canonical_models import CanonicalReport
 from app.domain.report.core.chunker import chunk_canonical_report
 from app.domain.report.core.embedding_pipeline import get_embedding_pipeline
 
+logger = logging.getLogger(__name__)
 
 BATCH_SIZE = 50
 
+# 벡터DB 쓰기 전용 단일 워커
+# 요청 처리 경로에서 임베딩·upsert를 기다리지 않도록 백그라운드로 넘기고,
+# Chroma 쓰기는 동시에 여러 개가 돌지 않도록 워커 1개로 직렬 처리
+_ingest_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="report-ingest")
+
 
 def ingest_single_report(
     report: CanonicalReport,
@@ -81,6 +89,52 @@ def ingest_single_report(
         }
 
 
+def submit_report_ingestion(
+    report: CanonicalReport,
+    api_key: str = None
+) -> Future:
+    """
+    단일 보고서 벡터DB 저장을 백그라운드 워커에 맡기고 즉시 반환
+    
+    결과 로그는 ingest_single_report가 워커에서 출력하고, 실패하면 완료 콜백이
+    작성자/날짜/report_id를 에러 로그로 남깁니다 (요청은 이미 응답했으므로 호출자에게 돌려줄 수 없음).
+    
+    Args:
+        report: CanonicalReport 객체
+        api_key: OpenAI API 키 (None이면 환경변수에서 읽음)
+        
+    Returns:
+        ingest_single_report 결과 딕셔너리를 담을 Future
+    """
+    future = _ingest_executor.submit(ingest_single_report, report, api_key)
+    future.add_done_callback(lambda done: _record_ingestion_result(report, done))
+    return future
+
+
+def _record_ingestion_result(report: CanonicalReport, future: Future) -> None:
+    """백그라운드 ingestion 완료 콜백: 실패하면 작성자/날짜를 에러 로그로 남김"""
+    if future.cancelled():
+        error = "cancelled"
+    elif future.exception() is not None:
+        error = str(future.exception())
+    else:
+        result = future.result()
+        error = None if result.get("success") else result.get("error") or result.get("message")
+    
+    if error is None:
+        return
+    
+    logger.error(
+        "보고서 벡터DB 저장 실패: owner=%s, date=%s, report_id=%s, error=%s",
+        report.owner, report.period_start, report.report_id, error
+    )
+
+
+def shutdown_ingest_executor() -> None:
+    """앱 종료 시 백그라운드 ingestion 워커 종료 (대기 중인 작업은 기다리지 않음)"""
+    _ingest_executor.shutdown(wait=False)
+
+
 def ingest_single_report_silent(
     report: CanonicalReport,
     api_key: str = None
@@ -7,8 +7,12 @@ HF와 OpenAI 중 선택 가능한 임베딩 서비스
 import os
 from typing import List, Optional
 from sentence_transformers import SentenceTransformer
-from openai import OpenAI
 
+from app.llm.client import get_openai_client
+
+# text-embedding-3-large 출력 차원 (API의 dimensions 파라미터로 축소 가능, 최대 3072)
+# 1024로 줄이면 벡터 크기와 HNSW 거리 계산 비용이 1/3로 줄지만, 기존 컬렉션과 차원이 달라지므로 재적재 필요
+OPENAI_EMBEDDING_DIMENSIONS = int(os.getenv("REPORT_OPENAI_EMBEDDING_DIMENSIONS", "3072"))
 
 class EmbeddingService:
     """유연한 임베딩 생성 서비스 (HF/OpenAI 선택)"""
@@ -29,9 +33,9 @@ class EmbeddingService:
             self.model = SentenceTransformer('sentence-transformers/all-MiniLM-L12-v2')
             self.dimension = 384
         else:
-            self.client = OpenAI(api_key=self.api_key)
+            self.client = get_openai_client(self.api_key)
             self.model = "text-embedding-3-large"
-            self.dimension = 3072
+            self.dimension = OPENAI_EMBEDDING_DIMENSIONS
     
     def embed_text(self, text: str) -> List[float]:
         """
@@ -49,7 +53,8 @@ class EmbeddingService:
             response = self.client.embeddings.create(
                 model=self.model,
                 input=text,
-                encoding_format="float"
+                encoding_format="float",
+                dimensions=self.dimension
             )
             return response.data[0].embedding
     
@@ -78,7 +83,8 @@ class EmbeddingService:
                 response = self.client.embeddings.create(
                     model=self.model,
                     input=batch,
-                    encoding_format="float"
+                    encoding_format="float",
+                    dimensions=self.dimension
                 )
                 batch_embeddings = [item.embedding for item in response.data]
                 embeddings.extend(batch_embeddings)
@@ -0,0 +1,59 @@
+"""
+하이브리드 검색 질의 분류 테스트
+
+_classify_query가 top_k 판단용 키워드 분류를 한 번의 스캔으로
+올바른 비트 마스크로 모으는지 확인
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.domain.report.search.hybrid_search import (
+    MASK_ALL_DATES,
+    MASK_COMPARISON,
+    MASK_STATISTICAL,
+    _classify_query,
+)
+
+
+def test_no_keywords():
+    """분류 키워드가 없으면 0"""
+    assert _classify_query("김철수 고객 상담 내역") == 0
+
+
+def test_single_category():
+    """키워드가 어절 안에 포함되어 있어도 부분 문자열로 매칭"""
+    assert _classify_query("지난달이랑 비교해줘") == MASK_COMPARISON
+    assert _classify_query("통계 보여줘") == MASK_STATISTICAL
+    assert _classify_query("전체 일정") == MASK_ALL_DATES
+
+
+def test_multiple_categories():
+    """여러 분류의 키워드가 있으면 비트가 모두 설정됨"""
+    mask = _classify_query("가장 많이 늘어난 업무 비교")
+    assert mask == MASK_COMPARISON | MASK_STATISTICAL
+
+
+def test_overlapping_keywords():
+    """겹치는 위치의 키워드(전체다 ⊃ 전체, 다)도 놓치지 않음"""
+    assert _classify_query("전체다") == MASK_ALL_DATES
+    assert _classify_query("많은") == MASK_STATISTICAL
+    assert _classify_query("비교비율") == MASK_COMPARISON
+
+
+def test_all_categories():
+    """세 분류가 모두 포함되면 전체 마스크"""
+    mask = _classify_query("모든 기간 건수 변화")
+    assert mask == MASK_ALL_DATES | MASK_COMPARISON | MASK_STATISTICAL
+
+
+if __name__ == "__main__":
+    test_no_keywords()
+    test_single_category()
+    test_multiple_categories()
+    test_overlapping_keywords()
+    test_all_categories()
+    print("모든 테스트 통과")
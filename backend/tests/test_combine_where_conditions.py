@@ -0,0 +1,117 @@
+"""
+Chroma where 필터 결합 테스트
+
+combine_where_conditions가 같은 필드 조건을 합치고, 교집합이 비면
+Chroma가 받을 수 있는 no-match 필터를 반환하는지 확인
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.domain.report.search.retriever import (
+    NO_MATCH_CONDITION,
+    combine_where_conditions,
+    is_no_match_filter,
+)
+
+
+def test_empty_conditions():
+    """조건이 없으면 None"""
+    assert combine_where_conditions([]) is None
+
+
+def test_single_condition_without_and():
+    """조건이 하나면 $and 없이 그대로 반환"""
+    assert combine_where_conditions([{"owner": "김보험"}]) == {"owner": "김보험"}
+
+
+def test_different_fields_are_and_combined():
+    """서로 다른 필드는 $and로 묶이고 술어 수는 조건 수와 같음"""
+    where = combine_where_conditions([
+        {"owner": "김보험"},
+        {"level": "daily"},
+        {"chunk_type": {"$in": ["summary", "detail"]}},
+    ])
+    assert where == {"$and": [
+        {"owner": "김보험"},
+        {"level": "daily"},
+        {"chunk_type": {"$in": ["summary", "detail"]}},
+    ]}
+    assert len(where["$and"]) == 3
+
+
+def test_same_field_conditions_are_merged():
+    """같은 필드의 $in/등호 조건은 교집합 하나로 합쳐져 술어 수가 줄어듦"""
+    where = combine_where_conditions([
+        {"report_type": {"$in": ["daily", "weekly", "monthly"]}},
+        {"report_type": {"$in": ["weekly", "daily"]}},
+        {"owner": "김보험"},
+    ])
+    assert where == {"$and": [
+        {"report_type": {"$in": ["daily", "weekly"]}},
+        {"owner": "김보험"},
+    ]}
+    assert len(where["$and"]) == 2
+
+
+def test_intersection_to_single_value_becomes_equality():
+    """교집합이 값 하나면 $in 대신 등호 조건이 되고, 유일한 조건이면 $and도 생략"""
+    where = combine_where_conditions([
+        {"report_type": {"$in": ["daily", "weekly", "monthly"]}},
+        {"report_type": "daily"},
+    ])
+    assert where == {"report_type": "daily"}
+
+
+def test_empty_intersection_returns_no_match():
+    """교집합이 비면 빈 $in 대신 no-match 필터를 반환"""
+    where = combine_where_conditions([
+        {"report_type": {"$in": ["daily"]}},
+        {"report_type": {"$in": ["weekly"]}},
+        {"owner": "김보험"},
+    ])
+    assert where == NO_MATCH_CONDITION
+    assert is_no_match_filter(where)
+    assert {"$in": []} not in [v for cond in where["$and"] for v in cond.values()]
+
+
+def test_empty_in_list_returns_no_match():
+    """처음 나온 조건의 $in 목록이 비어 있어도 빈 $in 대신 no-match 필터를 반환"""
+    assert combine_where_conditions([{"chunk_type": {"$in": []}}]) == NO_MATCH_CONDITION
+    where = combine_where_conditions([
+        {"owner": "김보험"},
+        {"chunk_type": {"$in": []}},
+        {"chunk_type": {"$in": ["summary"]}},
+    ])
+    assert where == NO_MATCH_CONDITION
+    assert is_no_match_filter(where)
+
+
+def test_operator_conditions_pass_through():
+    """$in 이외의 연산자 조건은 합치지 않고 그대로 유지"""
+    where = combine_where_conditions([
+        {"date_num": {"$gte": 20251103}},
+        {"date_num": {"$lte": 20251107}},
+        {"level": "daily"},
+    ])
+    assert where == {"$and": [
+        {"level": "daily"},
+        {"date_num": {"$gte": 20251103}},
+        {"date_num": {"$lte": 20251107}},
+    ]}
+    assert not is_no_match_filter(where)
+
+
+if __name__ == "__main__":
+    test_empty_conditions()
+    test_single_condition_without_and()
+    test_different_fields_are_and_combined()
+    test_same_field_conditions_are_merged()
+    test_intersection_to_single_value_becomes_equality()
+    test_empty_intersection_returns_no_match()
+    test_empty_in_list_returns_no_match()
+    test_operator_conditions_pass_through()
+    print("모든 테스트 통과")
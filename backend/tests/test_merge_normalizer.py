@@ -0,0 +1,85 @@
+"""
+보고서 검색용 원문 텍스트 생성 테스트
+
+_generate_report_raw_text가 StringIO 버퍼로 기록하기 전의
+줄 단위 결합 결과와 같은 텍스트를 만드는지 확인
+"""
+import sys
+from datetime import date
+from pathlib import Path
+from types import SimpleNamespace
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.services.canonical.merge_normalizer import _generate_report_raw_text
+
+
+def _report(owner="", period_start=None, tasks=(), issues=(), plans=()):
+    """_generate_report_raw_text가 읽는 속성만 가진 테스트용 보고서"""
+    return SimpleNamespace(
+        owner=owner,
+        period_start=period_start,
+        tasks=list(tasks),
+        issues=list(issues),
+        plans=list(plans),
+    )
+
+
+def _task(title, description="", time_start=None, time_end=None):
+    """테스트용 작업 항목"""
+    return SimpleNamespace(title=title, description=description, time_start=time_start, time_end=time_end)
+
+
+def test_empty_report():
+    """내용이 없으면 빈 문자열"""
+    assert _generate_report_raw_text(_report()) == ""
+
+
+def test_header_only():
+    """작성자/날짜만 있으면 두 줄"""
+    text = _generate_report_raw_text(_report(owner="김보험", period_start=date(2025, 11, 3)))
+    assert text == "작성자: 김보험\n날짜: 2025-11-03"
+
+
+def test_full_report():
+    """섹션 제목 앞 빈 줄, 작업 설명/시간 표기를 포함한 전체 텍스트"""
+    report = _report(
+        owner="김보험",
+        period_start=date(2025, 11, 3),
+        tasks=[
+            _task("고객 상담", "보장 분석", "09:00", "10:00"),
+            _task("회의"),
+            _task("자료 작성", time_start="13:00"),
+        ],
+        issues=["콜백 미완료"],
+        plans=["보장안 발송", "재통화"],
+    )
+    assert _generate_report_raw_text(report) == "\n".join([
+        "작성자: 김보험",
+        "날짜: 2025-11-03",
+        "\n=== 작업 목록 ===",
+        "- 고객 상담: 보장 분석 (09:00~10:00)",
+        "- 회의",
+        "- 자료 작성",
+        "\n=== 이슈 ===",
+        "- 콜백 미완료",
+        "\n=== 계획 ===",
+        "- 보장안 발송",
+        "- 재통화",
+    ])
+
+
+def test_section_without_header():
+    """작성자/날짜가 없으면 첫 섹션 앞에 구분 줄바꿈을 붙이지 않음"""
+    text = _generate_report_raw_text(_report(issues=["지연"]))
+    assert text == "\n=== 이슈 ===\n- 지연"
+
+
+if __name__ == "__main__":
+    test_empty_report()
+    test_header_only()
+    test_full_report()
+    test_section_without_header()
+    print("모든 테스트 통과")
@@ -0,0 +1,54 @@
+"""
+PDF 생성 유틸리티 테스트
+
+format_bullet_list가 기존 줄 단위 결합과 같은 문자열을 만드는지 확인
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.reporting.pdf_generator.utils import BULLET, format_bullet_list, truncate_text
+
+
+def test_empty_items():
+    """항목이 없으면 빈 문자열"""
+    assert format_bullet_list([]) == ""
+    assert format_bullet_list([], max_length=10) == ""
+
+
+def test_single_item():
+    """항목이 하나면 글머리 기호 한 줄"""
+    assert format_bullet_list(["고객 상담"]) == "• 고객 상담"
+
+
+def test_multiple_items_joined_by_newline():
+    """항목마다 글머리 기호를 붙여 줄바꿈으로 결합 (마지막 줄바꿈 없음)"""
+    items = ["고객 상담", "보장 분석", "회의"]
+    assert format_bullet_list(items) == "\n".join(f"{BULLET}{item}" for item in items)
+
+
+def test_max_length_truncates_only_long_items():
+    """max_length보다 긴 항목만 잘림"""
+    long_item = "가" * 60
+    result = format_bullet_list(["짧은 항목", long_item], max_length=50)
+    assert result == f"• 짧은 항목\n• {truncate_text(long_item, 50)}"
+    assert len(result.split("\n")[1]) == len(BULLET) + 50
+
+
+def test_items_not_mutated():
+    """입력 리스트는 변경하지 않음"""
+    items = ["가" * 60]
+    format_bullet_list(items, max_length=10)
+    assert items == ["가" * 60]
+
+
+if __name__ == "__main__":
+    test_empty_items()
+    test_single_item()
+    test_multiple_items_joined_by_newline()
+    test_max_length_truncates_only_long_items()
+    test_items_not_mutated()
+    print("모든 테스트 통과")
@@ -0,0 +1,48 @@
+"""
+검색 키워드 불변성 테스트
+
+extract_keywords가 캐시해서 공유하는 SearchKeywords의 날짜 범위를
+호출자가 수정할 수 없는지 확인
+"""
+import sys
+from dataclasses import replace
+from datetime import date
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.domain.report.search.hybrid_search import SearchKeywords
+
+
+def test_date_range_is_read_only():
+    """날짜 범위는 읽기 전용 (수정 시 TypeError)"""
+    keywords = SearchKeywords(date_range={"start": date(2025, 11, 3), "end": date(2025, 11, 7)})
+    try:
+        keywords.date_range["start"] = date(2025, 1, 1)
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("date_range가 수정 가능함")
+    assert keywords.date_range["start"] == date(2025, 11, 3)
+
+
+def test_date_range_is_copied_from_input():
+    """생성 후 입력 dict를 수정해도 키워드의 날짜 범위는 바뀌지 않음 (replace 포함)"""
+    source = {"start": date(2025, 11, 3), "end": date(2025, 11, 7)}
+    keywords = replace(SearchKeywords(), date_range=source)
+    source["end"] = date(2025, 12, 31)
+    assert keywords.date_range["end"] == date(2025, 11, 7)
+
+
+def test_no_date_range():
+    """날짜 범위가 없으면 None 유지"""
+    assert SearchKeywords().date_range is None
+
+
+if __name__ == "__main__":
+    test_date_range_is_read_only()
+    test_date_range_is_copied_from_input()
+    test_no_date_range()
+    print("모든 테스트 통과")
@@ -0,0 +1,111 @@
+"""
+주간 보고서 일괄 생성 API 테스트
+
+일괄 저장 중 한 작성자의 저장이 실패해도 세션을 롤백하고
+나머지 작성자의 저장을 계속하는지 확인
+"""
+import asyncio
+import sys
+from datetime import date
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.api.v1.endpoints import weekly_report
+from app.domain.report.core.canonical_models import CanonicalReport
+
+
+class _FakeSession:
+    """실패 후 롤백하지 않으면 이후 작업이 실패하는 세션 (SQLAlchemy PendingRollbackError 흉내)"""
+
+    def __init__(self):
+        self.needs_rollback = False
+        self.rollback_count = 0
+        self.saved = []
+
+    def rollback(self):
+        self.needs_rollback = False
+        self.rollback_count += 1
+
+
+def _report(owner: str) -> CanonicalReport:
+    """테스트용 주간 보고서"""
+    return CanonicalReport(
+        report_id=f"{owner}-id",
+        report_type="weekly",
+        owner=owner,
+        period_start=date(2025, 11, 3),
+        period_end=date(2025, 11, 7),
+    )
+
+
+def test_mid_batch_save_failure_rolls_back_and_continues():
+    """중간 작성자의 저장 실패 시 롤백되고 뒤 작성자는 정상 저장"""
+    owners = ["김보험", "이보험", "박보험"]
+    db = _FakeSession()
+
+    async def fake_generate_weekly_reports(db, owners, target_date):
+        return [_report(owner) for owner in owners]
+
+    def fake_save(db, report):
+        if db.needs_rollback:
+            raise RuntimeError("PendingRollbackError")
+        if report.owner == "이보험":
+            db.needs_rollback = True
+            raise RuntimeError("DB 저장 실패")
+        db.saved.append(report.owner)
+        return "생성"
+
+    original_generate = weekly_report.generate_weekly_reports
+    original_save = weekly_report._save_weekly_report
+    weekly_report.generate_weekly_reports = fake_generate_weekly_reports
+    weekly_report._save_weekly_report = fake_save
+    try:
+        request = weekly_report.WeeklyReportBatchGenerateRequest(owners=owners, target_date=date(2025, 11, 5))
+        response = asyncio.run(weekly_report.generate_weekly_batch(request, db))
+    finally:
+        weekly_report.generate_weekly_reports = original_generate
+        weekly_report._save_weekly_report = original_save
+
+    assert db.rollback_count == 1
+    assert db.saved == ["김보험", "박보험"]
+    assert response.total == 3
+    assert response.succeeded == 2
+    assert [item.success for item in response.results] == [True, False, True]
+
+
+def test_generation_failure_is_reported_per_owner():
+    """생성 단계 예외는 해당 작성자만 실패로 기록되고 저장은 시도하지 않음"""
+    owners = ["김보험", "이보험"]
+    db = _FakeSession()
+
+    async def fake_generate_weekly_reports(db, owners, target_date):
+        return [_report("김보험"), ValueError("일일보고서 없음")]
+
+    def fake_save(db, report):
+        db.saved.append(report.owner)
+        return "생성"
+
+    original_generate = weekly_report.generate_weekly_reports
+    original_save = weekly_report._save_weekly_report
+    weekly_report.generate_weekly_reports = fake_generate_weekly_reports
+    weekly_report._save_weekly_report = fake_save
+    try:
+        request = weekly_report.WeeklyReportBatchGenerateRequest(owners=owners, target_date=date(2025, 11, 5))
+        response = asyncio.run(weekly_report.generate_weekly_batch(request, db))
+    finally:
+        weekly_report.generate_weekly_reports = original_generate
+        weekly_report._save_weekly_report = original_save
+
+    assert db.rollback_count == 0
+    assert db.saved == ["김보험"]
+    assert [item.success for item in response.results] == [True, False]
+    assert "일일보고서 없음" in response.results[1].message
+
+
+if __name__ == "__main__":
+    test_mid_batch_save_failure_rolls_back_and_continues()
+    test_generation_failure_is_reported_per_owner()
+    print("모든 테스트 통과")
@@ -0,0 +1,90 @@
+"""
+주간보고서 캐시 테스트
+
+캐시 키가 청크 내용/설정 버전에 따라 바뀌는지, 캐시 적중 시 새 report_id가 부여되는지 확인
+"""
+import sys
+from datetime import date
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.domain.report.core.canonical_models import CanonicalReport
+from app.domain.report.search.retriever import UnifiedSearchResult
+from app.domain.report.weekly.chain import (
+    _REPORT_CACHE_VERSION,
+    _chunks_cache_key,
+    _disk_cache_key,
+    _get_cached_report,
+    _store_cached_report,
+)
+
+
+def _chunk(chunk_id: str, text: str) -> UnifiedSearchResult:
+    """테스트용 일일보고서 청크"""
+    return UnifiedSearchResult(
+        chunk_id=chunk_id,
+        doc_id=chunk_id.split("_")[0],
+        doc_type="daily",
+        chunk_type="summary",
+        text=text,
+        score=1.0,
+    )
+
+
+def test_chunks_cache_key_ignores_chunk_order():
+    """검색 결과 순서가 달라도 같은 키"""
+    chunks = [_chunk("2025-11-03_summary", "업무1"), _chunk("2025-11-04_summary", "업무2")]
+    assert _chunks_cache_key("김보험", "2025-W45", chunks) == _chunks_cache_key("김보험", "2025-W45", chunks[::-1])
+
+
+def test_chunks_cache_key_changes_with_text():
+    """청크 텍스트가 바뀌면(재적재) 다른 키"""
+    before = _chunks_cache_key("김보험", "2025-W45", [_chunk("2025-11-03_summary", "업무1")])
+    after = _chunks_cache_key("김보험", "2025-W45", [_chunk("2025-11-03_summary", "업무1 수정")])
+    assert before[:2] == after[:2]
+    assert before[2] != after[2]
+
+
+def test_chunks_cache_key_separates_id_and_text():
+    """ID/텍스트 경계가 달라지면 다른 키 (구분자로 이어붙임 충돌 방지)"""
+    a = _chunks_cache_key("김보험", "2025-W45", [_chunk("a", "bc")])
+    b = _chunks_cache_key("김보험", "2025-W45", [_chunk("ab", "c")])
+    assert a != b
+
+
+def test_disk_cache_key_includes_version():
+    """디스크 캐시 키에는 프롬프트/모델/스키마 버전이 포함됨"""
+    key = ("김보험", "2025-W45", "abcd")
+    assert _disk_cache_key(key) == f"weekly:{_REPORT_CACHE_VERSION}:김보험:2025-W45:abcd"
+
+
+def test_cache_hit_assigns_new_report_id():
+    """캐시 적중 시 내용은 같고 report_id만 새로 부여"""
+    report = CanonicalReport(
+        report_id="original-id",
+        report_type="weekly",
+        owner="김보험",
+        period_start=date(2025, 11, 3),
+        period_end=date(2025, 11, 7),
+    )
+    key = ("김보험", "2025-W45", "test-report-id")
+    _store_cached_report(key, report)
+
+    first = _get_cached_report(key)
+    second = _get_cached_report(key)
+    assert first is not None and second is not None
+    assert first.report_id != report.report_id
+    assert first.report_id != second.report_id
+    assert first.model_dump(exclude={"report_id"}) == report.model_dump(exclude={"report_id"})
+
+
+if __name__ == "__main__":
+    test_chunks_cache_key_ignores_chunk_order()
+    test_chunks_cache_key_changes_with_text()
+    test_chunks_cache_key_separates_id_and_text()
+    test_disk_cache_key_includes_version()
+    test_cache_hit_assigns_new_report_id()
+    print("모든 테스트 통과")
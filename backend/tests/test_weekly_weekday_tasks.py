@@ -0,0 +1,87 @@
+"""
+주간보고서 요일별 세부 업무 구성 테스트
+
+_extract_weekday_tasks가 detail 청크에서 시간/비고를 제거하고
+날짜별 대표 업무를 결정적으로 고르는지 확인
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.domain.report.search.retriever import UnifiedSearchResult
+from app.domain.report.weekly.chain import (
+    WEEKDAY_TASKS_PER_DAY,
+    _extract_weekday_tasks,
+    _select_representative_tasks,
+)
+
+
+def _chunk(date_str: str, chunk_type: str, body: str) -> UnifiedSearchResult:
+    """테스트용 일일보고서 청크"""
+    return UnifiedSearchResult(
+        chunk_id=f"{date_str}_{chunk_type}",
+        doc_id=date_str,
+        doc_type="daily",
+        chunk_type=chunk_type,
+        text=f"[일일_{chunk_type.upper()}] {date_str}\n{body}",
+        score=1.0,
+        metadata={"date": date_str},
+    )
+
+
+def test_strips_time_prefix_and_note_suffix():
+    """시간 접두어와 비고 접미어는 제거"""
+    chunks = [_chunk("2025-11-03", "detail", "[09:00-10:00] 고객 상담 (비고: 재방문 예정)")]
+    assert _extract_weekday_tasks(chunks) == {"2025-11-03": ["고객 상담"]}
+
+
+def test_ignores_non_detail_chunks():
+    """detail 이외의 청크와 날짜 없는 청크는 무시"""
+    chunks = [
+        _chunk("2025-11-03", "summary", "1. 고객 상담"),
+        _chunk("2025-11-03", "pending", "콜백 미완료"),
+    ]
+    assert _extract_weekday_tasks(chunks) == {}
+
+
+def test_limits_tasks_per_day_in_time_order():
+    """하루 업무는 WEEKDAY_TASKS_PER_DAY개까지, 시간 순서 유지"""
+    body = "\n".join([
+        "[09:00-10:00] 메일 확인",
+        "[10:00-11:00] 김철수 고객 보장 분석 자료 작성",
+        "[11:00-12:00] 팀 회의",
+        "[13:00-14:00] 이영희 고객 연말 절세 상담 진행",
+        "[14:00-15:00] 박민수 고객 진단비 점검 상담",
+    ])
+    tasks = _extract_weekday_tasks([_chunk("2025-11-04", "detail", body)])["2025-11-04"]
+    assert len(tasks) == WEEKDAY_TASKS_PER_DAY
+    assert tasks == [
+        "김철수 고객 보장 분석 자료 작성",
+        "이영희 고객 연말 절세 상담 진행",
+        "박민수 고객 진단비 점검 상담",
+    ]
+
+
+def test_repeated_tasks_are_deduplicated_and_preferred():
+    """여러 시간대에 반복된 업무는 한 번만 남고 우선 선택됨"""
+    tasks = ["회의", "보장 분석 자료 정리 및 검토", "메일 확인", "메일 확인", "고객 상담 연락"]
+    assert _select_representative_tasks(tasks, limit=2) == ["보장 분석 자료 정리 및 검토", "메일 확인"]
+
+
+def test_selection_is_deterministic():
+    """같은 입력이면 항상 같은 결과"""
+    tasks = ["가", "나", "다", "라"]
+    assert _select_representative_tasks(tasks) == _select_representative_tasks(list(tasks))
+    assert _select_representative_tasks(tasks) == ["가", "나", "다"]
+
+
+if __name__ == "__main__":
+    test_strips_time_prefix_and_note_suffix()
+    test_ignores_non_detail_chunks()
+    test_limits_tasks_per_day_in_time_order()
+    test_repeated_tasks_are_deduplicated_and_preferred()
+    test_selection_is_deterministic()
+    print("모든 테스트 통과")